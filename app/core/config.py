@@ -12,6 +12,8 @@ AUDIENCE = os.getenv("AUDIENCE", "enwis")
 
 ACCESS_TOKEN_MINUTES = int(os.getenv("ACCESS_TOKEN_MINUTES", 1440))
 REFRESH_TOKEN_DAYS = int(os.getenv("REFRESH_TOKEN_DAYS", 30))
+# threads hashing passwords in bulk (argon2 releases the GIL)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 4))
 INTERNAL_API_TOKEN = "rafkix1234"
 
 
@@ -32,3 +34,21 @@ ALLOWED_ORIGINS = os.getenv(
 # TELEGRAM
 # =====================
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
+
+# =====================
+# DICTIONARY
+# =====================
+# Compiled offline dataset (see app/modules/education/words/offline.py)
+DICTIONARY_INDEX_PATH = os.getenv("DICTIONARY_INDEX_PATH", "data/dictionary.idx")
+
+# =====================
+# ADMIN
+# =====================
+# /admin/stats/overview recomputes its stored metrics once they are older than this (seconds)
+ADMIN_METRICS_MAX_AGE = int(os.getenv("ADMIN_METRICS_MAX_AGE", 60))
+
+# =====================
+# STATS
+# =====================
+# "0" leaves leaderboard refreshes to `python -m app.modules.stats.leaderboard` / the admin trigger
+LEADERBOARD_REFRESHER = os.getenv("LEADERBOARD_REFRESHER", "1") == "1"
@@ -0,0 +1,47 @@
+"""
+Leases for periodic jobs.
+
+Every uvicorn worker runs the startup hooks, so a background loop started
+there runs once per worker. A job that should run once per interval across
+all of them claims a named row in `job_leases` first: the claim is a single
+conditional UPDATE, so exactly one worker wins until the lease expires (or
+its holder renews it).
+"""
+import os
+import socket
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, DateTime, String, or_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import Base
+
+# unique per worker process
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobLease(Base):
+    __tablename__ = "job_leases"
+
+    name = Column(String(100), primary_key=True)
+    holder = Column(String(255), nullable=True)
+    expires_at = Column(DateTime, nullable=False)
+
+
+async def acquire_lease(db: AsyncSession, name: str, ttl: float, holder: str = WORKER_ID) -> bool:
+    """Claims (or renews) `name` for `ttl` seconds; commits. False if another holder owns it."""
+    now = datetime.utcnow()
+    table = JobLease.__table__
+    await db.execute(
+        sqlite_insert(table)
+        .values(name=name, holder=None, expires_at=now)
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    res = await db.execute(
+        update(table)
+        .where(table.c.name == name, or_(table.c.expires_at <= now, table.c.holder == holder))
+        .values(holder=holder, expires_at=now + timedelta(seconds=ttl))
+    )
+    await db.commit()
+    return res.rowcount == 1
@@ -1,10 +1,12 @@
+import asyncio
 import jwt
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException
 from passlib.context import CryptContext
 from app.core.config import (
     SECRET_KEY, ALGORITHM, AUDIENCE,
-    ACCESS_TOKEN_MINUTES, REFRESH_TOKEN_DAYS
+    ACCESS_TOKEN_MINUTES, REFRESH_TOKEN_DAYS, PASSWORD_HASH_WORKERS
 )
 
 pwd_context = CryptContext(
@@ -22,6 +24,17 @@ def hash_password(password: str) -> str:
 def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
+
+_hash_pool = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="pwhash")
+
+
+async def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hashes in parallel off the event loop; order is preserved."""
+    loop = asyncio.get_running_loop()
+    return list(await asyncio.gather(
+        *(loop.run_in_executor(_hash_pool, hash_password, p) for p in passwords)
+    ))
+
 # =====================
 # JWT
 # =====================
@@ -0,0 +1,76 @@
+"""
+Shared cache versions.
+
+The in-process caches (app/core/cache.py) can't see writes made by other
+uvicorn workers. A writer bumps a named counter in `cache_versions` in the
+same transaction as its change; readers fetch the counter (a primary-key
+read) and key their cached values on it, so every worker stops serving the
+old value as soon as the write commits. `track_writes` does the bumping for
+any ORM write to a set of models, bulk statements included.
+"""
+from sqlalchemy import Column, Integer, String, event, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+
+
+class CacheVersion(Base):
+    __tablename__ = "cache_versions"
+
+    name = Column(String(100), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+def _bump(name: str):
+    # Core statement on the table: it doesn't go through the ORM event hooks
+    table = CacheVersion.__table__
+    return (
+        sqlite_insert(table)
+        .values(name=name, version=1)
+        .on_conflict_do_update(index_elements=["name"], set_={"version": table.c.version + 1})
+    )
+
+
+def bump_version_sync(connection, name: str):
+    """For Session event hooks, which run on the sync connection."""
+    connection.execute(_bump(name))
+
+
+async def bump_version(db: AsyncSession, name: str):
+    """Caller commits; the bump becomes visible together with the change."""
+    await db.execute(_bump(name))
+
+
+async def get_version(db: AsyncSession, name: str) -> int:
+    return await db.scalar(select(CacheVersion.version).where(CacheVersion.name == name)) or 0
+
+
+def track_writes(name: str, *models):
+    """Bumps `name` once per transaction that writes any of `models`."""
+
+    def bump_once(session: Session):
+        bumped = session.info.setdefault("bumped_versions", set())
+        if name not in bumped:
+            bumped.add(name)
+            bump_version_sync(session.connection(), name)
+
+    @event.listens_for(Session, "after_flush")
+    def _flushed(session, flush_context):
+        if any(isinstance(obj, models) for obj in (*session.new, *session.dirty, *session.deleted)):
+            bump_once(session)
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _bulk_write(state):
+        # bulk update()/delete() never show up in session.new/dirty/deleted
+        if (state.is_update or state.is_delete or state.is_insert) and any(
+            m.class_ in models for m in state.all_mappers
+        ):
+            bump_once(state.session)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _transaction_done(session):
+    session.info.pop("bumped_versions", None)
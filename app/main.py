@@ -5,7 +5,11 @@ from fastapi.responses import FileResponse, JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.sessions import SessionMiddleware
 from fastapi.staticfiles import StaticFiles
+from app.core.config import LEADERBOARD_REFRESHER
 from app.core.database import init_db
+from app.core.http import close_http_client
+from app.modules.stats.events import activity_writer
+from app.modules.stats.leaderboard import leaderboard_refresher
 from app.modules.auth.router import router as auth_router
 from app.modules.users.router import router as user_router
 from app.modules.admin.router import router as admin_router
@@ -82,9 +86,19 @@ app.include_router(listening_router, prefix="/v1/api")
 @app.on_event("startup")
 async def on_startup():
     await init_db()
+    activity_writer.start()
+    if LEADERBOARD_REFRESHER:
+        leaderboard_refresher.start()
     print("✅ Database initialized successfully.")
 
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    await leaderboard_refresher.stop()
+    await activity_writer.stop()
+    await close_http_client()
+
+
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     return JSONResponse(
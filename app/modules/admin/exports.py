@@ -0,0 +1,141 @@
+"""
+Column selections for the admin exports (see share/export.py).
+
+Each builder returns a plain-column SELECT ordered by primary key, so the
+export is a single index scan and never touches passwords, answer JSON or
+eager relationships.
+"""
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select
+
+from app.modules.education.tasks.models import UserTask
+from app.modules.payment.models import Payment
+from app.modules.services.exams.listening.models import ListeningResult
+from app.modules.services.exams.mock.models import MockExamAttempt, MockExamResult
+from app.modules.services.exams.reading.models import ReadingResult
+from app.modules.users.models import User
+
+
+def users_query(role: Optional[str] = None, is_active: Optional[bool] = None):
+    stmt = select(
+        User.id,
+        User.full_name,
+        User.username,
+        User.email,
+        User.phone,
+        User.role,
+        User.level,
+        User.auth_provider,
+        User.age,
+        User.is_active,
+        User.created_at,
+    )
+    if role is not None:
+        stmt = stmt.where(User.role == role)
+    if is_active is not None:
+        stmt = stmt.where(User.is_active == is_active)
+    return stmt.order_by(User.id)
+
+
+def payments_query(status: Optional[str] = None, user_id: Optional[int] = None):
+    stmt = select(
+        Payment.id,
+        Payment.user_id,
+        User.username,
+        Payment.product_type,
+        Payment.product_id,
+        Payment.amount,
+        Payment.currency,
+        Payment.status,
+        Payment.provider,
+        Payment.created_at,
+    ).join(User, User.id == Payment.user_id)
+    if status is not None:
+        stmt = stmt.where(Payment.status == status)
+    if user_id is not None:
+        stmt = stmt.where(Payment.user_id == user_id)
+    return stmt.order_by(Payment.id)
+
+
+def _results_select(source: str):
+    """(SELECT, model, exam column) for one exam result table."""
+    if source == "listening":
+        return select(
+            ListeningResult.id,
+            ListeningResult.user_id,
+            ListeningResult.exam_id,
+            ListeningResult.exam_attempt_id,
+            ListeningResult.raw_score,
+            ListeningResult.total_questions,
+            ListeningResult.correct_answers,
+            ListeningResult.percentage,
+            ListeningResult.standard_score,
+            ListeningResult.cefr_level,
+            ListeningResult.created_at,
+        ), ListeningResult, ListeningResult.exam_id
+    if source == "reading":
+        return select(
+            ReadingResult.id,
+            ReadingResult.user_id,
+            ReadingResult.test_id,
+            ReadingResult.exam_attempt_id,
+            ReadingResult.raw_score,
+            ReadingResult.percentage,
+            ReadingResult.standard_score,
+            ReadingResult.cefr_level,
+            ReadingResult.created_at,
+        ), ReadingResult, ReadingResult.test_id
+    return select(
+        MockExamResult.id,
+        MockExamResult.user_id,
+        MockExamAttempt.mock_exam_id,
+        MockExamResult.attempt_id,
+        MockExamResult.reading_ball,
+        MockExamResult.listening_ball,
+        MockExamResult.writing_ball,
+        MockExamResult.speaking_ball,
+        MockExamResult.overall_score,
+        MockExamResult.cefr_level,
+        MockExamResult.created_at,
+    ).join(MockExamAttempt, MockExamAttempt.id == MockExamResult.attempt_id), MockExamResult, MockExamAttempt.mock_exam_id
+
+
+def results_query(
+    source: str,
+    exam_id: Optional[str] = None,
+    user_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+):
+    stmt, model, exam_col = _results_select(source)
+    if exam_id is not None:
+        stmt = stmt.where(exam_col == exam_id)
+    if user_id is not None:
+        stmt = stmt.where(model.user_id == user_id)
+    if date_from is not None:
+        stmt = stmt.where(model.created_at >= datetime.combine(date_from, datetime.min.time()))
+    if date_to is not None:
+        stmt = stmt.where(model.created_at < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+    return stmt.order_by(model.id)
+
+
+def submissions_query(task_id: int):
+    return (
+        select(
+            UserTask.id,
+            UserTask.task_id,
+            UserTask.user_id,
+            User.full_name,
+            User.username,
+            UserTask.attempt_number,
+            UserTask.score,
+            UserTask.is_completed,
+            UserTask.submitted_at,
+            UserTask.feedback,
+        )
+        .join(User, User.id == UserTask.user_id)
+        .where(UserTask.task_id == task_id)
+        .order_by(UserTask.id)
+    )
@@ -0,0 +1,103 @@
+"""
+Admin overview metrics, materialized in admin_metrics.
+
+`get_overview` is a single read of that (tiny) table. When the stored
+snapshot is older than `max_age` seconds (ADMIN_METRICS_MAX_AGE by default)
+it is recomputed first, so however often the dashboard polls, the aggregate
+queries run at most once per staleness window. Concurrent requests that
+find it stale wait on one recompute instead of each running their own.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select, func, case, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import ADMIN_METRICS_MAX_AGE
+from app.modules.education.tasks.models import UserTask
+from app.modules.services.exams.listening.models import ListeningResult
+from app.modules.services.exams.mock.models import MockExamResult, MockPurchase
+from app.modules.services.exams.reading.models import ReadingResult
+from app.modules.users.models import User
+from .models import AdminMetric
+
+REGISTRATION_DAYS = 14
+
+_refresh_lock = asyncio.Lock()
+
+
+async def _users(db: AsyncSession) -> dict:
+    total, active = (await db.execute(
+        select(func.count(User.id), func.coalesce(func.sum(case((User.is_active.is_(True), 1), else_=0)), 0))
+    )).one()
+    with_tests = await db.scalar(select(func.count(func.distinct(UserTask.user_id))))
+    return {"total": total, "active": active, "with_tests": with_tests}
+
+
+async def _registrations(db: AsyncSession, today) -> list[dict]:
+    since = today - timedelta(days=REGISTRATION_DAYS - 1)
+    day = func.date(User.created_at)
+    counts = dict((await db.execute(
+        select(day, func.count(User.id))
+        .where(User.created_at >= datetime.combine(since, datetime.min.time()))
+        .group_by(day)
+    )).all())
+    return [
+        {"date": d.isoformat(), "count": counts.get(d.isoformat(), 0)}
+        for d in (since + timedelta(days=i) for i in range(REGISTRATION_DAYS))
+    ]
+
+
+async def _exams_today(db: AsyncSession, today) -> dict:
+    start = datetime.combine(today, datetime.min.time())
+    counts = {
+        name: await db.scalar(select(func.count(model.id)).where(model.created_at >= start))
+        for name, model in (("listening", ListeningResult), ("reading", ReadingResult), ("mock", MockExamResult))
+    }
+    return {**counts, "total": sum(counts.values())}
+
+
+async def refresh_metrics(db: AsyncSession) -> dict[str, dict]:
+    """Recomputes every block and replaces the stored rows."""
+    now = datetime.utcnow()
+    today = now.date()
+    metrics = {
+        "users": await _users(db),
+        "tests": {"total_attempts": await db.scalar(select(func.count(UserTask.id)))},
+        "registrations": await _registrations(db, today),
+        "exams_today": await _exams_today(db, today),
+        "mock_purchases": {
+            "pending": await db.scalar(select(func.count(MockPurchase.id)).where(MockPurchase.is_active.is_(False))),
+        },
+    }
+    await db.execute(delete(AdminMetric))
+    await db.execute(insert(AdminMetric), [
+        {"name": name, "value": value, "computed_at": now} for name, value in metrics.items()
+    ])
+    await db.commit()
+    return {**metrics, "computed_at": now}
+
+
+async def _stored(db: AsyncSession, max_age: int) -> Optional[dict]:
+    """The stored snapshot, or None when it is missing or older than `max_age`."""
+    rows = (await db.execute(select(AdminMetric.name, AdminMetric.value, AdminMetric.computed_at))).all()
+
+    computed_at = min((r.computed_at for r in rows), default=None)
+    if computed_at is None or datetime.utcnow() - computed_at > timedelta(seconds=max_age):
+        return None
+    return {**{r.name: r.value for r in rows}, "computed_at": computed_at}
+
+
+async def get_overview(db: AsyncSession, max_age: Optional[int] = None) -> dict:
+    max_age = ADMIN_METRICS_MAX_AGE if max_age is None else max_age
+    overview = await _stored(db, max_age)
+    if overview is not None:
+        return overview
+
+    async with _refresh_lock:
+        # whoever held the lock may have just refreshed it (or another worker did)
+        overview = await _stored(db, max_age)
+        if overview is None:
+            overview = await refresh_metrics(db)
+    return overview
@@ -0,0 +1,14 @@
+from datetime import datetime
+
+from sqlalchemy import Column, String, JSON, DateTime
+
+from app.core.database import Base
+
+
+class AdminMetric(Base):
+    """One precomputed block of the admin overview (see admin/metrics.py)."""
+    __tablename__ = "admin_metrics"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(JSON, nullable=False)
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
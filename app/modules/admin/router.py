@@ -1,5 +1,9 @@
+from datetime import date
+from typing import Literal
+
 from sqlalchemy import func, select
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -9,9 +13,33 @@ from app.modules.auth.permissions import require_admin, require_roles
 from app.modules.users.models import User
 from app.modules.users.schemas import UserResponse
 from app.modules.admin.service import AdminUserService
+from app.modules.admin.schemas import (
+    BulkPasswordReset,
+    BulkRoleChange,
+    BulkUserResult,
+    UserSelection,
+)
+from app.modules.admin.metrics import get_overview
+from app.modules.admin.exports import (
+    users_query,
+    payments_query,
+    results_query,
+    submissions_query,
+)
+from share.export import ExportFormat, export_response
+from share.pagination import Page, PageParams, Paginator, page_params
 
 from app.modules.education.tasks.models import Task, UserTask
-from app.modules.education.tasks.schemas import UserTaskOut
+from app.modules.education.tasks.schemas import UserTaskOut, GradebookOut
+from app.modules.education.tasks.gradebook import (
+    get_gradebook,
+    stream_gradebook_csv,
+)
+from app.modules.education.course.models import Course
+from app.modules.education.course.progress import reconcile_progress
+from app.modules.stats.analytics import exam_analytics
+from app.modules.stats.leaderboard import refresh_leaderboards
+from app.modules.stats.schemas import ExamAnalytics
 
 from app.modules.payment.repository import (
     PaymentRepository,
@@ -32,12 +60,31 @@ router = APIRouter(
 # ======================================================
 # USERS
 # ======================================================
-@router.get("/users", response_model=list[UserResponse])
+USERS_PAGE = Paginator(
+    User.id,
+    sort={"created_at": User.created_at, "username": User.username},
+    filters={"role": User.role, "is_active": User.is_active},
+)
+
+
+@router.get("/users", response_model=Page[UserResponse])
 async def list_users(
+    role: str | None = None,
+    is_active: bool | None = None,
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
 ):
-    res = await db.execute(select(User))
-    return res.scalars().all()
+    return await USERS_PAGE.page(db, select(User), page, role=role, is_active=is_active)
+
+
+@router.get("/users/export")
+async def export_users(
+    role: str | None = None,
+    is_active: bool | None = None,
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+):
+    """Barcha foydalanuvchilar NDJSON yoki CSV ko'rinishida (oqim bilan)"""
+    return export_response(users_query(role, is_active), fmt, "users")
 
 
 @router.get("/users/{user_id}", response_model=UserResponse)
@@ -54,6 +101,46 @@ async def get_user(
 # ======================================================
 # ADMIN USER MANAGEMENT (ONLY ADMIN)
 # ======================================================
+# bulk routes come first so "bulk" is not read as a {user_id}
+@router.put("/users/bulk/block", response_model=BulkUserResult)
+async def bulk_block_users(
+    data: UserSelection,
+    db: AsyncSession = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    """Bir nechta foydalanuvchini bitta UPDATE bilan bloklash (o'zingiz va adminlar o'tkazib yuboriladi)"""
+    return await AdminUserService(db, admin).bulk_block(data)
+
+
+@router.put("/users/bulk/unblock", response_model=BulkUserResult)
+async def bulk_unblock_users(
+    data: UserSelection,
+    db: AsyncSession = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    return await AdminUserService(db, admin).bulk_unblock(data)
+
+
+@router.put("/users/bulk/role", response_model=BulkUserResult)
+async def bulk_change_role(
+    data: BulkRoleChange,
+    db: AsyncSession = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    """Bir nechta foydalanuvchi rolini o'zgartirish (o'zingiz o'tkazib yuborilasiz)"""
+    return await AdminUserService(db, admin).bulk_change_role(data, data.new_role)
+
+
+@router.put("/users/bulk/reset-password", response_model=BulkUserResult)
+async def bulk_reset_password(
+    data: BulkPasswordReset,
+    db: AsyncSession = Depends(get_db),
+    admin: User = Depends(require_admin),
+):
+    """Parollar parallel hash qilinadi va bitta UPDATE bilan yoziladi"""
+    return await AdminUserService(db, admin).bulk_reset_password(data)
+
+
 @router.put("/users/{user_id}/reset-password")
 async def reset_password(
     user_id: int,
@@ -136,9 +223,91 @@ async def delete_user(
     return {"message": "User deleted"}
 
 
+# ======================================================
+# COURSE PROGRESS
+# ======================================================
+@router.post("/progress/reconcile")
+async def reconcile_course_progress(
+    user_id: int | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Progress hisoblagichlarini user_lessons / user_tasks dan qayta qurish"""
+    return {"rows": await reconcile_progress(db, user_id)}
+
+
+@router.post("/leaderboards/refresh")
+async def rebuild_leaderboards(db: AsyncSession = Depends(get_db)):
+    """Reytinglarni navbatdagi rejalashtirilgan yangilanishni kutmasdan qayta hisoblash"""
+    return {"rows": await refresh_leaderboards(db)}
+
+
+# ======================================================
+# ANALYTICS
+# ======================================================
+@router.get("/analytics/exams/{source}", response_model=ExamAnalytics)
+async def exam_results_analytics(
+    source: Literal["listening", "reading", "mock"],
+    exam_id: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    bins: int = Query(15, ge=1, le=75),
+    window: int = Query(4, ge=1, le=52),
+    db: AsyncSession = Depends(get_db),
+):
+    """Ballar taqsimoti, CEFR darajalari va haftalik trend (5 daqiqa keshlanadi)"""
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from must be before date_to")
+    return await exam_analytics(db, source, exam_id, date_from, date_to, bins, window)
+
+
+@router.get("/results/{source}/export")
+async def export_exam_results(
+    source: Literal["listening", "reading", "mock"],
+    exam_id: str | None = None,
+    user_id: int | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+):
+    """Imtihon natijalari NDJSON yoki CSV ko'rinishida (oqim bilan)"""
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from must be before date_to")
+    return export_response(
+        results_query(source, exam_id, user_id, date_from, date_to),
+        fmt,
+        f"{source}_results",
+    )
+
+
 # ======================================================
 # TASKS
 # ======================================================
+@router.get("/courses/{course_id}/gradebook", response_model=GradebookOut)
+async def course_gradebook(
+    course_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    if not await db.scalar(select(Course.id).where(Course.id == course_id)):
+        raise HTTPException(404, "Course not found")
+    return await get_gradebook(db, course_id)
+
+
+@router.get("/courses/{course_id}/gradebook/export")
+async def export_course_gradebook(
+    course_id: int,
+    db: AsyncSession = Depends(get_db),
+):
+    if not await db.scalar(select(Course.id).where(Course.id == course_id)):
+        raise HTTPException(404, "Course not found")
+
+    gradebook = await get_gradebook(db, course_id)
+    return StreamingResponse(
+        stream_gradebook_csv(gradebook),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="gradebook_course_{course_id}.csv"'},
+    )
+
+
 @router.get("/tasks/{task_id}/submissions", response_model=list[UserTaskOut])
 async def task_submissions(
     task_id: int,
@@ -150,6 +319,17 @@ async def task_submissions(
     return res.scalars().all()
 
 
+@router.get("/tasks/{task_id}/submissions/export")
+async def export_task_submissions(
+    task_id: int,
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+    db: AsyncSession = Depends(get_db),
+):
+    if not await db.scalar(select(Task.id).where(Task.id == task_id)):
+        raise HTTPException(404, "Task not found")
+    return export_response(submissions_query(task_id), fmt, f"task_{task_id}_submissions")
+
+
 @router.delete("/tasks/user-task/{user_task_id}", status_code=204)
 async def delete_user_task(
     user_task_id: int,
@@ -179,11 +359,24 @@ async def delete_task(
 # ======================================================
 # PAYMENTS
 # ======================================================
-@router.get("/payments", response_model=list[PaymentResponse])
+@router.get("/payments", response_model=Page[PaymentResponse])
 async def all_payments(
+    payment_status: str | None = Query(None, alias="status"),
+    user_id: int | None = None,
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
 ):
-    return await PaymentRepository(db).get_all()  # type: ignore
+    return await PaymentRepository(db).get_page(page, status=payment_status, user_id=user_id)
+
+
+@router.get("/payments/export")
+async def export_payments(
+    payment_status: str | None = Query(None, alias="status"),
+    user_id: int | None = None,
+    fmt: ExportFormat = Query("ndjson", alias="format"),
+):
+    """To'lovlar NDJSON yoki CSV ko'rinishida (oqim bilan)"""
+    return export_response(payments_query(payment_status, user_id), fmt, "payments")
 
 
 @router.patch("/payments/{payment_id}", response_model=PaymentResponse)
@@ -232,23 +425,8 @@ async def cancel_subscription(
 
 
 @router.get("/stats/overview")
-async def admin_stats(db: AsyncSession = Depends(get_db)):
-    total_users = await db.scalar(select(func.count(User.id)))
-    active_users = await db.scalar(
-        select(func.count(User.id)).where(User.is_active == True)
-    )
-    total_tests = await db.scalar(select(func.count(UserTask.id)))
-    users_with_tests = await db.scalar(
-        select(func.count(func.distinct(UserTask.user_id)))
-    )
-
-    return {
-        "users": {
-            "total": total_users,
-            "active": active_users,
-            "with_tests": users_with_tests,
-        },
-        "tests": {
-            "total_attempts": total_tests,
-        }
-    }
+async def admin_stats(
+    max_age: int | None = Query(None, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    return await get_overview(db, max_age)
@@ -0,0 +1,36 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+MAX_BULK_USERS = 5000
+MAX_BULK_PASSWORDS = 500
+
+
+class UserFilter(BaseModel):
+    role: Optional[str] = None
+    is_active: Optional[bool] = None
+
+
+class UserSelection(BaseModel):
+    """Explicit ids, a filter, or both (ids narrowed by the filter)."""
+    user_ids: Optional[List[int]] = Field(None, min_length=1, max_length=MAX_BULK_USERS)
+    filter: Optional[UserFilter] = None
+
+
+class BulkRoleChange(UserSelection):
+    new_role: str
+
+
+class PasswordResetItem(BaseModel):
+    user_id: int
+    new_password: str = Field(..., min_length=6)
+
+
+class BulkPasswordReset(BaseModel):
+    items: List[PasswordResetItem] = Field(..., min_length=1, max_length=MAX_BULK_PASSWORDS)
+
+
+class BulkUserResult(BaseModel):
+    updated: int
+    skipped: List[int] = []     # matched, but not allowed (yourself, admins)
+    not_found: List[int] = []   # requested ids with no such user
@@ -1,11 +1,16 @@
 from fastapi import HTTPException, status
+from sqlalchemy import select, update, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password
+from app.core.security import hash_password, hash_passwords
 from app.modules.users.models import User
+from .schemas import BulkPasswordReset, UserSelection
 
 ALLOWED_ROLES = {"student", "teacher", "mentor", "admin"}
 
+# ids per UPDATE ... WHERE id IN (...), well under SQLite's parameter limit
+_BULK_CHUNK = 1000
+
 
 class AdminUserService:
     def __init__(self, db: AsyncSession, current_admin: User):
@@ -105,3 +110,100 @@ class AdminUserService:
 
         await self.db.delete(target_user)
         await self.db.commit()
+
+    # ==================================================
+    # BULK (one SELECT of ids, then UPDATE ... WHERE id IN)
+    # ==================================================
+    async def _targets(self, selection: UserSelection) -> tuple[list, list[int]]:
+        """(id, role) rows matching the selection, and requested ids that don't exist."""
+        flt = selection.filter
+        has_filter = flt is not None and (flt.role is not None or flt.is_active is not None)
+        if selection.user_ids is None and not has_filter:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="user_ids yoki filter berilishi kerak"
+            )
+
+        stmt = select(User.id, User.role)
+        if selection.user_ids is not None:
+            stmt = stmt.where(User.id.in_(set(selection.user_ids)))
+        if flt is not None and flt.role is not None:
+            stmt = stmt.where(User.role == flt.role)
+        if flt is not None and flt.is_active is not None:
+            stmt = stmt.where(User.is_active == flt.is_active)
+
+        rows = (await self.db.execute(stmt.order_by(User.id))).all()
+        not_found = []
+        if selection.user_ids is not None and not has_filter:
+            not_found = sorted(set(selection.user_ids) - {r.id for r in rows})
+        return rows, not_found
+
+    async def _update_ids(self, ids: list[int], values, *guards) -> int:
+        """
+        Applies `values` (a dict, or chunk -> dict) to `ids` in one
+        transaction; `guards` are re-checked in the WHERE.
+        """
+        updated = 0
+        for i in range(0, len(ids), _BULK_CHUNK):
+            chunk = ids[i:i + _BULK_CHUNK]
+            res = await self.db.execute(
+                update(User)
+                .where(User.id.in_(chunk), *guards)
+                .values(**(values(chunk) if callable(values) else values))
+                .execution_options(synchronize_session=False)
+            )
+            updated += res.rowcount or 0
+        await self.db.commit()
+        return updated
+
+    async def bulk_block(self, selection: UserSelection) -> dict:
+        rows, not_found = await self._targets(selection)
+        # same rules as block_user: never yourself, never an admin
+        allowed = [r.id for r in rows if r.id != self.current_admin.id and r.role != "admin"]
+        skipped = [r.id for r in rows if r.id == self.current_admin.id or r.role == "admin"]
+
+        updated = await self._update_ids(
+            allowed,
+            {"is_active": False},
+            User.id != self.current_admin.id,
+            User.role != "admin",
+        )
+        return {"updated": updated, "skipped": skipped, "not_found": not_found}
+
+    async def bulk_unblock(self, selection: UserSelection) -> dict:
+        rows, not_found = await self._targets(selection)
+        updated = await self._update_ids([r.id for r in rows], {"is_active": True})
+        return {"updated": updated, "skipped": [], "not_found": not_found}
+
+    async def bulk_change_role(self, selection: UserSelection, role: str) -> dict:
+        if role not in ALLOWED_ROLES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Noto‘g‘ri role"
+            )
+
+        rows, not_found = await self._targets(selection)
+        # admin o‘z rolini o‘zgartira olmaydi
+        allowed = [r.id for r in rows if r.id != self.current_admin.id]
+        skipped = [r.id for r in rows if r.id == self.current_admin.id]
+
+        updated = await self._update_ids(allowed, {"role": role}, User.id != self.current_admin.id)
+        return {"updated": updated, "skipped": skipped, "not_found": not_found}
+
+    async def bulk_reset_password(self, data: BulkPasswordReset) -> dict:
+        passwords = {item.user_id: item.new_password for item in data.items}
+        if len(passwords) != len(data.items):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Har bir foydalanuvchi faqat bir marta berilishi kerak"
+            )
+
+        rows, not_found = await self._targets(UserSelection(user_ids=list(passwords)))
+        ids = [r.id for r in rows]
+        hashes = dict(zip(ids, await hash_passwords([passwords[i] for i in ids])))
+
+        updated = await self._update_ids(
+            ids,
+            lambda chunk: {"password": case({i: hashes[i] for i in chunk}, value=User.id)},
+        )
+        return {"updated": updated, "skipped": [], "not_found": not_found}
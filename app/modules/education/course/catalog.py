@@ -0,0 +1,115 @@
+from typing import Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import MISSING, TTLCache
+from app.core.versions import get_version, track_writes
+from app.modules.education.lesson.models import Lesson
+from app.modules.education.tasks.models import Task
+from .models import Course, CourseCategory, UserCourse
+
+MAX_DEPTH = 2
+CATALOG_VERSION = "catalog"
+
+# (depth, catalog version) -> rendered tree. Every write to a category,
+# course, lesson or task (bulk updates included) bumps the shared version in
+# its own transaction, so all workers miss after it commits; the TTL only
+# bounds staleness of the enrollment counts.
+_tree_cache = TTLCache(maxsize=2 * (MAX_DEPTH + 1), ttl=5 * 60)
+
+track_writes(CATALOG_VERSION, CourseCategory, Course, Lesson, Task)
+
+
+async def _counts(db: AsyncSession, column, key) -> dict[int, int]:
+    res = await db.execute(select(key, func.count(column)).group_by(key))
+    return dict(res.all()) # type: ignore
+
+
+async def get_catalog_tree(db: AsyncSession, depth: int = 0) -> list[dict]:
+    """
+    depth 0: categories with course/lesson/enrollment counts
+    depth 1: + courses with lesson/enrollment counts
+    depth 2: + lessons with task counts
+    Courses without a category are grouped under a node with id None.
+    """
+    version = await get_version(db, CATALOG_VERSION)
+    cached = _tree_cache.get((depth, version))
+    if cached is not MISSING:
+        return cached
+
+    lessons_per_course = await _counts(db, Lesson.id, Lesson.course_id)
+    enrollments_per_course = await _counts(db, UserCourse.id, UserCourse.course_id)
+
+    courses = (await db.execute(
+        select(Course.id, Course.title, Course.level, Course.category_id)
+        .order_by(Course.id)
+    )).all()
+
+    categories = {
+        row.id: {
+            "id": row.id,
+            "name": row.name,
+            "description": row.description,
+            "course_count": 0,
+            "lesson_count": 0,
+            "enrollment_count": 0,
+            **({"courses": []} if depth >= 1 else {}),
+        }
+        for row in await db.execute(
+            select(CourseCategory.id, CourseCategory.name, CourseCategory.description)
+            .order_by(CourseCategory.name)
+        )
+    }
+
+    course_nodes: dict[int, dict] = {}
+    for course in courses:
+        node = categories.get(course.category_id)
+        if node is None:
+            node = categories.setdefault(None, { # type: ignore
+                "id": None,
+                "name": "Uncategorized",
+                "description": None,
+                "course_count": 0,
+                "lesson_count": 0,
+                "enrollment_count": 0,
+                **({"courses": []} if depth >= 1 else {}),
+            })
+
+        lesson_count = lessons_per_course.get(course.id, 0)
+        enrollment_count = enrollments_per_course.get(course.id, 0)
+        node["course_count"] += 1
+        node["lesson_count"] += lesson_count
+        node["enrollment_count"] += enrollment_count
+
+        if depth >= 1:
+            course_nodes[course.id] = {
+                "id": course.id,
+                "title": course.title,
+                "level": course.level,
+                "lesson_count": lesson_count,
+                "enrollment_count": enrollment_count,
+                **({"lessons": []} if depth >= 2 else {}),
+            }
+            node["courses"].append(course_nodes[course.id])
+
+    if depth >= 2:
+        tasks_per_lesson = await _counts(db, Task.id, Task.lesson_id)
+        lessons = await db.execute(
+            select(Lesson.id, Lesson.course_id, Lesson.title, Lesson.order, Lesson.is_free)
+            .order_by(Lesson.course_id, Lesson.order, Lesson.id)
+        )
+        for lesson in lessons:
+            course_node: Optional[dict] = course_nodes.get(lesson.course_id)
+            if course_node is not None:
+                course_node["lessons"].append({
+                    "id": lesson.id,
+                    "title": lesson.title,
+                    "order": lesson.order,
+                    "is_free": bool(lesson.is_free),
+                    "task_count": tasks_per_lesson.get(lesson.id, 0),
+                })
+
+    tree = list(categories.values())
+    _tree_cache.set((depth, version), tree)
+    return tree
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import noload
 
 from app.core.database import get_db
 
 from .models import CourseCategory
-from .schema import CourseCategoryCreate, CourseCategoryResponse
+from .schema import CourseCategoryCreate, CourseCategoryResponse, CatalogCategory
+from .catalog import MAX_DEPTH, get_catalog_tree
 from app.modules.users.models import User
 from app.modules.auth.dependencies import get_current_user
 
@@ -14,13 +16,25 @@ router = APIRouter(prefix="/categories", tags=["Course Categories"])
 
 @router.get("/all", response_model=list[CourseCategoryResponse])
 async def get_categories(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(CourseCategory))
+    result = await db.execute(select(CourseCategory).options(noload(CourseCategory.courses)))
     categories = result.scalars().all()
     return categories
 
+@router.get("/tree", response_model=list[CatalogCategory], response_model_exclude_unset=True)
+async def get_catalog(
+    depth: int = Query(0, ge=0, le=MAX_DEPTH),
+    db: AsyncSession = Depends(get_db),
+):
+    """Katalog daraxti: 0 - kategoriyalar, 1 - + kurslar, 2 - + darslar (faqat sonlar bilan)"""
+    return await get_catalog_tree(db, depth)
+
 @router.get("/select/{category_id}", response_model=CourseCategoryResponse)
 async def get_category(category_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(CourseCategory).where(CourseCategory.id == category_id))
+    result = await db.execute(
+        select(CourseCategory)
+        .options(noload(CourseCategory.courses))
+        .where(CourseCategory.id == category_id)
+    )
     category = result.scalars().first()
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
@@ -92,3 +92,20 @@ class UserCourse(Base):
 
     user = relationship("User", back_populates="user_courses")
     course = relationship("Course", back_populates="user_courses")
+
+
+# denormalized counters, updated by course/progress.py and rebuilt by its reconcile job
+class UserCourseProgress(Base):
+    __tablename__ = "user_course_progress"
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "course_id", name="uq_user_course_progress"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    course_id = Column(Integer, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False)
+
+    completed_lessons = Column(Integer, default=0, nullable=False)
+    completed_tasks = Column(Integer, default=0, nullable=False)
+    last_activity_at = Column(DateTime, nullable=True)
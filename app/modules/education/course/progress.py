@@ -0,0 +1,165 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select, func, delete, insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.education.lesson.models import Lesson, UserLesson
+from app.modules.education.tasks.models import Task, UserTask
+from .models import UserCourseProgress
+
+
+# =========================
+# COUNTERS
+# =========================
+async def _bump(db: AsyncSession, user_id: int, course_id: int, at: datetime, lessons: int = 0, tasks: int = 0):
+    """Upserts the (user, course) row in the caller's transaction."""
+    stmt = sqlite_insert(UserCourseProgress).values(
+        user_id=user_id,
+        course_id=course_id,
+        completed_lessons=lessons,
+        completed_tasks=tasks,
+        last_activity_at=at,
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["user_id", "course_id"],
+            set_={
+                "completed_lessons": UserCourseProgress.completed_lessons + lessons,
+                "completed_tasks": UserCourseProgress.completed_tasks + tasks,
+                "last_activity_at": at,
+            },
+        )
+    )
+
+
+async def record_lesson_completed(db: AsyncSession, user_id: int, lesson: Lesson) -> bool:
+    """Marks the lesson done; the counter only moves the first time. Caller commits."""
+    now = datetime.utcnow()
+    res = await db.execute(
+        sqlite_insert(UserLesson)
+        .values(user_id=user_id, lesson_id=lesson.id, completed_at=now)
+        .on_conflict_do_nothing(index_elements=["user_id", "lesson_id"])
+    )
+    first_time = res.rowcount == 1
+    if lesson.course_id is not None:
+        await _bump(db, user_id, lesson.course_id, now, lessons=int(first_time)) # type: ignore
+    return first_time
+
+
+async def record_task_submitted(
+    db: AsyncSession,
+    user_id: int,
+    course_id: Optional[int],
+    submitted_at: datetime,
+    first_attempt: bool,
+):
+    """A task counts as completed on its first submission; retries only touch last activity. Caller commits."""
+    if course_id is not None:
+        await _bump(db, user_id, course_id, submitted_at, tasks=int(first_attempt))
+
+
+# =========================
+# READ
+# =========================
+def _progress_query():
+    total_lessons = (
+        select(func.count(Lesson.id))
+        .where(Lesson.course_id == UserCourseProgress.course_id)
+        .correlate(UserCourseProgress)
+        .scalar_subquery()
+    )
+    total_tasks = (
+        select(func.count(Task.id))
+        .join(Lesson, Lesson.id == Task.lesson_id)
+        .where(Lesson.course_id == UserCourseProgress.course_id)
+        .correlate(UserCourseProgress)
+        .scalar_subquery()
+    )
+    return select(
+        UserCourseProgress.course_id,
+        UserCourseProgress.completed_lessons,
+        total_lessons.label("total_lessons"),
+        UserCourseProgress.completed_tasks,
+        total_tasks.label("total_tasks"),
+        UserCourseProgress.last_activity_at,
+    )
+
+
+async def get_progress(db: AsyncSession, user_id: int, course_id: Optional[int] = None) -> list[dict]:
+    stmt = _progress_query().where(UserCourseProgress.user_id == user_id)
+    if course_id is not None:
+        stmt = stmt.where(UserCourseProgress.course_id == course_id)
+    res = await db.execute(stmt.order_by(UserCourseProgress.last_activity_at.desc()))
+    return [dict(row._mapping) for row in res]
+
+
+# =========================
+# RECONCILE
+# =========================
+async def reconcile_progress(db: AsyncSession, user_id: Optional[int] = None) -> int:
+    """Rebuilds the counters from user_lessons/user_tasks (all users or one); returns rows written."""
+    rows: dict[tuple[int, int], dict] = {}
+
+    def row(uid: int, cid: int) -> dict:
+        return rows.setdefault((uid, cid), {
+            "user_id": uid,
+            "course_id": cid,
+            "completed_lessons": 0,
+            "completed_tasks": 0,
+            "last_activity_at": None,
+        })
+
+    lessons = (
+        select(UserLesson.user_id, Lesson.course_id, func.count(UserLesson.id), func.max(UserLesson.completed_at))
+        .join(Lesson, Lesson.id == UserLesson.lesson_id)
+        .where(UserLesson.completed_at.is_not(None), Lesson.course_id.is_not(None))
+        .group_by(UserLesson.user_id, Lesson.course_id)
+    )
+    tasks = (
+        select(UserTask.user_id, Lesson.course_id, func.count(func.distinct(UserTask.task_id)), func.max(UserTask.submitted_at))
+        .join(Task, Task.id == UserTask.task_id)
+        .join(Lesson, Lesson.id == Task.lesson_id)
+        .where(Lesson.course_id.is_not(None))
+        .group_by(UserTask.user_id, Lesson.course_id)
+    )
+    if user_id is not None:
+        lessons = lessons.where(UserLesson.user_id == user_id)
+        tasks = tasks.where(UserTask.user_id == user_id)
+
+    for uid, cid, count, last in await db.execute(lessons):
+        r = row(uid, cid)
+        r["completed_lessons"], r["last_activity_at"] = count, last
+    for uid, cid, count, last in await db.execute(tasks):
+        r = row(uid, cid)
+        r["completed_tasks"] = count
+        if last and (r["last_activity_at"] is None or last > r["last_activity_at"]):
+            r["last_activity_at"] = last
+
+    wipe = delete(UserCourseProgress)
+    if user_id is not None:
+        wipe = wipe.where(UserCourseProgress.user_id == user_id)
+    await db.execute(wipe)
+    if rows:
+        await db.execute(insert(UserCourseProgress), list(rows.values()))
+    await db.commit()
+    return len(rows)
+
+
+if __name__ == "__main__":
+    # python -m app.modules.education.course.progress [user_id]
+    import asyncio
+    import sys
+
+    import app.main  # noqa: F401  (registers every model with the mapper)
+    from app.core.database import AsyncSessionLocal, engine, init_db
+
+    async def main():
+        await init_db()
+        async with AsyncSessionLocal() as db: # type: ignore
+            total = await reconcile_progress(db, int(sys.argv[1]) if len(sys.argv) > 1 else None)
+        await engine.dispose()
+        print(f"✅ Reconciled {total} progress rows")
+
+    asyncio.run(main())
@@ -4,18 +4,50 @@ from sqlalchemy.future import select
 from app.core.database import get_db
 from app.modules.users.models import User
 from app.modules.auth.dependencies import get_current_user
+from share.pagination import Page, PageParams, Paginator, page_params
 
 from .models import Course, CourseCategory
-from .schema import CourseCreate, CourseResponse
+from .schema import CourseCreate, CourseResponse, CourseProgressResponse
+from .progress import get_progress
 
 router = APIRouter(prefix="/courses", tags=["Courses"])
 
 
-@router.get("/all", response_model=list[CourseResponse])
-async def get_courses(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Course))
-    courses = result.scalars().all()
-    return courses
+COURSES_PAGE = Paginator(
+    Course.id,
+    sort={"created_at": Course.created_at, "title": Course.title},
+    default="id",
+    filters={"category_id": Course.category_id, "level": Course.level},
+)
+
+
+@router.get("/all", response_model=Page[CourseResponse])
+async def get_courses(
+    category_id: int | None = None,
+    level: str | None = None,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_db),
+):
+    return await COURSES_PAGE.page(db, select(Course), page, category_id=category_id, level=level)
+
+@router.get("/progress", response_model=list[CourseProgressResponse])
+async def my_progress(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Foydalanuvchining barcha kurslar bo'yicha progressi (oxirgi faollik bo'yicha)"""
+    return await get_progress(db, current_user.id) # type: ignore
+
+@router.get("/progress/{course_id}", response_model=CourseProgressResponse)
+async def my_course_progress(
+    course_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    rows = await get_progress(db, current_user.id, course_id) # type: ignore
+    if not rows:
+        raise HTTPException(status_code=404, detail="No progress for this course")
+    return rows[0]
 
 @router.get("/select/{course_id}", response_model=CourseResponse)
 async def get_course(course_id: int, db: AsyncSession = Depends(get_db)):
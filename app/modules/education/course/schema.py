@@ -46,4 +46,40 @@ class CourseCategoryResponse(CourseCategoryBase):
     id: int
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class CatalogLesson(BaseModel):
+    id: int
+    title: str
+    order: Optional[int] = None
+    is_free: bool
+    task_count: int
+
+
+class CatalogCourse(BaseModel):
+    id: int
+    title: str
+    level: Optional[str] = None
+    lesson_count: int
+    enrollment_count: int
+    lessons: Optional[List[CatalogLesson]] = None
+
+
+class CatalogCategory(BaseModel):
+    id: Optional[int] = None
+    name: str
+    description: Optional[str] = None
+    course_count: int
+    lesson_count: int
+    enrollment_count: int
+    courses: Optional[List[CatalogCourse]] = None
+
+
+class CourseProgressResponse(BaseModel):
+    course_id: int
+    completed_lessons: int
+    total_lessons: int
+    completed_tasks: int
+    total_tasks: int
+    last_activity_at: Optional[datetime] = None
@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+from sqlalchemy.orm import validates
 from datetime import datetime
 from app.core.database import Base
+from .normalize import normalize_en, normalize_uz
 
 
 class DailyVocabWords(Base):
@@ -11,4 +13,22 @@ class DailyVocabWords(Base):
     uz_translation = Column(Text, nullable=False)
     level = Column(String(10), nullable=False)
 
+    # search keys, filled on write by the validators below
+    word_norm = Column(String(100), nullable=True, index=True)
+    uz_norm = Column(String(255), nullable=True, index=True)
+
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_daily_vocab_created_at", "created_at", "id"),
+    )
+
+    @validates("word")
+    def _set_word_norm(self, key, value):
+        self.word_norm = normalize_en(value)
+        return value
+
+    @validates("uz_translation")
+    def _set_uz_norm(self, key, value):
+        self.uz_norm = normalize_uz(value)[:255]
+        return value
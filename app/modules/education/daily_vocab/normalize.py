@@ -0,0 +1,56 @@
+"""
+Search keys for daily vocabulary.
+
+Both keys are computed once when a row is written (see the validators on
+`DailyVocabWords`) and compared byte-for-byte at query time, so lookups are
+plain index seeks/ranges with no lower()/ilike on the column.
+"""
+import re
+import unicodedata
+
+# every apostrophe-like character users type for o‘ / g‘ / tutuq belgisi
+_APOSTROPHES = str.maketrans({c: "'" for c in "‘’ʻʼ`´′ʹ"})
+
+_CYRILLIC = {
+    "а": "a", "б": "b", "в": "v", "г": "g", "ғ": "g'", "д": "d", "ё": "yo",
+    "ж": "j", "з": "z", "и": "i", "й": "y", "к": "k", "қ": "q", "л": "l",
+    "м": "m", "н": "n", "о": "o", "ў": "o'", "п": "p", "р": "r", "с": "s",
+    "т": "t", "у": "u", "ф": "f", "х": "x", "ҳ": "h", "ц": "s", "ч": "ch",
+    "ш": "sh", "щ": "sh", "ъ": "'", "ь": "", "ы": "i", "э": "e", "ю": "yu",
+    "я": "ya",
+}
+_VOWELS = set("аеёиоуўэюяaeiou")
+
+_NOT_KEY = re.compile(r"[^\w' -]+")
+_SPACES = re.compile(r"\s+")
+
+
+def _clean(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text or "").lower().translate(_APOSTROPHES)
+    return _SPACES.sub(" ", _NOT_KEY.sub(" ", text)).strip()
+
+
+def _transliterate(text: str) -> str:
+    out = []
+    for i, ch in enumerate(text):
+        if ch == "е":
+            # word-initial or after a vowel/ъ/ь: ye (yer, oyela), otherwise e
+            prev = text[i - 1] if i else " "
+            out.append("ye" if not prev.isalpha() or prev in _VOWELS or prev in "ъь" else "e")
+        else:
+            out.append(_CYRILLIC.get(ch, ch))
+    return "".join(out)
+
+
+def normalize_en(text: str) -> str:
+    return _clean(text)
+
+
+def normalize_uz(text: str) -> str:
+    """Cyrillic -> Latin, every apostrophe variant -> ', lowercase, single spaces."""
+    return _clean(_transliterate(_clean(text)))
+
+
+def prefix_range(column, prefix: str):
+    """`column LIKE 'prefix%'` as an index range (SQLite only optimises LIKE under NOCASE)."""
+    return (column >= prefix) & (column < prefix + "\U0010ffff")
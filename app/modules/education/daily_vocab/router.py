@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-import httpx
+from sqlalchemy import select, or_, case, func
 
 from app.core.database import get_db as get_async_session
+from app.modules.education.words.dictionary import lookup_entries
+from share.pagination import Page, PageParams, Paginator, page_params
 from .models import DailyVocabWords
+from .normalize import normalize_en, normalize_uz, prefix_range
 from .schemas import (
     DailyVocabCreate,
     DailyVocabUpdate,
@@ -15,18 +19,14 @@ from .schemas import (
 
 router = APIRouter(prefix="/daily-words", tags=["Daily Vocabulary"])
 
-DICT_URL = "https://api.dictionaryapi.dev/api/v2/entries/en"
-
 
 async def fetch_dictionary(word: str) -> DictionaryResponse | None:
     try:
-        async with httpx.AsyncClient(timeout=5) as client:
-            res = await client.get(f"{DICT_URL}/{word}")
-
-        if res.status_code != 200:
+        entries = await lookup_entries(word)
+        if not entries:
             return None
 
-        entry = res.json()[0]
+        entry = entries[0]
 
         phonetic = (
             entry.get("phonetic")
@@ -72,15 +72,50 @@ async def fetch_dictionary(word: str) -> DictionaryResponse | None:
     except Exception:
         return None
 
+DAILY_WORDS_PAGE = Paginator(
+    DailyVocabWords.id,
+    sort={"created_at": DailyVocabWords.created_at, "word": DailyVocabWords.word_norm},
+    default="-created_at",
+    filters={"level": DailyVocabWords.level},
+)
+
 @router.get(
     "/all",
-    response_model=list[DailyVocabResponse],
+    response_model=Page[DailyVocabResponse],
 )
 async def get_daily_words(
+    level: Optional[str] = None,
+    page: PageParams = Depends(page_params),
     session: AsyncSession = Depends(get_async_session),  # noqa: F821
 ):
+    return await DAILY_WORDS_PAGE.page(session, select(DailyVocabWords), page, level=level)
+
+@router.get(
+    "/search",
+    response_model=list[DailyVocabResponse],
+)
+async def search_words(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Prefix search over English words and Uzbek translations. Exact matches
+    come first; both sides are index ranges over the precomputed keys.
+    """
+    en, uz = normalize_en(q), normalize_uz(q)
+    if not en and not uz:
+        return []
+
     result = await session.execute(
-        select(DailyVocabWords).order_by(DailyVocabWords.created_at.desc())
+        select(DailyVocabWords)
+        .where(or_(prefix_range(DailyVocabWords.word_norm, en), prefix_range(DailyVocabWords.uz_norm, uz)))
+        .order_by(
+            case((or_(DailyVocabWords.word_norm == en, DailyVocabWords.uz_norm == uz), 0), else_=1),
+            func.length(DailyVocabWords.word),
+            DailyVocabWords.word,
+        )
+        .limit(limit)
     )
     return result.scalars().all()
 
@@ -91,10 +126,17 @@ async def get_word_details(
     word: str,
     session: AsyncSession = Depends(get_async_session),
 ):
-    result = await session.execute(
-        select(DailyVocabWords).where(DailyVocabWords.word.ilike(word))
+    db_word = await session.scalar(
+        select(DailyVocabWords).where(DailyVocabWords.word_norm == normalize_en(word))
     )
-    db_word = result.scalar_one_or_none()
+    if not db_word:
+        # Uzbek input (Latin or Cyrillic): first exact translation match
+        db_word = await session.scalar(
+            select(DailyVocabWords)
+            .where(DailyVocabWords.uz_norm == normalize_uz(word))
+            .order_by(DailyVocabWords.id)
+            .limit(1)
+        )
 
     if not db_word:
         raise HTTPException(status_code=404, detail="Word not found")
@@ -105,7 +147,7 @@ async def get_word_details(
         "id": db_word.id,
         "word": db_word.word,
         "level": db_word.level,
-        "uzTranslate": db_word.uzTranslate,
+        "uzTranslate": db_word.uz_translation,
         "dictionary": dictionary,
     }
 
@@ -119,7 +161,7 @@ async def create_word(
     session: AsyncSession = Depends(get_async_session),
 ):
     exists = await session.execute(
-        select(DailyVocabWords).where(DailyVocabWords.word == data.word)
+        select(DailyVocabWords).where(DailyVocabWords.word_norm == normalize_en(data.word))
     )
     if exists.scalar_one_or_none():
         raise HTTPException(status_code=400, detail="Word already exists")
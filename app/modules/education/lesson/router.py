@@ -1,23 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from app.core.database import get_db
 from .models import Lesson
-from .schemas import LessonCreate, LessonResponse
+from app.modules.education.course.progress import get_progress, record_lesson_completed
+from app.modules.education.course.schema import CourseProgressResponse
+from .schemas import LessonCreate, LessonMove, LessonReorder, LessonResponse
+from .service import bulk_reorder, move_lesson, next_order, renormalize_in_background
 from app.modules.auth.dependencies import get_current_user
 from app.modules.users.models import User
+from share.pagination import Page, PageParams, Paginator, page_params
 
 router = APIRouter(prefix="/lessons", tags=["Lessons"])
 
-@router.get("/all", response_model=list[LessonResponse])
-async def get_all_lessons(db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Lesson))
-    lessons = result.scalars().all()
-    return lessons
+LESSONS_PAGE = Paginator(
+    Lesson.id,
+    sort={"created_at": Lesson.created_at},
+    default="id",
+    filters={"course_id": Lesson.course_id, "is_free": Lesson.is_free},
+)
+
+@router.get("/all", response_model=Page[LessonResponse])
+async def get_all_lessons(
+    course_id: int | None = None,
+    is_free: bool | None = None,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_db),
+):
+    return await LESSONS_PAGE.page(db, select(Lesson), page, course_id=course_id, is_free=is_free)
 
 @router.get("/select/{course_id}", response_model=list[LessonResponse])
 async def get_lessons(course_id: int, db: AsyncSession = Depends(get_db)):
-    result = await db.execute(select(Lesson).where(Lesson.course_id == course_id))
+    result = await db.execute(
+        select(Lesson).where(Lesson.course_id == course_id).order_by(Lesson.order, Lesson.id)
+    )
     lessons = result.scalars().all()
     return lessons
 
@@ -34,7 +50,7 @@ async def create_lesson(
         title=data.title,
         description=data.description,
         video_url=data.video_url,
-        order=data.order,
+        order=data.order if data.order is not None else await next_order(db, data.course_id),
         course_id=data.course_id
     )
     db.add(lesson)
@@ -42,6 +58,29 @@ async def create_lesson(
     await db.refresh(lesson)
     return lesson
 
+@router.post("/{lesson_id}/complete", response_model=CourseProgressResponse)
+async def complete_lesson(
+    lesson_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Darsni tugatilgan deb belgilash; kurs progressi shu tranzaksiyada yangilanadi"""
+    # only the two columns progress needs, not the lesson's relationships
+    lesson = (await db.execute(
+        select(Lesson.id, Lesson.course_id).where(Lesson.id == lesson_id)
+    )).first()
+    if not lesson:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    if lesson.course_id is None:
+        raise HTTPException(status_code=400, detail="Lesson is not part of a course")
+
+    await record_lesson_completed(db, current_user.id, lesson) # type: ignore
+    await db.commit()
+    progress = await get_progress(db, current_user.id, lesson.course_id)
+    if not progress:
+        raise HTTPException(status_code=404, detail="Course progress not found")
+    return progress[0]
+
 @router.put("/update/{lesson_id}", response_model=LessonResponse)
 async def update_lesson(
     lesson_id: int,
@@ -60,7 +99,10 @@ async def update_lesson(
     lesson.title = data.title # type: ignore
     lesson.description = data.description # type: ignore
     lesson.video_url = data.video_url # type: ignore
-    lesson.order = data.order # type: ignore
+    if data.order is not None:
+        lesson.order = data.order # type: ignore
+    elif data.course_id != lesson.course_id:
+        lesson.order = await next_order(db, data.course_id) # type: ignore
     lesson.course_id = data.course_id # type: ignore
 
     db.add(lesson)
@@ -68,6 +110,43 @@ async def update_lesson(
     await db.refresh(lesson)
     return lesson
 
+@router.patch("/{lesson_id}/move", response_model=LessonResponse)
+async def move_lesson_endpoint(
+    lesson_id: int,
+    data: LessonMove,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Darsni `after_id` dan keyinga ko'chirish; faqat shu darsning `order` qiymati o'zgaradi"""
+    if current_user.role not in ["admin", "mentor", "teacher"]:
+        raise HTTPException(status_code=403, detail="Only admins, teachers, and mentors can reorder lessons")
+
+    lesson = await db.scalar(select(Lesson).where(Lesson.id == lesson_id))
+    if not lesson:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+
+    if await move_lesson(db, lesson, data.after_id):
+        background_tasks.add_task(renormalize_in_background, lesson.course_id)
+    return lesson
+
+@router.put("/reorder/{course_id}", response_model=list[LessonResponse])
+async def reorder_lessons(
+    course_id: int,
+    data: LessonReorder,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Kursdagi darslarning to'liq yangi tartibini bitta UPDATE bilan qo'llash"""
+    if current_user.role not in ["admin", "mentor", "teacher"]:
+        raise HTTPException(status_code=403, detail="Only admins, teachers, and mentors can reorder lessons")
+
+    await bulk_reorder(db, course_id, data.lesson_ids)
+    result = await db.execute(
+        select(Lesson).where(Lesson.course_id == course_id).order_by(Lesson.order, Lesson.id)
+    )
+    return result.scalars().all()
+
 @router.delete("/delete/{lesson_id}", status_code=204)
 async def delete_lesson(
     lesson_id: int,
@@ -19,4 +19,12 @@ class LessonResponse(BaseModel):
     created_at: Optional[datetime] = None 
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class LessonMove(BaseModel):
+    # darsdan oldin turadigan dars; None -> kurs boshiga
+    after_id: Optional[int] = None
+
+class LessonReorder(BaseModel):
+    # kursdagi barcha darslar, yangi tartibda
+    lesson_ids: list[int]
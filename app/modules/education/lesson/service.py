@@ -0,0 +1,159 @@
+import logging
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import select, func, update, case
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from .models import Lesson
+
+logger = logging.getLogger(__name__)
+
+# `Lesson.order` is a sparse sort key: lessons sit GAP apart, so a move only
+# needs a free integer between its new neighbours.
+GAP = 1024
+# a move that leaves less room than this schedules a background renormalize
+MIN_GAP = 8
+# bulk reorders write above the current max; past this they restart from GAP
+MAX_ORDER = 2**31 - 1
+
+
+# =========================
+# KEYS
+# =========================
+async def next_order(db: AsyncSession, course_id: int) -> int:
+    last = await db.scalar(select(func.max(Lesson.order)).where(Lesson.course_id == course_id))
+    return (last or 0) + GAP
+
+
+def _key_between(low: Optional[int], high: Optional[int]) -> Optional[int]:
+    if high is None:
+        return (low or 0) + GAP
+    if low is None:
+        return high - GAP
+    if high - low < 2:
+        return None
+    return (low + high) // 2
+
+
+async def _neighbours(db: AsyncSession, course_id: int, lesson_id: int, after_id: Optional[int]) -> tuple[Optional[int], Optional[int]]:
+    """Order keys of the lessons the moved one will sit between (None = list edge)."""
+    low = None
+    if after_id is not None:
+        low = await db.scalar(
+            select(Lesson.order).where(Lesson.id == after_id, Lesson.course_id == course_id)
+        )
+        if low is None:
+            raise HTTPException(status_code=404, detail="after_id lesson not found in this course")
+
+    stmt = select(Lesson.order).where(Lesson.course_id == course_id, Lesson.id != lesson_id)
+    if low is not None:
+        stmt = stmt.where(Lesson.order > low)
+    high = await db.scalar(stmt.order_by(Lesson.order).limit(1))
+    return low, high
+
+
+async def move_lesson(db: AsyncSession, lesson: Lesson, after_id: Optional[int]) -> bool:
+    """
+    Puts `lesson` right after `after_id` (None = first) by rewriting its own
+    key only. Returns True when the remaining gap is small and the course
+    should be renormalized.
+    """
+    if after_id == lesson.id:
+        raise HTTPException(status_code=400, detail="A lesson can't be placed after itself")
+
+    low, high = await _neighbours(db, lesson.course_id, lesson.id, after_id) # type: ignore
+    if low is None and high is None:
+        return False
+
+    key = _key_between(low, high)
+    try:
+        if key is None:
+            # no free integer left: renormalize synchronously this once
+            await renormalize_course(db, lesson.course_id) # type: ignore
+            low, high = await _neighbours(db, lesson.course_id, lesson.id, after_id) # type: ignore
+            key = _key_between(low, high)
+
+        lesson.order = key # type: ignore
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Lesson order changed concurrently, try again")
+
+    return low is not None and high is not None and min(key - low, high - key) < MIN_GAP
+
+
+async def bulk_reorder(db: AsyncSession, course_id: int, lesson_ids: list[int]):
+    """Applies a complete new ordering with one UPDATE."""
+    current = set((await db.execute(select(Lesson.id).where(Lesson.course_id == course_id))).scalars())
+    if len(lesson_ids) != len(set(lesson_ids)) or set(lesson_ids) != current:
+        raise HTTPException(status_code=400, detail="lesson_ids must list every lesson of the course exactly once")
+    if not lesson_ids:
+        return
+
+    # SQLite checks uq_course_lesson_order row by row, so the new keys start
+    # above every current key instead of reusing them
+    base = await next_order(db, course_id)
+    if base + len(lesson_ids) * GAP > MAX_ORDER:
+        # keys only grow this way; once they get too big, park and restart at GAP
+        await _park(db, course_id)
+        base = GAP
+    await db.execute(
+        update(Lesson)
+        .where(Lesson.course_id == course_id)
+        .values(order=case(
+            {lesson_id: base + i * GAP for i, lesson_id in enumerate(lesson_ids)},
+            value=Lesson.id,
+        ))
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+
+# =========================
+# RENORMALIZE
+# =========================
+async def _park(db: AsyncSession, course_id: int):
+    """
+    Moves every key of the course below all current keys, one distinct
+    value per lesson, so the next UPDATE can assign any keys without
+    hitting uq_course_lesson_order midway.
+    """
+    lowest = await db.scalar(select(func.min(Lesson.order)).where(Lesson.course_id == course_id))
+    shift = min(lowest or 0, 0) - 1
+    await db.execute(
+        update(Lesson)
+        .where(Lesson.course_id == course_id)
+        .values(order=shift - Lesson.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def renormalize_course(db: AsyncSession, course_id: int):
+    """Spreads the course's keys back to GAP, 2*GAP, ... keeping their order."""
+    ids = list((await db.execute(
+        select(Lesson.id).where(Lesson.course_id == course_id).order_by(Lesson.order, Lesson.id)
+    )).scalars())
+    if not ids:
+        return
+
+    await _park(db, course_id)
+    await db.execute(
+        update(Lesson)
+        .where(Lesson.course_id == course_id)
+        .values(order=case({lesson_id: (i + 1) * GAP for i, lesson_id in enumerate(ids)}, value=Lesson.id))
+        .execution_options(synchronize_session=False)
+    )
+    await db.flush()
+
+
+async def renormalize_in_background(course_id: int):
+    async with AsyncSessionLocal() as db: # type: ignore
+        try:
+            await renormalize_course(db, course_id)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            logger.exception("Lesson renormalize failed for course %s", course_id)
@@ -0,0 +1,92 @@
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import MISSING, TTLCache
+from app.core.versions import get_version, track_writes
+from app.modules.education.course.models import UserCourse
+from app.modules.education.lesson.models import Lesson
+from app.modules.users.models import User
+from share.export import CsvLines
+from .models import Task, UserTask
+
+GRADEBOOK_VERSION = "gradebook"
+
+# (course_id, gradebook version) -> matrix. Submissions, task and lesson
+# edits and enrollments bump the shared version in their own transaction, so
+# every worker misses once the write commits.
+_gradebook_cache = TTLCache(maxsize=256, ttl=5 * 60)
+
+track_writes(GRADEBOOK_VERSION, UserTask, Task, Lesson, UserCourse)
+
+
+async def course_id_for_task(db: AsyncSession, task: Task) -> Optional[int]:
+    return await db.scalar(select(Lesson.course_id).where(Lesson.id == task.lesson_id))
+
+
+def _average(values: list) -> Optional[float]:
+    scored = [v for v in values if v is not None]
+    return round(sum(scored) / len(scored), 2) if scored else None
+
+
+async def get_gradebook(db: AsyncSession, course_id: int) -> dict:
+    """
+    Students x tasks matrix for one course. A cell is the student's best
+    attempt score, or None when the task was never submitted. Students are
+    everyone enrolled plus anyone who submitted a task of the course.
+    """
+    key = (course_id, await get_version(db, GRADEBOOK_VERSION))
+    cached = _gradebook_cache.get(key)
+    if cached is not MISSING:
+        return cached
+
+    tasks = (await db.execute(
+        select(Task.id, Task.title, Task.max_score)
+        .join(Lesson, Lesson.id == Task.lesson_id)
+        .where(Lesson.course_id == course_id)
+        .order_by(Lesson.order, Lesson.id, Task.id)
+    )).all()
+
+    cells = await db.execute(
+        select(UserTask.user_id, UserTask.task_id, func.max(UserTask.score))
+        .join(Task, Task.id == UserTask.task_id)
+        .join(Lesson, Lesson.id == Task.lesson_id)
+        .where(Lesson.course_id == course_id)
+        .group_by(UserTask.user_id, UserTask.task_id)
+    )
+    best: dict[tuple[int, int], float] = {(user_id, task_id): score for user_id, task_id, score in cells}
+
+    student_ids = {user_id for user_id, _ in best}
+    student_ids.update(
+        (await db.execute(select(UserCourse.user_id).where(UserCourse.course_id == course_id))).scalars()
+    )
+    students = (await db.execute(
+        select(User.id, User.full_name, User.username)
+        .where(User.id.in_(student_ids))
+        .order_by(User.full_name, User.id)
+    )).all() if student_ids else []
+
+    scores = [[best.get((student.id, task.id)) for task in tasks] for student in students]
+
+    gradebook = {
+        "course_id": course_id,
+        "tasks": [{"id": t.id, "title": t.title, "max_score": t.max_score} for t in tasks],
+        "students": [{"id": s.id, "full_name": s.full_name, "username": s.username} for s in students],
+        "scores": scores,
+        "task_averages": [_average([row[i] for row in scores]) for i in range(len(tasks))],
+        "student_averages": [_average(row) for row in scores],
+    }
+    _gradebook_cache.set(key, gradebook)
+    return gradebook
+
+
+async def stream_gradebook_csv(gradebook: dict) -> AsyncIterator[str]:
+    """One CSV line per student, with an averages row at the end."""
+    line = CsvLines()
+
+    # BOM so Excel opens the UTF-8 names correctly
+    yield "\ufeff" + line(["student_id", "full_name", "username", *(t["title"] for t in gradebook["tasks"]), "average"])
+    for student, row, average in zip(gradebook["students"], gradebook["scores"], gradebook["student_averages"]):
+        yield line([student["id"], student["full_name"], student["username"], *row, average])
+    yield line(["", "average", "", *gradebook["task_averages"], ""])
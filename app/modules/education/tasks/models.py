@@ -12,6 +12,7 @@ from sqlalchemy import (
     Float,
     JSON,
     UniqueConstraint,
+    Index,
     Enum as SQLEnum,
 )
 from sqlalchemy.orm import relationship
@@ -34,6 +35,10 @@ class TaskItemTypeEnum(str, enum.Enum):
 class Task(Base):
     __tablename__ = "tasks"
 
+    __table_args__ = (
+        Index("ix_tasks_lesson_id", "lesson_id"),
+    )
+
     id = Column(Integer, primary_key=True)
     lesson_id = Column(
         Integer,
@@ -53,11 +58,15 @@ class Task(Base):
     max_score = Column(Float, default=100)
 
     is_active = Column(Boolean, default=True)
+    allow_multiple_attempts = Column(Boolean, default=False)
 
     available_from = Column(DateTime, nullable=True)
     deadline = Column(DateTime, nullable=True)
 
     created_at = Column(DateTime, default=datetime.utcnow)
+    # bumped by every write to the task or its items; the grading cache
+    # (service.get_task_items) is keyed on it, so all workers see new answers
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     # relationships
     lesson = relationship("Lesson", back_populates="tasks")
@@ -78,6 +87,10 @@ class Task(Base):
 class TaskItem(Base):
     __tablename__ = "task_items"
 
+    __table_args__ = (
+        Index("ix_task_items_task_id", "task_id"),
+    )
+
     id = Column(Integer, primary_key=True)
 
     task_id = Column(
@@ -104,7 +117,8 @@ class UserTask(Base):
     __tablename__ = "user_tasks"
 
     __table_args__ = (
-        UniqueConstraint("user_id", "task_id", name="uq_user_task"),
+        UniqueConstraint("user_id", "task_id", "attempt_number", name="uq_user_task_attempt"),
+        Index("ix_user_tasks_task_user", "task_id", "user_id"),
     )
 
     id = Column(Integer, primary_key=True)
@@ -5,28 +5,39 @@ from sqlalchemy import select
 from app.core.database import get_db
 from app.modules.auth.dependencies import get_current_user
 from app.modules.users.models import User
-from .models import Task, TaskItem, UserTask, UserTaskAnswer
+from .models import Task, TaskItem, TaskTypeEnum
 from .schemas import (
-    TaskCreate, TaskUpdate, TaskOut,
+    TaskCreate, TaskUpdate, TaskOut, TaskSummary,
     UserTaskSubmit, UserTaskOut
 )
+from .service import list_task_summaries, submit_answers
+from share.pagination import Page, PageParams, page_params
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 ADMIN_ROLES = {"admin", "teacher", "mentor"}
 
 
-@router.get("/all", response_model=list[TaskOut])
+@router.get("/all", response_model=Page[TaskSummary])
 async def list_tasks(
     lesson_id: int | None = None,
+    type: TaskTypeEnum | None = None,
+    active: bool | None = None,
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(Task)
-    if lesson_id:
-        stmt = stmt.where(Task.lesson_id == lesson_id)
-
-    res = await db.execute(stmt.order_by(Task.created_at.desc()))
-    return res.scalars().all()
+    """
+    Newest first, without items: use /select/{task_id} for the questions.
+    `active=true` keeps tasks that are enabled and inside their
+    available_from..deadline window; pass `next_cursor` back as `cursor`.
+    """
+    return await list_task_summaries(
+        db,
+        page,
+        lesson_id=lesson_id,
+        task_type=type,
+        active=active,
+    )
 
 
 @router.get("/select/{task_id}", response_model=TaskOut)
@@ -98,6 +109,7 @@ async def update_task(
 
     for k, v in data.dict(exclude_unset=True).items():
         setattr(task, k, v)
+    task.version = Task.version + 1 # type: ignore
 
     await db.commit()
     await db.refresh(task)
@@ -118,44 +130,7 @@ async def submit_task(
     if not task or not task.is_active: # type: ignore
         raise HTTPException(404, "Task not available")
 
-    user_task = UserTask(
-        user_id=current_user.id,
-        task_id=task.id,
-        is_completed=True,
-    )
-    db.add(user_task)
-    await db.flush()
-
-    total_score = 0.0
-
-    for ans in payload.answers:
-        item = await db.scalar(
-            select(TaskItem).where(TaskItem.id == ans["task_item_id"])
-        )
-        if not item:
-            continue
-
-        is_correct = ans.get("answer") == item.correct_answer
-        score = item.points if is_correct else 0.0
-        total_score += score
-
-        db.add(
-            UserTaskAnswer(
-                user_task_id=user_task.id,
-                task_item_id=item.id,
-                answer=ans.get("answer"),
-                is_correct=is_correct,
-                score=score,
-            )
-        )
-
-    user_task.score = total_score # type: ignore
-    user_task.feedback = "Auto graded" # type: ignore
-    user_task.graded_by = "system" # type: ignore
-
-    await db.commit()
-    await db.refresh(user_task)
-    return user_task
+    return await submit_answers(db, task, current_user.id, payload.answers) # type: ignore
 
 @router.delete("/delete/{task_id}", status_code=204)
 async def delete_task(
@@ -42,12 +42,13 @@ class TaskCreate(BaseModel):
 
 
 class TaskUpdate(BaseModel):
-    title: Optional[str]
-    description: Optional[str]
-    difficulty: Optional[str]
-    max_score: Optional[float]
-    deadline: Optional[datetime]
-    is_active: Optional[bool]
+    title: Optional[str] = None
+    description: Optional[str] = None
+    difficulty: Optional[str] = None
+    max_score: Optional[float] = None
+    deadline: Optional[datetime] = None
+    is_active: Optional[bool] = None
+    allow_multiple_attempts: Optional[bool] = None
 
 
 class TaskOut(BaseModel):
@@ -66,6 +67,18 @@ class TaskOut(BaseModel):
         from_attributes = True
 
 
+class TaskSummary(BaseModel):
+    id: int
+    lesson_id: int
+    title: str
+    type: str
+    difficulty: Optional[str] = None
+    is_active: bool
+    available_from: Optional[datetime] = None
+    deadline: Optional[datetime] = None
+    item_count: int
+
+
 # =========================
 # USER TASK (ATTEMPT)
 # =========================
@@ -83,3 +96,27 @@ class UserTaskOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# =========================
+# GRADEBOOK
+# =========================
+class GradebookTask(BaseModel):
+    id: int
+    title: str
+    max_score: Optional[float] = None
+
+
+class GradebookStudent(BaseModel):
+    id: int
+    full_name: str
+    username: str
+
+
+class GradebookOut(BaseModel):
+    course_id: int
+    tasks: List[GradebookTask]
+    students: List[GradebookStudent]
+    scores: List[List[Optional[float]]]   # students x tasks, best attempt
+    task_averages: List[Optional[float]]
+    student_averages: List[Optional[float]]
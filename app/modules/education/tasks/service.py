@@ -0,0 +1,219 @@
+import re
+import unicodedata
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import select, func, insert, and_, or_, not_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import MISSING, TTLCache
+from app.modules.education.course.progress import record_task_submitted
+from app.modules.stats.events import track_activity
+from share.pagination import PageParams, Paginator
+from .gradebook import course_id_for_task
+from .models import Task, TaskItem, TaskItemTypeEnum, UserTask, UserTaskAnswer
+
+# (task_id, task.version) -> {item_id: item dict}. Edits bump Task.version,
+# so a stale entry is never read again in any worker; the TTL just evicts it.
+_items_cache = TTLCache(maxsize=2048, ttl=10 * 60)
+
+_APOSTROPHES = str.maketrans({c: "'" for c in "‘’ʻʼ`´"})
+_SPACES = re.compile(r"\s+")
+
+
+# =========================
+# ITEMS
+# =========================
+async def get_task_items(db: AsyncSession, task: Task) -> dict[int, dict]:
+    key = (task.id, task.version)
+    items = _items_cache.get(key)
+    if items is MISSING:
+        res = await db.execute(
+            select(TaskItem.id, TaskItem.type, TaskItem.correct_answer, TaskItem.points)
+            .where(TaskItem.task_id == task.id)
+        )
+        items = {
+            item_id: {"type": type_, "correct_answer": correct, "points": points or 0.0}
+            for item_id, type_, correct, points in res
+        }
+        _items_cache.set(key, items)
+    return items
+
+
+# =========================
+# LISTING
+# =========================
+TASKS_PAGE = Paginator(
+    Task.id,
+    sort={"created_at": Task.created_at, "deadline": Task.deadline},
+    filters={"lesson_id": Task.lesson_id, "type": Task.type},
+)
+
+
+async def list_task_summaries(
+    db: AsyncSession,
+    page: PageParams,
+    lesson_id: Optional[int] = None,
+    task_type: Optional[str] = None,
+    active: Optional[bool] = None,
+) -> dict:
+    item_count = (
+        select(func.count(TaskItem.id))
+        .where(TaskItem.task_id == Task.id)
+        .correlate(Task)
+        .scalar_subquery()
+    )
+    stmt = select(
+        Task.id,
+        Task.lesson_id,
+        Task.title,
+        Task.type,
+        Task.difficulty,
+        Task.is_active,
+        Task.available_from,
+        Task.deadline,
+        item_count.label("item_count"),
+    )
+
+    if active is not None:
+        now = datetime.utcnow()
+        in_window = and_(
+            Task.is_active.is_(True),
+            or_(Task.available_from.is_(None), Task.available_from <= now),
+            or_(Task.deadline.is_(None), Task.deadline >= now),
+        )
+        stmt = stmt.where(in_window if active else not_(in_window))
+
+    return await TASKS_PAGE.page(db, stmt, page, scalars=False, lesson_id=lesson_id, type=task_type)
+
+
+# =========================
+# GRADING
+# =========================
+def normalize_answer(value: Any) -> str:
+    """Case, width, apostrophe and whitespace folding; trailing punctuation is ignored."""
+    text = unicodedata.normalize("NFKC", str(value)).translate(_APOSTROPHES).lower()
+    return _SPACES.sub(" ", text).strip().strip(".,;:!?")
+
+
+def _accepted(correct: Any) -> set[str]:
+    """A blank's correct answer may be one value or a list of alternatives."""
+    values = correct if isinstance(correct, list) else [correct]
+    return {normalize_answer(v) for v in values if v is not None}
+
+
+def _pairs(value: Any) -> Optional[set[tuple[str, str]]]:
+    if isinstance(value, dict):
+        return {(normalize_answer(k), normalize_answer(v)) for k, v in value.items()}
+    if isinstance(value, list) and all(isinstance(p, (list, tuple)) and len(p) == 2 for p in value):
+        return {(normalize_answer(a), normalize_answer(b)) for a, b in value}
+    return None
+
+
+def _grade_mcq(answer: Any, correct: Any) -> float:
+    # list -> multiple select, graded as a set
+    if isinstance(correct, list):
+        if not isinstance(answer, list):
+            answer = [answer]
+        return float({normalize_answer(a) for a in answer} == _accepted(correct))
+    return float(normalize_answer(answer) == normalize_answer(correct))
+
+
+def _grade_gap_fill(answer: Any, correct: Any) -> float:
+    # several blanks: a list of answers against a list of (alternatives per) blank
+    if isinstance(answer, list) and isinstance(correct, list) and len(correct) > 1:
+        hits = sum(
+            1 for given, expected in zip(answer, correct)
+            if given is not None and normalize_answer(given) in _accepted(expected)
+        )
+        return hits / len(correct)
+    return float(answer is not None and normalize_answer(answer) in _accepted(correct))
+
+
+def _grade_matching(answer: Any, correct: Any) -> float:
+    expected, given = _pairs(correct), _pairs(answer)
+    if not expected or given is None:
+        return 0.0
+    return len(expected & given) / len(expected)
+
+
+def grade_answer(item: dict, answer: Any) -> tuple[Optional[bool], float]:
+    """(is_correct, score) for one answer; is_correct is None for manually graded items."""
+    correct = item["correct_answer"]
+    if correct is None:
+        return None, 0.0
+
+    item_type = item["type"]
+    if item_type == TaskItemTypeEnum.mcq:
+        ratio = _grade_mcq(answer, correct)
+    elif item_type == TaskItemTypeEnum.gap_fill:
+        ratio = _grade_gap_fill(answer, correct)
+    elif item_type == TaskItemTypeEnum.matching:
+        ratio = _grade_matching(answer, correct)
+    else:
+        ratio = float(answer is not None and normalize_answer(answer) in _accepted(correct))
+
+    return ratio == 1.0, round(item["points"] * ratio, 2)
+
+
+# =========================
+# SUBMIT
+# =========================
+async def submit_answers(db: AsyncSession, task: Task, user_id: int, answers: list[dict]) -> UserTask:
+    """Grades a whole submission against the cached items and stores it as the next attempt."""
+    last_attempt = await db.scalar(
+        select(func.max(UserTask.attempt_number)).where(
+            UserTask.user_id == user_id,
+            UserTask.task_id == task.id,
+        )
+    )
+    if last_attempt and not task.allow_multiple_attempts:
+        raise HTTPException(400, "Task already submitted")
+
+    items = await get_task_items(db, task)
+
+    # one answer per item (the last one wins), unknown items are ignored
+    given = {
+        ans["task_item_id"]: ans.get("answer")
+        for ans in answers
+        if isinstance(ans, dict) and ans.get("task_item_id") in items
+    }
+
+    rows = []
+    total_score = 0.0
+    for item_id, answer in given.items():
+        is_correct, score = grade_answer(items[item_id], answer)
+        total_score += score
+        rows.append({"task_item_id": item_id, "answer": answer, "is_correct": is_correct, "score": score})
+
+    user_task = UserTask(
+        user_id=user_id,
+        task_id=task.id,
+        attempt_number=(last_attempt or 0) + 1,
+        score=round(total_score, 2),
+        is_completed=True,
+        submitted_at=datetime.utcnow(),
+        feedback="Auto graded",
+    )
+    db.add(user_task)
+    try:
+        await db.flush()
+    except IntegrityError:
+        # a parallel submission took the same attempt number
+        await db.rollback()
+        raise HTTPException(409, "Submission already in progress")
+
+    if rows:
+        await db.execute(
+            insert(UserTaskAnswer),
+            [{"user_task_id": user_task.id, **row} for row in rows],
+        )
+
+    course_id = await course_id_for_task(db, task)
+    await record_task_submitted(db, user_id, course_id, user_task.submitted_at, first_attempt=not last_attempt) # type: ignore
+
+    await db.commit()
+    track_activity(user_id, "task", score=user_task.score / task.max_score * 100 if task.max_score else 0.0) # type: ignore
+    return user_task
@@ -0,0 +1,90 @@
+from typing import Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import MISSING, TTLCache
+from app.core.versions import get_version, track_writes
+from share.pagination import PageParams, Paginator
+from .models import Word, WordCategory, WordCategoryItem
+
+SUMMARY_VERSION = "word_categories"
+
+# (version, rows) for the whole summary. Any write to a category, an item or a
+# word bumps the shared version, which is re-read on every request, so writes
+# made by any worker invalidate it. (A count/max(id) fingerprint missed a
+# delete followed by an insert, since SQLite reuses the freed rowid.)
+_summary_cache = TTLCache(maxsize=1, ttl=60 * 60)
+
+track_writes(SUMMARY_VERSION, WordCategory, WordCategoryItem, Word)
+
+
+async def get_category_summary(db: AsyncSession, q: Optional[str] = None) -> list[dict]:
+    """
+    Every category with its word count and difficulty distribution, from a
+    single grouped query instead of loading items -> words -> children.
+    """
+    version = await get_version(db, SUMMARY_VERSION)
+    cached = _summary_cache.get("summary")
+    if cached is not MISSING and cached[0] == version:
+        rows = cached[1]
+    else:
+        res = await db.execute(
+            select(
+                WordCategory.id,
+                WordCategory.title,
+                WordCategory.description,
+                WordCategory.language,
+                WordCategory.icon,
+                WordCategory.is_active,
+                Word.difficulty,
+                func.count(Word.id),
+            )
+            .outerjoin(WordCategoryItem, WordCategoryItem.category_id == WordCategory.id)
+            .outerjoin(Word, Word.id == WordCategoryItem.word_id)
+            .group_by(WordCategory.id, Word.difficulty)
+            .order_by(WordCategory.id)
+        )
+
+        by_id: dict[int, dict] = {}
+        for cat_id, title, description, language, icon, is_active, difficulty, count in res:
+            cat = by_id.setdefault(cat_id, {
+                "id": cat_id,
+                "title": title,
+                "description": description,
+                "language": language,
+                "icon": icon,
+                "is_active": is_active,
+                "word_count": 0,
+                "difficulty": {},
+            })
+            if count:
+                cat["word_count"] += count
+                cat["difficulty"][difficulty or "unknown"] = count
+
+        rows = list(by_id.values())
+        _summary_cache.set("summary", (version, rows))
+
+    if q:
+        rows = [r for r in rows if q.lower() in r["title"].lower()]
+    return rows
+
+
+CATEGORY_WORDS_PAGE = Paginator(Word.id, sort={"lemma": Word.lemma}, default="id")
+
+
+async def list_category_words(db: AsyncSession, category_id: int, page: PageParams) -> dict:
+    stmt = (
+        select(
+            Word.id,
+            Word.lemma,
+            Word.pos,
+            Word.meaning,
+            Word.transcription,
+            Word.difficulty,
+            WordCategoryItem.custom_note,
+        )
+        .join(WordCategoryItem, WordCategoryItem.word_id == Word.id)
+        .where(WordCategoryItem.category_id == category_id)
+    )
+    return await CATEGORY_WORDS_PAGE.page(db, stmt, page, scalars=False)
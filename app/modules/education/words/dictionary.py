@@ -1,21 +1,170 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
 import httpx
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
+from app.core.cache import MISSING, TTLCache
+from app.core.database import AsyncSessionLocal
+from app.core.http import get_http_client
+from .models import DictionaryCacheEntry
+from .offline import offline_dictionary
 
-async def fetch_dictionary_data(word: str) -> dict:
-    url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
+logger = logging.getLogger(__name__)
+
+DICT_URL = "https://api.dictionaryapi.dev/api/v2/entries/en"
+
+FOUND_TTL = timedelta(days=30)
+NOT_FOUND_TTL = timedelta(days=1)
+MEMORY_TTL = 60 * 60  # seconds
+
+UPSTREAM_TIMEOUT = httpx.Timeout(5.0, connect=3.0)
+# timeouts, connection errors and 5xx are retried with exponential backoff
+UPSTREAM_ATTEMPTS = 3
+RETRY_BACKOFF = 0.2  # seconds before the first retry
+
+# tier 1: per-process LRU, tier 2: `dictionary_cache` table
+_memory = TTLCache(maxsize=5000, ttl=MEMORY_TTL)
+# concurrent misses for the same word share one upstream call
+_inflight: dict[str, asyncio.Task] = {}
+
+
+def _key(word: str) -> str:
+    return word.strip().lower()
+
+
+async def _read_db(key: str) -> object:
+    async with AsyncSessionLocal() as db: # type: ignore
+        entry = await db.scalar(
+            select(DictionaryCacheEntry).where(
+                DictionaryCacheEntry.word == key,
+                DictionaryCacheEntry.expires_at > datetime.utcnow(),
+            )
+        )
+    if entry is None:
+        return MISSING
+    return entry.payload if entry.found else None
+
+
+async def _write_db(key: str, entries: Optional[list]):
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db: # type: ignore
+        await db.merge(
+            DictionaryCacheEntry(
+                word=key,
+                found=entries is not None,
+                payload=entries,
+                fetched_at=now,
+                expires_at=now + (FOUND_TTL if entries is not None else NOT_FOUND_TTL),
+            )
+        )
+        try:
+            await db.commit()
+        except IntegrityError:
+            # another worker stored the same word first
+            await db.rollback()
+
+
+async def _fetch_upstream(key: str) -> Optional[list]:
+    for attempt in range(UPSTREAM_ATTEMPTS):
+        try:
+            res = await get_http_client().get(f"{DICT_URL}/{key}", timeout=UPSTREAM_TIMEOUT)
+            if res.status_code == 404:
+                return None
+            res.raise_for_status()
+            return res.json()
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            retryable = isinstance(e, httpx.TransportError) or e.response.status_code >= 500
+            if not retryable or attempt == UPSTREAM_ATTEMPTS - 1:
+                raise
+            logger.warning("Dictionary lookup for %r failed (%s), retrying", key, e)
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+
+async def _load(key: str) -> Optional[list]:
+    entries = await _read_db(key)
+    if entries is MISSING:
+        entries = await _fetch_upstream(key)
+        await _write_db(key, entries) # type: ignore
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        res = await client.get(url)
-        res.raise_for_status()
-        data = res.json()[0]
+    _memory.set(key, entries)
+    return entries # type: ignore
+
+
+async def lookup_entries(word: str) -> Optional[list]:
+    """
+    Raw dictionaryapi.dev entries for `word`, or None when the word does not
+    exist (that answer is cached too). The offline index is consulted before
+    the caches and the network. Upstream/network errors are raised and
+    never cached.
+    """
+    key = _key(word)
+    if not key:
+        return None
+
+    # bundled dataset first: zero network on cold start
+    offline = offline_dictionary.get(key)
+    if offline:
+        return offline
+
+    cached = _memory.get(key)
+    if cached is not MISSING:
+        return cached
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_load(key))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    # shield: one cancelled request must not cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+def normalize_entries(entries: list) -> dict:
+    """Flattens every upstream entry into the fields we store on `Word`."""
+    pos = meaning = transcription = None
+    examples: list[str] = []
+    synonyms: list[str] = []
+
+    for entry in entries:
+        transcription = transcription or entry.get("phonetic") or next(
+            (p.get("text") for p in entry.get("phonetics", []) if p.get("text")), None
+        )
+        for m in entry.get("meanings", []):
+            pos = pos or m.get("partOfSpeech")
+            for d in m.get("definitions", []):
+                meaning = meaning or d.get("definition")
+                if d.get("example"):
+                    examples.append(d["example"])
+                synonyms += d.get("synonyms", [])
+            synonyms += m.get("synonyms", [])
+
+    return {
+        "pos": pos,
+        "meaning": meaning,
+        "transcription": transcription,
+        "examples": list(dict.fromkeys(examples)),
+        "synonyms": list(dict.fromkeys(synonyms)),
+    }
+
+
+async def fetch_dictionary_data(word: str) -> dict:
+    entries = await lookup_entries(word)
+    if not entries:
+        raise LookupError(f"'{word}' not found in dictionary")
 
+    data = entries[0]
     meaning_block = data["meanings"][0]
     definition = meaning_block["definitions"][0]
 
     return {
         "pos": meaning_block["partOfSpeech"],
         "meaning": definition["definition"],
-        "transcription": data["phonetics"][0].get("text"),
+        "transcription": data["phonetics"][0].get("text") if data.get("phonetics") else None,
         "examples": [
             {"text": definition.get("example")}
         ] if definition.get("example") else [],
@@ -0,0 +1,189 @@
+"""
+Distractor index for multiple-choice vocabulary drills.
+
+Words are bucketed by (base_language, pos, difficulty). Inside a bucket each
+word keeps its NEIGHBORS most similar words (lemma spelling + shared tags), so a quiz question is a dict lookup instead of ORDER BY RANDOM().
+
+The index lives per process and follows `words` incrementally: every call
+reads rows whose `updated_at` moved past the last watermark plus new
+tombstones, and only the affected neighbourhoods are recomputed.
+"""
+import asyncio
+import bisect
+import random
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import Word, WordTombstone
+from .sync import current_watermark
+
+NEIGHBORS = 8
+# candidates are taken from this many words on each side of the lemma in a
+# bucket sorted by (length, lemma); similar words have similar lengths
+WINDOW = 40
+OPTIONS = 4
+
+_COLUMNS = (Word.id, Word.lemma, Word.pos, Word.difficulty, Word.base_language, Word.meaning, Word.tags)
+
+
+def _bigrams(text: str) -> frozenset:
+    padded = f" {text} "
+    return frozenset(padded[i:i + 2] for i in range(len(padded) - 1))
+
+
+def _similarity(a: dict, b: dict) -> float:
+    # bigram Dice coefficient: tracks edit distance closely for short lemmas
+    # and is a C-level set intersection instead of a Python DP loop
+    score = 2 * len(a["bigrams"] & b["bigrams"]) / (len(a["bigrams"]) + len(b["bigrams"]))
+    if a["tags"] and b["tags"]:
+        score += len(a["tags"] & b["tags"]) / len(a["tags"] | b["tags"])
+    return score
+
+
+class DistractorIndex:
+    def __init__(self):
+        self.words: dict[int, dict] = {}
+        # bucket -> word ids sorted by (len(lemma), lemma)
+        self.buckets: dict[tuple, list[int]] = {}
+        self.neighbors: dict[int, list[int]] = {}
+        self.by_language: dict[str, list[int]] = {}
+        self.watermark: Optional[datetime] = None
+        self._lock = asyncio.Lock()
+
+    # ---------- bucket maintenance ----------
+    def _sort_key(self, word_id: int) -> tuple:
+        key = self.words[word_id]["key"]
+        return len(key), key, word_id
+
+    def _window(self, word_id: int) -> list[int]:
+        ids = self.buckets[self.words[word_id]["bucket"]]
+        pos = bisect.bisect_left(ids, self._sort_key(word_id), key=self._sort_key)
+        return ids[max(pos - WINDOW, 0):pos + WINDOW + 1]
+
+    def _remove(self, word_id: int) -> list[int]:
+        """Drops a word; returns the ids whose neighbour lists may need it replaced."""
+        word = self.words.get(word_id)
+        if word is None:
+            return []
+        affected = self._window(word_id)
+        ids = self.buckets[word["bucket"]]
+        ids.pop(bisect.bisect_left(ids, self._sort_key(word_id), key=self._sort_key))
+        if not ids:
+            del self.buckets[word["bucket"]]
+        self.by_language[word["language"]].remove(word_id)
+        del self.words[word_id]
+        self.neighbors.pop(word_id, None)
+        return affected
+
+    def _add(self, row) -> list[int]:
+        if not row.meaning:
+            return []
+        bucket = (row.base_language, (row.pos or "").lower(), (row.difficulty or "").lower())
+        self.words[row.id] = {
+            "lemma": row.lemma,
+            "key": row.lemma.strip().lower(),
+            "bigrams": _bigrams(row.lemma.strip().lower()),
+            "meaning": row.meaning,
+            "meaning_key": row.meaning.strip().lower(),
+            "tags": {str(t).lower() for t in row.tags} if isinstance(row.tags, list) else set(),
+            "bucket": bucket,
+            "language": row.base_language,
+        }
+        ids = self.buckets.setdefault(bucket, [])
+        bisect.insort(ids, row.id, key=self._sort_key)
+        self.by_language.setdefault(row.base_language, []).append(row.id)
+        return self._window(row.id)
+
+    def _compute(self, word_id: int):
+        word = self.words[word_id]
+        scored = [
+            (_similarity(word, self.words[other]), other)
+            for other in self._window(word_id)
+            if other != word_id and self.words[other]["meaning_key"] != word["meaning_key"]
+        ]
+        scored.sort(reverse=True)
+        self.neighbors[word_id] = [other for _, other in scored[:NEIGHBORS]]
+
+    # ---------- refresh ----------
+    async def refresh(self, db: AsyncSession):
+        async with self._lock:
+            watermark = await current_watermark(db)
+
+            if self.watermark is None:
+                rows = (await db.execute(select(*_COLUMNS))).all()
+                deleted: list[int] = []
+            else:
+                rows = (await db.execute(select(*_COLUMNS).where(Word.updated_at >= self.watermark))).all()
+                deleted = list((await db.execute(
+                    select(WordTombstone.word_id).where(WordTombstone.deleted_at >= self.watermark)
+                )).scalars())
+
+            dirty: set[int] = set()
+            for word_id in deleted:
+                dirty.update(self._remove(word_id))
+            for row in rows:
+                dirty.update(self._remove(row.id))
+                dirty.update(self._add(row))
+
+            for word_id in dirty:
+                if word_id in self.words:
+                    self._compute(word_id)
+            self.watermark = watermark
+
+    # ---------- lookup ----------
+    def distractors(self, word_id: int, k: int = OPTIONS - 1) -> list[str]:
+        """`k` wrong meanings for the word; falls back to the whole language when its bucket is small."""
+        word = self.words[word_id]
+        seen = {word["meaning_key"]}
+        picked: list[str] = []
+
+        # a neighbour may have been deleted since the list was computed
+        pool = [other for other in self.neighbors.get(word_id, []) if other in self.words]
+        for other in random.sample(pool, len(pool)):
+            if self.words[other]["meaning_key"] not in seen:
+                seen.add(self.words[other]["meaning_key"])
+                picked.append(self.words[other]["meaning"])
+            if len(picked) == k:
+                return picked
+
+        same_language = self.by_language[word["language"]]
+        for _ in range(min(len(same_language), k * 10)):
+            other = self.words[random.choice(same_language)]
+            if other["meaning_key"] not in seen:
+                seen.add(other["meaning_key"])
+                picked.append(other["meaning"])
+            if len(picked) == k:
+                break
+        return picked
+
+
+distractor_index = DistractorIndex()
+
+
+async def build_quiz(db: AsyncSession, word_ids: list[int], size: int) -> list[dict]:
+    """One question per word (in the given order) that has a meaning and enough distractors."""
+    await distractor_index.refresh(db)
+
+    questions = []
+    for word_id in word_ids:
+        word = distractor_index.words.get(word_id)
+        if word is None:
+            continue
+        wrong = distractor_index.distractors(word_id)
+        if len(wrong) < OPTIONS - 1:
+            continue
+
+        options = wrong + [word["meaning"]]
+        random.shuffle(options)
+        questions.append({
+            "word_id": word_id,
+            "lemma": word["lemma"],
+            "options": options,
+            "answer_index": options.index(word["meaning"]),
+        })
+        if len(questions) == size:
+            break
+    return questions
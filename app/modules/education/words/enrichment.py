@@ -0,0 +1,217 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select, update, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.modules.education.daily_vocab.models import DailyVocabWords
+from .dictionary import lookup_entries, normalize_entries
+from .models import (
+    Word,
+    WordExample,
+    WordSynonym,
+    DictionaryEnrichment,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 100
+CONCURRENCY = 5
+SKIP_DAYS = 30
+MAX_EXAMPLES = 3
+MAX_SYNONYMS = 10
+SOURCE = "dictionaryapi.dev"
+
+# one run per process; the admin endpoint reports this back
+state: dict = {"running": False, "started_at": None, "finished_at": None, "stats": None}
+
+
+# =====================================
+#  FETCH
+# =====================================
+async def _fetch(sem: asyncio.Semaphore, word: str) -> tuple[str, Optional[dict]]:
+    async with sem:
+        try:
+            entries = await lookup_entries(word)
+        except Exception as e:
+            logger.warning("Enrichment fetch failed for %r: %s", word, e)
+            return "error", None
+    if not entries:
+        return "not_found", None
+    return "ok", normalize_entries(entries)
+
+
+async def _pending(db: AsyncSession, target: str, model, key_column, last_id: int, cutoff: datetime, limit: int):
+    """Next rows after `last_id` that have no fresh ok/not_found enrichment."""
+    fresh = select(DictionaryEnrichment.target_id).where(
+        DictionaryEnrichment.target == target,
+        DictionaryEnrichment.status.in_(("ok", "not_found")),
+        DictionaryEnrichment.enriched_at >= cutoff,
+    )
+    stmt = select(model.id, key_column).where(model.id > last_id, model.id.not_in(fresh))
+    if model is Word:
+        stmt = stmt.where(Word.base_language == "en")
+    res = await db.execute(stmt.order_by(model.id).limit(limit))
+    return res.all()
+
+
+async def _record(db: AsyncSession, target: str, statuses: dict[int, str]):
+    now = datetime.utcnow()
+    await db.execute(
+        delete(DictionaryEnrichment).where(
+            DictionaryEnrichment.target == target,
+            DictionaryEnrichment.target_id.in_(list(statuses)),
+        )
+    )
+    await db.execute(
+        insert(DictionaryEnrichment),
+        [
+            {"target": target, "target_id": tid, "status": status, "enriched_at": now}
+            for tid, status in statuses.items()
+        ],
+    )
+
+
+# =====================================
+#  PERSIST
+# =====================================
+async def _apply_to_words(db: AsyncSession, found: dict[int, dict]):
+    """Fills empty Word columns and appends missing examples/synonyms, batch-wide."""
+    ids = list(found)
+    current = {
+        row.id: row
+        for row in await db.execute(
+            select(Word.id, Word.pos, Word.meaning, Word.transcription, Word.example_count)
+            .where(Word.id.in_(ids))
+        )
+    }
+
+    known_examples: dict[int, set[str]] = {wid: set() for wid in ids}
+    for word_id, text in await db.execute(
+        select(WordExample.word_id, WordExample.text).where(WordExample.word_id.in_(ids))
+    ):
+        known_examples[word_id].add(text.strip().lower())
+
+    known_synonyms: dict[int, set[str]] = {wid: set() for wid in ids}
+    for word_id, synonym in await db.execute(
+        select(WordSynonym.word_id, WordSynonym.synonym).where(WordSynonym.word_id.in_(ids))
+    ):
+        known_synonyms[word_id].add(synonym.strip().lower())
+
+    now = datetime.utcnow()
+    word_updates, new_examples, new_synonyms = [], [], []
+
+    for word_id, data in found.items():
+        row = current.get(word_id)
+        if row is None:
+            continue
+
+        examples = [
+            t for t in data["examples"] if t.strip().lower() not in known_examples[word_id]
+        ][:MAX_EXAMPLES]
+        synonyms = [
+            s for s in data["synonyms"] if s.strip().lower() not in known_synonyms[word_id]
+        ][:MAX_SYNONYMS]
+
+        changes = {
+            field: data[field]
+            for field in ("pos", "meaning", "transcription")
+            if not getattr(row, field) and data[field]
+        }
+        if examples:
+            changes["example_count"] = (row.example_count or 0) + len(examples)
+        # any new child row counts as a change: /words/sync and the distractor
+        # index only look at Word.updated_at
+        if changes or synonyms:
+            word_updates.append({"id": word_id, "updated_at": now, **changes})
+
+        new_examples += [{"word_id": word_id, "text": t, "source": SOURCE} for t in examples]
+        new_synonyms += [{"word_id": word_id, "synonym": s, "type": "near"} for s in synonyms]
+
+    if word_updates:
+        await db.execute(update(Word), word_updates)
+    if new_examples:
+        await db.execute(insert(WordExample), new_examples)
+    if new_synonyms:
+        await db.execute(insert(WordSynonym), new_synonyms)
+
+
+# =====================================
+#  JOB
+# =====================================
+async def _run_target(target: str, batch_size: int, concurrency: int, cutoff: datetime) -> dict:
+    model, key_column = (Word, Word.lemma) if target == "word" else (DailyVocabWords, DailyVocabWords.word)
+    sem = asyncio.Semaphore(concurrency)
+    stats = {"ok": 0, "not_found": 0, "error": 0}
+    last_id = 0
+
+    while True:
+        async with AsyncSessionLocal() as db: # type: ignore
+            rows = await _pending(db, target, model, key_column, last_id, cutoff, batch_size)
+            if not rows:
+                return stats
+
+            results = await asyncio.gather(*(_fetch(sem, key) for _, key in rows))
+            statuses = {row_id: status for (row_id, _), (status, _) in zip(rows, results)}
+
+            if target == "word":
+                found = {row_id: data for (row_id, _), (_, data) in zip(rows, results) if data}
+                if found:
+                    await _apply_to_words(db, found)
+
+            # state is committed with the data, so an interrupted run resumes here
+            await _record(db, target, statuses)
+            await db.commit()
+
+        for status in statuses.values():
+            stats[status] += 1
+        last_id = rows[-1][0]
+
+
+async def enrich_dictionary(
+    targets: tuple[str, ...] = ("word", "daily_vocab"),
+    batch_size: int = BATCH_SIZE,
+    concurrency: int = CONCURRENCY,
+    skip_days: int = SKIP_DAYS,
+) -> dict:
+    """
+    Walks Word (English only) and DailyVocabWords rows, fetching dictionary
+    data with bounded concurrency. Words get their empty columns, examples
+    and synonyms filled; daily words are warmed into `dictionary_cache`,
+    which is what /daily-words/select reads. Rows enriched (or confirmed
+    missing) within `skip_days` are skipped; failed lookups are retried on
+    the next run.
+    """
+    if state["running"]:
+        raise RuntimeError("Enrichment is already running")
+
+    state.update(running=True, started_at=datetime.utcnow(), finished_at=None)
+    cutoff = datetime.utcnow() - timedelta(days=skip_days)
+    stats: dict = {}
+    try:
+        for target in targets:
+            stats[target] = await _run_target(target, batch_size, concurrency, cutoff)
+            logger.info("Enrichment %s: %s", target, stats[target])
+        return stats
+    finally:
+        state.update(running=False, finished_at=datetime.utcnow(), stats=stats)
+
+
+if __name__ == "__main__":
+    # python -m app.modules.education.words.enrichment
+    import app.main  # noqa: F401  (registers every model with the mapper)
+    from app.core.database import engine, init_db
+    from app.core.http import close_http_client
+
+    async def main():
+        await init_db()
+        try:
+            print(await enrich_dictionary())
+        finally:
+            await close_http_client()
+            await engine.dispose()
+
+    asyncio.run(main())
@@ -0,0 +1,235 @@
+import csv
+import io
+import json
+from typing import Any
+
+from pydantic import ValidationError
+from sqlalchemy import select, insert, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import (
+    Word,
+    WordCategory,
+    WordCategoryItem,
+    WordExample,
+    WordSynonym,
+)
+from .schemas import WordCreate
+
+IMPORT_CHUNK_SIZE = 500
+
+# CSV list columns use ";" (examples use "|", since sentences contain ";")
+CSV_LIST_SEP = ";"
+CSV_EXAMPLE_SEP = "|"
+
+
+# =====================================
+#  PARSING
+# =====================================
+def _split(value: str | None, sep: str) -> list[str]:
+    if not value:
+        return []
+    return [v.strip() for v in value.split(sep) if v.strip()]
+
+
+def _csv_row_to_payload(row: dict) -> dict:
+    payload: dict[str, Any] = {
+        k: (v.strip() or None) if isinstance(v, str) else v
+        for k, v in row.items()
+        if k in ("lemma", "pos", "base_language", "meaning", "transcription", "difficulty")
+    }
+    if not payload.get("base_language"):
+        payload.pop("base_language", None)
+
+    payload["tags"] = _split(row.get("tags"), CSV_LIST_SEP) or None
+    payload["examples"] = [{"text": t} for t in _split(row.get("examples"), CSV_EXAMPLE_SEP)]
+    payload["synonyms"] = [{"synonym": s} for s in _split(row.get("synonyms"), CSV_LIST_SEP)]
+    payload["categories"] = _split(row.get("categories"), CSV_LIST_SEP)
+    if row.get("meta_data"):
+        payload["meta_data"] = json.loads(row["meta_data"])
+    return payload
+
+
+def parse_rows(content: bytes, fmt: str) -> list[dict]:
+    """
+    JSON: a list of `WordCreate` objects.
+    CSV: header row with lemma,pos,base_language,meaning,transcription,
+    difficulty,tags,examples,synonyms,categories[,meta_data].
+    """
+    text = content.decode("utf-8-sig")
+    if fmt == "json":
+        data = json.loads(text)
+        if not isinstance(data, list):
+            raise ValueError("JSON import must be a list of words")
+        return data
+    if fmt == "csv":
+        return list(csv.DictReader(io.StringIO(text)))
+    raise ValueError(f"Unsupported format: {fmt}")
+
+
+# =====================================
+#  IMPORT
+# =====================================
+def _chunks(items: list, size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+async def _existing_category_ids(db: AsyncSession, ids: set[int]) -> set[int]:
+    found: set[int] = set()
+    for chunk in _chunks(sorted(ids), IMPORT_CHUNK_SIZE):
+        res = await db.execute(select(WordCategory.id).where(WordCategory.id.in_(chunk)))
+        found.update(res.scalars().all())
+    return found
+
+
+async def _existing_pairs(db: AsyncSession, pairs: set[tuple[str, str]]) -> set[tuple[str, str]]:
+    found: set[tuple[str, str]] = set()
+    for chunk in _chunks(sorted(pairs), IMPORT_CHUNK_SIZE):
+        res = await db.execute(
+            select(Word.lemma, Word.base_language)
+            .where(tuple_(Word.lemma, Word.base_language).in_(chunk))
+        )
+        found.update((lemma, lang) for lemma, lang in res.all())
+    return found
+
+
+async def import_words(
+    db: AsyncSession,
+    raw_rows: list[dict],
+    fmt: str = "json",
+    dry_run: bool = False,
+) -> dict:
+    """
+    Validates every row up front (schema, category ids, duplicate
+    lemma/base_language pairs) with set-based queries, then inserts the
+    accepted rows and their children with executemany in chunks.
+    Row numbers in the report are 1-based data rows.
+    """
+    rejected: list[dict] = []
+    valid: list[tuple[int, WordCreate]] = []
+
+    for n, raw in enumerate(raw_rows, start=1):
+        try:
+            payload = _csv_row_to_payload(raw) if fmt == "csv" else raw
+            valid.append((n, WordCreate.model_validate(payload)))
+        except ValidationError as e:
+            err = e.errors()[0]
+            loc = ".".join(map(str, err["loc"]))
+            reason = f"{loc}: {err['msg']}" if loc else err["msg"]
+            lemma = raw.get("lemma") if isinstance(raw, dict) else None
+            rejected.append({"row": n, "lemma": lemma, "reason": reason})
+        except (ValueError, TypeError, AttributeError) as e:
+            rejected.append({"row": n, "lemma": None, "reason": str(e)})
+
+    category_ids = {cid for _, w in valid for cid in (w.categories or [])}
+    known_categories = await _existing_category_ids(db, category_ids) if category_ids else set()
+
+    pairs = {(w.lemma.strip(), w.base_language or "en") for _, w in valid}
+    existing = await _existing_pairs(db, pairs) if pairs else set()
+
+    accepted: list[WordCreate] = []
+    seen: set[tuple[str, str]] = set()
+    for n, w in valid:
+        key = (w.lemma.strip(), w.base_language or "en")
+        missing = sorted(set(w.categories or []) - known_categories)
+        if missing:
+            reason = f"Category {', '.join(map(str, missing))} not found"
+        elif key in existing:
+            reason = "Word already exists"
+        elif key in seen:
+            reason = "Duplicate in file"
+        else:
+            seen.add(key)
+            accepted.append(w)
+            continue
+        rejected.append({"row": n, "lemma": w.lemma, "reason": reason})
+
+    rejected.sort(key=lambda r: r["row"])
+    if dry_run or not accepted:
+        return {"total": len(raw_rows), "inserted": 0, "rejected": rejected}
+
+    for chunk in _chunks(accepted, IMPORT_CHUNK_SIZE):
+        res = await db.execute(
+            insert(Word).returning(Word.id, sort_by_parameter_order=True),
+            [
+                {
+                    "lemma": w.lemma.strip(),
+                    "pos": w.pos,
+                    "base_language": w.base_language or "en",
+                    "meaning": w.meaning,
+                    "transcription": w.transcription,
+                    "difficulty": w.difficulty,
+                    "tags": w.tags,
+                    "meta_data": w.meta_data,
+                    "example_count": len(w.examples or []),
+                }
+                for w in chunk
+            ],
+        )
+        word_ids = res.scalars().all()
+
+        examples, synonyms, items = [], [], []
+        for word_id, w in zip(word_ids, chunk):
+            examples += [
+                {
+                    "word_id": word_id,
+                    "text": ex.text,
+                    "translation": ex.translation,
+                    "source": ex.source,
+                    "is_preferred": ex.is_preferred,
+                }
+                for ex in w.examples or []
+            ]
+            synonyms += [
+                {"word_id": word_id, "synonym": s.synonym, "type": s.type}
+                for s in w.synonyms or []
+            ]
+            items += [
+                {"word_id": word_id, "category_id": cid}
+                for cid in dict.fromkeys(w.categories or [])
+            ]
+
+        if examples:
+            await db.execute(insert(WordExample), examples)
+        if synonyms:
+            await db.execute(insert(WordSynonym), synonyms)
+        if items:
+            await db.execute(insert(WordCategoryItem), items)
+
+    await db.commit()
+    return {"total": len(raw_rows), "inserted": len(accepted), "rejected": rejected}
+
+
+# =====================================
+#  CLI
+# =====================================
+async def _import_file(path: str, dry_run: bool) -> dict:
+    import app.main  # noqa: F401  (registers every model with the mapper)
+    from app.core.database import AsyncSessionLocal, engine, init_db
+
+    fmt = "csv" if path.lower().endswith(".csv") else "json"
+    with open(path, "rb") as f:
+        rows = parse_rows(f.read(), fmt)
+
+    await init_db()
+    try:
+        async with AsyncSessionLocal() as db: # type: ignore
+            return await import_words(db, rows, fmt=fmt, dry_run=dry_run)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    # python -m app.modules.education.words.importer words.csv [--dry-run]
+    import asyncio
+    import sys
+
+    args = [a for a in sys.argv[1:] if a != "--dry-run"]
+    if len(args) != 1:
+        sys.exit("Usage: python -m app.modules.education.words.importer <file.csv|file.json> [--dry-run]")
+
+    report = asyncio.run(_import_file(args[0], "--dry-run" in sys.argv))
+    print(f"✅ Inserted: {report['inserted']} / {report['total']}")
+    for r in report["rejected"]:
+        print(f"⚠️ Row {r['row']} ({r['lemma']}): {r['reason']}")
@@ -109,9 +109,21 @@ class Word(Base):
 
     __table_args__ = (
         Index("ix_words_lemma_base", "lemma", "base_language"),
+        Index("ix_words_updated_at", "updated_at", "id"),
     )
 
 
+# =====================================
+#  TOMBSTONES (offline sync)
+# =====================================
+class WordTombstone(Base):
+    __tablename__ = "word_tombstones"
+
+    id = Column(Integer, primary_key=True)
+    word_id = Column(Integer, nullable=False, index=True)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+
 class WordExample(Base):
     __tablename__ = "word_examples"
 
@@ -166,6 +178,11 @@ class UserWord(Base):
     word = relationship("Word", lazy="joined")
     user = relationship("User", back_populates="user_words", lazy="joined")
 
+    __table_args__ = (
+        Index("uq_user_word", "user_id", "word_id", unique=True),
+        Index("ix_user_words_user_next_review", "user_id", "next_review_at"),
+    )
+
 
 class UserWordHistory(Base):
     __tablename__ = "user_word_history"
@@ -182,3 +199,34 @@ class UserWordHistory(Base):
     meta = Column(JSON)
 
     user_word = relationship("UserWord", lazy="joined")
+
+
+# =====================================
+#  DICTIONARY CACHE (dictionaryapi.dev)
+# =====================================
+class DictionaryCacheEntry(Base):
+    __tablename__ = "dictionary_cache"
+
+    word = Column(String(255), primary_key=True)   # lower-cased lookup key
+    found = Column(Boolean, nullable=False, default=True)
+    payload = Column(JSON, nullable=True)          # raw upstream entries, NULL when not found
+
+    fetched_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+
+# =====================================
+#  DICTIONARY ENRICHMENT STATE
+# =====================================
+class DictionaryEnrichment(Base):
+    __tablename__ = "dictionary_enrichment"
+
+    id = Column(Integer, primary_key=True)
+    target = Column(String(20), nullable=False)      # word | daily_vocab
+    target_id = Column(Integer, nullable=False)
+    status = Column(String(20), nullable=False)      # ok | not_found | error
+    enriched_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("target", "target_id", name="uq_enrichment_target"),
+    )
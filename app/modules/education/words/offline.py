@@ -0,0 +1,194 @@
+"""
+Offline dictionary index.
+
+Binary layout (little-endian):
+
+    header   MAGIC(4) version(u16) reserved(u16) count(u32)
+             keys_offset(u64) records_offset(u64)
+    index    count x (key_off u64, key_len u32, rec_off u64, rec_len u32),
+             sorted by the UTF-8 bytes of the key
+    keys     concatenated UTF-8 keys
+    records  concatenated zlib-compressed JSON lists of dictionaryapi.dev
+             shaped entries
+
+The file is opened with mmap, so every uvicorn worker shares the same pages
+from the OS page cache and lookups are a binary search over the index.
+"""
+import csv
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from collections import defaultdict
+from typing import Optional
+
+from app.core.config import DICTIONARY_INDEX_PATH
+
+MAGIC = b"ENWD"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIQQ")
+ENTRY = struct.Struct("<QIQI")
+
+
+# =====================================
+#  BUILD
+# =====================================
+def _load_source(path: str) -> dict[str, list]:
+    """
+    JSON: a list of dictionaryapi.dev entries (each with "word") or a
+    {word: [entries]} mapping.
+    CSV: word,phonetic,part_of_speech,definition,example,synonyms
+    (one definition per row, synonyms separated by ";").
+    """
+    grouped: dict[str, list] = defaultdict(list)
+
+    if path.lower().endswith(".csv"):
+        meanings: dict[tuple[str, str], dict] = {}
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                word = (row.get("word") or "").strip()
+                if not word or not row.get("definition"):
+                    continue
+                key = word.lower()
+                if not grouped[key]:
+                    grouped[key].append({"word": word, "phonetic": row.get("phonetic") or None, "meanings": []})
+                pos = (row.get("part_of_speech") or "").strip()
+                meaning = meanings.get((key, pos))
+                if meaning is None:
+                    meaning = meanings[(key, pos)] = {"partOfSpeech": pos or None, "definitions": []}
+                    grouped[key][0]["meanings"].append(meaning)
+                meaning["definitions"].append({
+                    "definition": row["definition"].strip(),
+                    "example": (row.get("example") or "").strip() or None,
+                    "synonyms": [s.strip() for s in (row.get("synonyms") or "").split(";") if s.strip()],
+                })
+        return grouped
+
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        for word, entries in data.items():
+            grouped[word.strip().lower()].extend(entries if isinstance(entries, list) else [entries])
+    else:
+        for entry in data:
+            if entry.get("word"):
+                grouped[entry["word"].strip().lower()].append(entry)
+    return grouped
+
+
+def build_index(source_path: str, output_path: str = DICTIONARY_INDEX_PATH) -> int:
+    """Compiles a JSON/CSV dataset into the binary index; returns the word count."""
+    grouped = _load_source(source_path)
+    items = sorted(
+        ((key.encode("utf-8"), entries) for key, entries in grouped.items() if key),
+        key=lambda kv: kv[0],
+    )
+
+    keys_blob = bytearray()
+    records_blob = bytearray()
+    index = bytearray()
+    for key, entries in items:
+        record = zlib.compress(json.dumps(entries, ensure_ascii=False, separators=(",", ":")).encode(), 9)
+        index += ENTRY.pack(len(keys_blob), len(key), len(records_blob), len(record))
+        keys_blob += key
+        records_blob += record
+
+    keys_offset = HEADER.size + len(index)
+    records_offset = keys_offset + len(keys_blob)
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(items), keys_offset, records_offset))
+        f.write(index)
+        f.write(keys_blob)
+        f.write(records_blob)
+    # atomic swap: running workers keep their old mapping until reload()
+    os.replace(tmp_path, output_path)
+    return len(items)
+
+
+# =====================================
+#  LOOKUP
+# =====================================
+class OfflineDictionary:
+    def __init__(self, path: str = DICTIONARY_INDEX_PATH):
+        self.path = path
+        self._mm: Optional[mmap.mmap] = None
+        self._count = 0
+        self._keys_offset = 0
+        self._records_offset = 0
+        self._opened = False
+        self._lock = threading.Lock()
+
+    def _open(self):
+        with self._lock:
+            if self._opened:
+                return
+            self._opened = True
+            if not os.path.exists(self.path):
+                return
+
+            with open(self.path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, version, _, count, keys_offset, records_offset = HEADER.unpack_from(mm, 0)
+            if magic != MAGIC or version != VERSION:
+                mm.close()
+                raise ValueError(f"{self.path} is not a v{VERSION} dictionary index")
+
+            self._mm, self._count = mm, count
+            self._keys_offset, self._records_offset = keys_offset, records_offset
+
+    def reload(self):
+        with self._lock:
+            if self._mm is not None:
+                self._mm.close()
+            self._mm, self._opened = None, False
+
+    def __len__(self) -> int:
+        self._open()
+        return self._count
+
+    def _key_at(self, i: int) -> tuple[bytes, int, int]:
+        key_off, key_len, rec_off, rec_len = ENTRY.unpack_from(self._mm, HEADER.size + i * ENTRY.size) # type: ignore
+        start = self._keys_offset + key_off
+        return self._mm[start:start + key_len], rec_off, rec_len # type: ignore
+
+    def get(self, word: str) -> Optional[list]:
+        """Entries for `word`, or None when the dataset doesn't have it."""
+        self._open()
+        if self._mm is None:
+            return None
+
+        target = word.strip().lower().encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key, rec_off, rec_len = self._key_at(mid)
+            if key < target:
+                lo = mid + 1
+            elif key > target:
+                hi = mid
+            else:
+                start = self._records_offset + rec_off
+                return json.loads(zlib.decompress(self._mm[start:start + rec_len]))
+        return None
+
+
+offline_dictionary = OfflineDictionary()
+
+
+if __name__ == "__main__":
+    # python -m app.modules.education.words.offline <dataset.json|dataset.csv> [output.idx]
+    import sys
+
+    if len(sys.argv) not in (2, 3):
+        sys.exit("Usage: python -m app.modules.education.words.offline <dataset.json|dataset.csv> [output.idx]")
+
+    out = sys.argv[2] if len(sys.argv) == 3 else DICTIONARY_INDEX_PATH
+    total = build_index(sys.argv[1], out)
+    print(f"✅ Indexed {total} words into {out}")
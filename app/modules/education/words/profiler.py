@@ -0,0 +1,200 @@
+"""
+Lexical profiler for exam passages.
+
+The word bank (`Word.lemma`/`Word.difficulty` and `DailyVocabWords.level`)
+is compiled once into a {lemma: level} dict shared by every request in the
+process; it is rebuilt only when a write to either table has bumped the
+shared "lexical_index" version (app/core/versions.py).
+Profiling itself is pure Python over that dict, so a 1,000-word passage
+takes a few milliseconds.
+"""
+import asyncio
+import re
+from collections import Counter
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.versions import get_version, track_writes
+from app.modules.education.daily_vocab.models import DailyVocabWords
+from .models import Word
+
+CEFR_LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
+OFF_LIST = "off_list"
+# share of known running words a reader needs for unassisted reading
+COVERAGE_TARGET = 0.95
+OFF_LIST_LIMIT = 50
+INDEX_VERSION = "lexical_index"
+
+_TOKEN_RE = re.compile(r"[a-z]+(?:'[a-z]+)?")
+_SENTENCE_RE = re.compile(r"[.!?]+(?:\s|$)")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouy]+")
+
+
+def _level(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    value = value.strip()
+    return value.upper() if value.upper() in CEFR_LEVELS else value.lower()
+
+
+def _easier(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    """CEFR levels win over free-form difficulty labels; the lower CEFR level wins."""
+    if a is None or b is None:
+        return a or b
+    rank_a = CEFR_LEVELS.index(a) if a in CEFR_LEVELS else len(CEFR_LEVELS)
+    rank_b = CEFR_LEVELS.index(b) if b in CEFR_LEVELS else len(CEFR_LEVELS)
+    return a if rank_a <= rank_b else b
+
+
+class LexicalIndex:
+    def __init__(self):
+        self.levels: dict[str, str] = {}
+        self.version: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    async def ensure(self, db: AsyncSession):
+        version = await get_version(db, INDEX_VERSION)
+        if version == self.version:
+            return
+
+        async with self._lock:
+            if version == self.version:
+                return
+
+            levels: dict[str, str] = {}
+            words = await db.execute(
+                select(Word.lemma, Word.difficulty).where(Word.base_language == "en")
+            )
+            daily = await db.execute(select(DailyVocabWords.word, DailyVocabWords.level))
+            for lemma, level in [*words, *daily]:
+                key, level = lemma.strip().lower(), _level(level)
+                if key and level:
+                    levels[key] = _easier(levels.get(key), level) # type: ignore
+
+            # swap in one assignment so concurrent readers never see a half-built dict
+            self.levels, self.version = levels, version
+
+    def lookup(self, token: str) -> Optional[str]:
+        """Level of the token or of its base form after stripping common inflections."""
+        levels = self.levels
+        if token in levels:
+            return levels[token]
+        if token.endswith("'s"):
+            token = token[:-2]
+            if token in levels:
+                return levels[token]
+
+        for suffix, replacement in (
+            ("ies", "y"), ("ied", "y"), ("es", ""), ("s", ""),
+            ("ed", ""), ("ed", "e"), ("ing", ""), ("ing", "e"),
+            ("er", ""), ("est", ""), ("ly", ""),
+        ):
+            if token.endswith(suffix) and len(token) > len(suffix) + 2:
+                base = token[: -len(suffix)] + replacement
+                if base in levels:
+                    return levels[base]
+                # stopped -> stop, running -> run
+                if not replacement and len(base) > 2 and base[-1] == base[-2] and base[:-1] in levels:
+                    return levels[base[:-1]]
+        return None
+
+
+lexical_index = LexicalIndex()
+
+track_writes(INDEX_VERSION, Word, DailyVocabWords)
+
+
+def _syllables(word: str) -> int:
+    count = len(_VOWEL_GROUP_RE.findall(word))
+    if word.endswith("e") and not word.endswith(("le", "ee")) and count > 1:
+        count -= 1
+    return max(count, 1)
+
+
+def _readability(text: str, tokens: list[str]) -> dict:
+    words = len(tokens)
+    sentences = max(len(_SENTENCE_RE.findall(text.strip() + " ")), 1)
+    syllables = sum(_syllables(t) for t in tokens)
+    words_per_sentence = words / sentences
+    syllables_per_word = syllables / words
+
+    return {
+        "sentences": sentences,
+        "avg_sentence_length": round(words_per_sentence, 2),
+        "avg_syllables_per_word": round(syllables_per_word, 2),
+        "avg_word_length": round(sum(map(len, tokens)) / words, 2),
+        "type_token_ratio": round(len(set(tokens)) / words, 3),
+        "flesch_reading_ease": round(206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word, 1),
+        "flesch_kincaid_grade": round(0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59, 1),
+    }
+
+
+def profile_text(text: str, declared_level: Optional[str] = None) -> dict:
+    """Coverage per level, off-list words and readability for one passage; call `lexical_index.ensure` first."""
+    tokens = _TOKEN_RE.findall((text or "").lower().replace("’", "'"))
+    if not tokens:
+        return {
+            "token_count": 0,
+            "unique_tokens": 0,
+            "coverage": {},
+            "cumulative_coverage": {},
+            "off_list_ratio": 0.0,
+            "off_list": [],
+            "estimated_level": None,
+            "declared_level": declared_level,
+            "level_matches": None,
+            "readability": {},
+        }
+
+    counts = Counter(tokens)
+    by_level: Counter = Counter()
+    off_list: Counter = Counter()
+    for token, n in counts.items():
+        level = lexical_index.lookup(token)
+        if level is None:
+            off_list[token] = n
+            level = OFF_LIST
+        by_level[level] += n
+
+    total = len(tokens)
+    coverage = {level: round(n / total, 4) for level, n in sorted(by_level.items())}
+
+    cumulative, running, estimated = {}, 0, None
+    for level in CEFR_LEVELS:
+        running += by_level.get(level, 0)
+        cumulative[level] = round(running / total, 4)
+        if estimated is None and running / total >= COVERAGE_TARGET:
+            estimated = level
+
+    declared = _level(declared_level)
+    return {
+        "token_count": total,
+        "unique_tokens": len(counts),
+        "coverage": coverage,
+        "cumulative_coverage": cumulative,
+        "off_list_ratio": round(by_level[OFF_LIST] / total, 4),
+        "off_list": [token for token, _ in off_list.most_common(OFF_LIST_LIMIT)],
+        "estimated_level": estimated,
+        "declared_level": declared_level,
+        "level_matches": (estimated == declared) if declared in CEFR_LEVELS else None,
+        "readability": _readability(text, tokens),
+    }
+
+
+async def profile_passages(
+    db: AsyncSession,
+    parts: list[tuple[int, Optional[str]]],
+    declared_level: Optional[str] = None,
+) -> dict:
+    """Profiles every (part_id, passage) separately plus all passages together."""
+    await lexical_index.ensure(db)
+    parts = [(part_id, passage) for part_id, passage in parts if passage]
+    return {
+        "overall": profile_text("\n".join(passage for _, passage in parts), declared_level), # type: ignore
+        "parts": [
+            {"part_id": part_id, **profile_text(passage, declared_level)} # type: ignore
+            for part_id, passage in parts
+        ],
+    }
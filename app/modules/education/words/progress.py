@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, func, case
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import MISSING, TTLCache
+from .models import SRSStage, UserWord
+
+# per-user counters; review/add endpoints drop the entry right after commit
+_progress_cache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def invalidate_progress(user_id: int):
+    _progress_cache.delete(user_id)
+
+
+async def get_progress(db: AsyncSession, user_id: int) -> dict:
+    """Stage counts and due/mastered counters for one deck from a single grouped query."""
+    cached = _progress_cache.get(user_id)
+    if cached is not MISSING:
+        return cached
+
+    now = datetime.utcnow()
+    end_of_today = datetime(now.year, now.month, now.day) + timedelta(days=1)
+    end_of_week = end_of_today + timedelta(days=6)
+    month_start = datetime(now.year, now.month, 1)
+
+    rows = await db.execute(
+        select(
+            UserWord.stage,
+            func.count(UserWord.id),
+            func.sum(case((UserWord.next_review_at < end_of_today, 1), else_=0)),
+            func.sum(case((UserWord.next_review_at < end_of_week, 1), else_=0)),
+            func.sum(case((UserWord.last_reviewed_at >= month_start, 1), else_=0)),
+        )
+        .where(UserWord.user_id == user_id)
+        .group_by(UserWord.stage)
+    )
+
+    progress = {
+        "total": 0,
+        "stages": {stage.name.lower(): 0 for stage in SRSStage},
+        "due_today": 0,
+        "due_this_week": 0,
+        "mastered_this_month": 0,
+    }
+    for stage, count, due_today, due_week, reviewed_this_month in rows:
+        progress["total"] += count
+        progress["stages"][SRSStage(stage).name.lower()] = count
+        progress["due_today"] += due_today or 0
+        progress["due_this_week"] += due_week or 0
+        if stage == SRSStage.MASTERED:
+            # no per-card transition log: counts cards currently MASTERED whose
+            # latest review happened this month
+            progress["mastered_this_month"] = reviewed_this_month or 0
+
+    _progress_cache.set(user_id, progress)
+    return progress
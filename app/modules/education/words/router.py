@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import random
 from typing import List, Optional
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, func, String
+from sqlalchemy import select, insert, exists, literal, or_, func, String
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import noload
 
 from app.core.database import get_db
 from app.modules.auth.dependencies import get_current_user
 from app.modules.users.models import User
+from app.modules.stats.events import track_activity
+from share.pagination import Page, PageParams, Paginator, page_params
 from .models import (
     Word,
     WordCategory,
@@ -18,6 +24,8 @@ from .models import (
     WordSynonym,
     UserWord,
     UserWordHistory,
+    WordTombstone,
+    SRSStage,
 )
 from .schemas import (
     WordCreate,
@@ -26,9 +34,32 @@ from .schemas import (
     WordCategoryCreate,
     WordCategoryOut,
     WordCategoryUpdate,
+    WordCategorySummary,
+    CategoryWordItem,
     UserWordAdd,
+    UserWordBulkAdd,
+    UserWordBulkResult,
     UserWordOut,
+    UserWordProgress,
     ReviewAttempt,
+    QuizOut,
+    LexicalProfile,
+    LexicalProfileRequest,
+    WordSyncResponse,
+    WordImportReport,
+)
+from .importer import import_words, parse_rows
+from . import enrichment
+from .categories import get_category_summary, list_category_words
+from .distractors import build_quiz
+from .profiler import lexical_index, profile_text
+from .progress import get_progress, invalidate_progress
+from .sync import (
+    current_watermark,
+    decode_sync_token,
+    encode_sync_token,
+    get_delta,
+    stream_words_ndjson,
 )
 
 router = APIRouter(prefix="/words", tags=["Words"])
@@ -75,12 +106,33 @@ async def list_categories(
     q: Optional[str] = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
-    stmt = select(WordCategory)
+    stmt = select(WordCategory).options(noload(WordCategory.items))
     if q:
         stmt = stmt.where(WordCategory.title.ilike(f"%{q}%"))
     res = await db.execute(stmt)
     return res.scalars().all()
 
+
+@router.get("/categories/summary", response_model=List[WordCategorySummary])
+async def categories_summary(
+    q: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """Categories with word counts and difficulty distribution (no word rows)."""
+    return await get_category_summary(db, q)
+
+
+@router.get("/categories/select/{category_id}/words", response_model=Page[CategoryWordItem])
+async def category_words(
+    category_id: int,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_db),
+):
+    exists = await db.scalar(select(WordCategory.id).where(WordCategory.id == category_id))
+    if not exists:
+        raise HTTPException(404, "Category not found")
+    return await list_category_words(db, category_id, page)
+
 @router.get("/all", response_model=list[WordOut])
 async def get_all_words(
     db: AsyncSession = Depends(get_db),
@@ -89,6 +141,33 @@ async def get_all_words(
     return result.scalars().all()
 
 
+@router.get("/export")
+async def export_words(db: AsyncSession = Depends(get_db)):
+    """
+    Full dictionary as NDJSON (one word per line). The `X-Sync-Token`
+    header is the starting point for subsequent `/words/sync` calls.
+    """
+    token = encode_sync_token(await current_watermark(db))
+    return StreamingResponse(
+        stream_words_ndjson(),
+        media_type="application/x-ndjson",
+        headers={"X-Sync-Token": token},
+    )
+
+
+@router.get("/sync", response_model=WordSyncResponse)
+async def sync_words(
+    token: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Words changed and ids deleted since `token`. `full_resync` means the
+    client must download `/words/export` again.
+    """
+    since = decode_sync_token(token) if token else None
+    return await get_delta(db, since)
+
+
 @router.get("/search", response_model=List[WordOut])
 async def search_words(
     q: Optional[str] = None,
@@ -110,6 +189,20 @@ async def search_words(
     return res.scalars().all()
 
 
+@router.post("/profile", response_model=LexicalProfile)
+async def profile_passage(
+    payload: LexicalProfileRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Lexical profile of arbitrary text against the word bank (e.g. a draft passage)."""
+    if current_user.role not in ADMIN_ROLES:
+        raise HTTPException(403, "Forbidden")
+
+    await lexical_index.ensure(db)
+    return profile_text(payload.text, payload.level)
+
+
 @router.get("/select/{word_id}", response_model=WordOut)
 async def get_word(word_id: int, db: AsyncSession = Depends(get_db)):
     word = await db.scalar(select(Word).where(Word.id == word_id))
@@ -117,17 +210,65 @@ async def get_word(word_id: int, db: AsyncSession = Depends(get_db)):
         raise HTTPException(404, "Word not found")
     return word
 
-@router.get("/user", response_model=List[UserWordOut])
+USER_WORDS_PAGE = Paginator(
+    UserWord.id,
+    sort={"created_at": UserWord.created_at, "next_review_at": UserWord.next_review_at},
+    filters={"stage": UserWord.stage},
+)
+
+
+@router.get("/user", response_model=Page[UserWordOut])
 async def list_user_words(
     due_only: bool = False,
+    stage: Optional[SRSStage] = None,
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     stmt = select(UserWord).where(UserWord.user_id == current_user.id)
     if due_only:
         stmt = stmt.where(UserWord.next_review_at <= datetime.utcnow())
-    res = await db.execute(stmt)
-    return res.scalars().all()
+    return await USER_WORDS_PAGE.page(db, stmt, page, stage=stage)
+
+
+@router.get("/quiz", response_model=QuizOut)
+async def generate_quiz(
+    category_id: Optional[int] = None,
+    size: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Multiple-choice drill: from a category when `category_id` is given,
+    otherwise from the caller's due cards (most overdue first).
+    """
+    if category_id is not None:
+        ids = list((await db.execute(
+            select(WordCategoryItem.word_id).where(WordCategoryItem.category_id == category_id)
+        )).scalars())
+        if not ids:
+            raise HTTPException(404, "Category not found or empty")
+        random.shuffle(ids)
+    else:
+        ids = list((await db.execute(
+            select(UserWord.word_id)
+            .where(
+                UserWord.user_id == current_user.id,
+                or_(UserWord.next_review_at.is_(None), UserWord.next_review_at <= datetime.utcnow()),
+            )
+            .order_by(UserWord.next_review_at)
+            .limit(size * 2)
+        )).scalars())
+
+    return {"questions": await build_quiz(db, ids, size)}
+
+
+@router.get("/user/progress", response_model=UserWordProgress)
+async def user_progress(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return await get_progress(db, current_user.id) # type: ignore
 
 
 @router.post("/user/{user_word_id}/review")
@@ -160,6 +301,8 @@ async def review_word(
     )
 
     await db.commit()
+    invalidate_progress(current_user.id) # type: ignore
+    track_activity(current_user.id, "word_review", score=payload.quality * 20) # type: ignore
     return {"next_review_at": uw.next_review_at, "stage": uw.stage}
 
 
@@ -233,6 +376,49 @@ async def create_word(
     await db.refresh(word)
     return word
 
+@router.post("/import", response_model=WordImportReport)
+async def import_words_file(
+    file: UploadFile = File(...),
+    dry_run: bool = False,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Bulk import from a CSV or JSON file; invalid rows are reported, not raised."""
+    if current_user.role not in ADMIN_ROLES:
+        raise HTTPException(403, "Forbidden")
+
+    fmt = "csv" if (file.filename or "").lower().endswith(".csv") else "json"
+    try:
+        rows = parse_rows(await file.read(), fmt)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(400, f"Invalid {fmt} file: {e}")
+
+    return await import_words(db, rows, fmt=fmt, dry_run=dry_run)
+
+
+@router.post("/enrich", status_code=202)
+async def start_enrichment(
+    background_tasks: BackgroundTasks,
+    skip_days: int = Query(enrichment.SKIP_DAYS, ge=0),
+    current_user: User = Depends(get_current_user),
+):
+    """Starts the dictionary enrichment job in the background."""
+    if current_user.role not in ADMIN_ROLES:
+        raise HTTPException(403, "Forbidden")
+    if enrichment.state["running"]:
+        raise HTTPException(409, "Enrichment is already running")
+
+    background_tasks.add_task(enrichment.enrich_dictionary, skip_days=skip_days)
+    return {"message": "Enrichment started"}
+
+
+@router.get("/enrich/status")
+async def enrichment_status(current_user: User = Depends(get_current_user)):
+    if current_user.role not in ADMIN_ROLES:
+        raise HTTPException(403, "Forbidden")
+    return enrichment.state
+
+
 @router.post("/user/add_word", response_model=UserWordOut, status_code=201)
 async def add_user_word(
     payload: UserWordAdd,
@@ -251,10 +437,70 @@ async def add_user_word(
     uw = UserWord(user_id=current_user.id, word_id=payload.word_id)
     db.add(uw)
     await db.commit()
+    invalidate_progress(current_user.id) # type: ignore
     await db.refresh(uw)
     return uw
 
 
+@router.post("/user/add_bulk", response_model=UserWordBulkResult, status_code=201)
+async def add_user_words_bulk(
+    payload: UserWordBulkAdd,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Adds a whole category or a list of word ids to the caller's deck with a
+    single INSERT ... SELECT ... WHERE NOT EXISTS; words already in the deck
+    (or unknown ids) are counted as skipped.
+    """
+    if (payload.category_id is None) == (not payload.word_ids):
+        raise HTTPException(400, "Send either category_id or word_ids")
+
+    if payload.category_id is not None:
+        found = await db.scalar(select(WordCategory.id).where(WordCategory.id == payload.category_id))
+        if not found:
+            raise HTTPException(404, "Category not found")
+        source_ids = select(WordCategoryItem.word_id).where(
+            WordCategoryItem.category_id == payload.category_id
+        )
+        requested = await db.scalar(
+            select(func.count(WordCategoryItem.id)).where(
+                WordCategoryItem.category_id == payload.category_id
+            )
+        )
+    else:
+        ids = sorted(set(payload.word_ids)) # type: ignore
+        source_ids = select(Word.id).where(Word.id.in_(ids))
+        requested = len(ids)
+
+    source = source_ids.subquery()
+    stmt = insert(UserWord).from_select(
+        ["user_id", "word_id"],
+        select(literal(current_user.id), source.c[0]).where(
+            ~exists().where(
+                UserWord.user_id == current_user.id,
+                UserWord.word_id == source.c[0],
+            )
+        ),
+    )
+
+    # the unique (user_id, word_id) index makes a concurrent duplicate fail;
+    # the retry's NOT EXISTS then skips the rows the other request added
+    for attempt in range(2):
+        try:
+            res = await db.execute(stmt)
+            await db.commit()
+            break
+        except IntegrityError:
+            await db.rollback()
+            if attempt:
+                raise HTTPException(409, "Deck was modified concurrently, try again")
+
+    invalidate_progress(current_user.id) # type: ignore
+    inserted = res.rowcount or 0
+    return {"inserted": inserted, "skipped": max((requested or 0) - inserted, 0)}
+
+
 @router.patch("/categories/select/{category_id}", response_model=WordCategoryOut)
 async def update_category(
     category_id: int,
@@ -293,3 +539,21 @@ async def update_word(
     await db.commit()
     await db.refresh(word)
     return word
+
+
+@router.delete("/delete/{word_id}", status_code=204)
+async def delete_word(
+    word_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    if current_user.role not in ADMIN_ROLES:
+        raise HTTPException(403, "Forbidden")
+
+    word = await db.get(Word, word_id)
+    if not word:
+        raise HTTPException(404, "Word not found")
+
+    await db.delete(word)
+    db.add(WordTombstone(word_id=word_id))
+    await db.commit()
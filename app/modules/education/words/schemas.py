@@ -41,6 +41,27 @@ class WordCategoryOut(WordCategoryBase):
         from_attributes = True
 
 
+class WordCategorySummary(BaseModel):
+    id: int
+    title: str
+    description: Optional[str] = None
+    language: Optional[str] = None
+    icon: Optional[str] = None
+    is_active: Optional[bool] = None
+    word_count: int = 0
+    difficulty: dict[str, int] = {}
+
+
+class CategoryWordItem(BaseModel):
+    id: int
+    lemma: str
+    pos: Optional[str] = None
+    meaning: Optional[str] = None
+    transcription: Optional[str] = None
+    difficulty: Optional[str] = None
+    custom_note: Optional[str] = None
+
+
 # ------------------------------
 # WORD EXAMPLE
 # ------------------------------
@@ -167,6 +188,35 @@ class UserWordAdd(BaseModel):
     word_id: int
 
 
+class UserWordBulkAdd(BaseModel):
+    category_id: Optional[int] = None
+    word_ids: Optional[List[int]] = None
+
+
+class UserWordBulkResult(BaseModel):
+    inserted: int
+    skipped: int
+
+
+class QuizQuestion(BaseModel):
+    word_id: int
+    lemma: str
+    options: List[str]
+    answer_index: int
+
+
+class QuizOut(BaseModel):
+    questions: List[QuizQuestion]
+
+
+class UserWordProgress(BaseModel):
+    total: int
+    stages: dict[str, int]
+    due_today: int
+    due_this_week: int
+    mastered_this_month: int
+
+
 class UserWordUpdate(UserWordBase):
     pass
 
@@ -196,3 +246,77 @@ class UserWordOut(BaseModel):
 class ReviewAttempt(BaseModel):
     word_id: int
     quality: int = Field(..., ge=0, le=5)  # SM-2 quality response 0–5
+
+
+# ------------------------------
+# OFFLINE SYNC
+# ------------------------------
+
+class WordSyncExample(BaseModel):
+    id: int
+    text: str
+    translation: Optional[str] = None
+    source: Optional[str] = None
+    is_preferred: bool = False
+
+
+class WordSyncItem(WordBase):
+    id: int
+    example_count: Optional[int] = 0
+    updated_at: datetime
+    examples: List[WordSyncExample] = []
+    synonyms: List[WordSynonymBase] = []
+    category_ids: List[int] = []
+
+
+class WordSyncResponse(BaseModel):
+    sync_token: str
+    full_resync: bool = False
+    updated: List[WordSyncItem] = []
+    deleted: List[int] = []
+
+
+# ------------------------------
+# BULK IMPORT
+# ------------------------------
+
+class WordImportRejected(BaseModel):
+    row: int
+    lemma: Optional[str] = None
+    reason: str
+
+
+class WordImportReport(BaseModel):
+    total: int
+    inserted: int
+    rejected: List[WordImportRejected] = []
+
+
+# ------------------------------
+# LEXICAL PROFILE
+# ------------------------------
+class LexicalProfileRequest(BaseModel):
+    text: str
+    level: Optional[str] = None
+
+
+class LexicalProfile(BaseModel):
+    token_count: int
+    unique_tokens: int
+    coverage: dict[str, float]
+    cumulative_coverage: dict[str, float]
+    off_list_ratio: float
+    off_list: List[str]
+    estimated_level: Optional[str] = None
+    declared_level: Optional[str] = None
+    level_matches: Optional[bool] = None
+    readability: dict[str, float]
+
+
+class PassageProfile(LexicalProfile):
+    part_id: int
+
+
+class LexicalProfileReport(BaseModel):
+    overall: LexicalProfile
+    parts: List[PassageProfile]
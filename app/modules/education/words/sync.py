@@ -0,0 +1,179 @@
+import base64
+import json
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Iterable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from share.export import ndjson_line
+from .models import (
+    Word,
+    WordExample,
+    WordSynonym,
+    WordCategoryItem,
+    WordTombstone,
+)
+
+EXPORT_BATCH_SIZE = 500
+DELTA_MAX_ITEMS = 5000
+
+# SQLite `CURRENT_TIMESTAMP` has second resolution, so the watermark is
+# rewound a little: rows written in the same second as the previous sync are
+# sent again and clients simply upsert them by id.
+SYNC_OVERLAP = timedelta(seconds=1)
+
+WORD_COLUMNS = (
+    Word.id,
+    Word.lemma,
+    Word.pos,
+    Word.base_language,
+    Word.meaning,
+    Word.transcription,
+    Word.difficulty,
+    Word.tags,
+    Word.meta_data,
+    Word.example_count,
+    Word.updated_at,
+)
+
+
+# =====================================
+#  SYNC TOKEN
+# =====================================
+def encode_sync_token(watermark: datetime) -> str:
+    raw = json.dumps({"ts": watermark.isoformat()}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_sync_token(token: str) -> datetime:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(payload["ts"])
+    except Exception:
+        raise HTTPException(400, "Invalid sync token")
+
+
+async def current_watermark(db: AsyncSession) -> datetime:
+    """DB clock (not the app clock) minus the overlap window."""
+    now = await db.scalar(select(func.now()))
+    if isinstance(now, str):
+        now = datetime.fromisoformat(now)
+    return now.replace(tzinfo=None) - SYNC_OVERLAP # type: ignore
+
+
+# =====================================
+#  ROW LOADING
+# =====================================
+async def load_children(db: AsyncSession, word_ids: list[int]) -> dict[int, dict]:
+    """Examples, synonyms and category ids for a batch of words, one query each."""
+    children: dict[int, dict] = {
+        wid: {"examples": [], "synonyms": [], "category_ids": []} for wid in word_ids
+    }
+    if not word_ids:
+        return children
+
+    examples = await db.execute(
+        select(
+            WordExample.word_id,
+            WordExample.id,
+            WordExample.text,
+            WordExample.translation,
+            WordExample.source,
+            WordExample.is_preferred,
+        )
+        .where(WordExample.word_id.in_(word_ids))
+        .order_by(WordExample.id)
+    )
+    for word_id, ex_id, text, translation, source, is_preferred in examples:
+        children[word_id]["examples"].append({
+            "id": ex_id,
+            "text": text,
+            "translation": translation,
+            "source": source,
+            "is_preferred": bool(is_preferred),
+        })
+
+    synonyms = await db.execute(
+        select(WordSynonym.word_id, WordSynonym.synonym, WordSynonym.type)
+        .where(WordSynonym.word_id.in_(word_ids))
+        .order_by(WordSynonym.id)
+    )
+    for word_id, synonym, type_ in synonyms:
+        children[word_id]["synonyms"].append({"synonym": synonym, "type": type_})
+
+    categories = await db.execute(
+        select(WordCategoryItem.word_id, WordCategoryItem.category_id)
+        .where(WordCategoryItem.word_id.in_(word_ids))
+    )
+    for word_id, category_id in categories:
+        children[word_id]["category_ids"].append(category_id)
+
+    return children
+
+
+async def build_items(db: AsyncSession, rows: Iterable) -> list[dict]:
+    words = [dict(row._mapping) for row in rows]
+    children = await load_children(db, [w["id"] for w in words])
+    for w in words:
+        w.update(children[w["id"]])
+    return words
+
+
+# =====================================
+#  NDJSON EXPORT
+# =====================================
+async def stream_words_ndjson(batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+    """
+    Streams every word as one JSON line, reading `words` through a
+    server-side cursor so memory stays flat regardless of table size.
+    Uses its own session because the generator outlives the request handler.
+    """
+    async with AsyncSessionLocal() as db, AsyncSessionLocal() as side: # type: ignore
+        result = await db.stream(
+            select(*WORD_COLUMNS)
+            .order_by(Word.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            items = await build_items(side, partition)
+            yield "".join(ndjson_line(item) for item in items).encode()
+
+
+# =====================================
+#  DELTA
+# =====================================
+async def get_delta(db: AsyncSession, since: Optional[datetime], limit: int = DELTA_MAX_ITEMS) -> dict:
+    watermark = await current_watermark(db)
+
+    if since is None:
+        return {"sync_token": encode_sync_token(watermark), "full_resync": True, "updated": [], "deleted": []}
+
+    changed = await db.scalar(
+        select(func.count(Word.id)).where(Word.updated_at >= since)
+    )
+    if changed > limit: # type: ignore
+        return {"sync_token": encode_sync_token(watermark), "full_resync": True, "updated": [], "deleted": []}
+
+    rows = await db.execute(
+        select(*WORD_COLUMNS)
+        .where(Word.updated_at >= since)
+        .order_by(Word.updated_at, Word.id)
+    )
+    updated = await build_items(db, rows.all())
+
+    deleted = await db.execute(
+        select(WordTombstone.word_id)
+        .where(WordTombstone.deleted_at >= since)
+        .distinct()
+    )
+
+    return {
+        "sync_token": encode_sync_token(watermark),
+        "full_resync": False,
+        "updated": updated,
+        "deleted": list(deleted.scalars().all()),
+    }
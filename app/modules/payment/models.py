@@ -2,7 +2,7 @@ from typing import Optional
 from datetime import datetime
 
 from sqlalchemy import (
-    Integer, String, ForeignKey, DateTime, Float, Boolean
+    Integer, String, ForeignKey, DateTime, Float, Boolean, Index
 )
 from sqlalchemy.orm import (
     Mapped, mapped_column, relationship
@@ -49,6 +49,10 @@ class Payment(Base):
 
     user: Mapped["User"] = relationship(back_populates="payments")
 
+    __table_args__ = (
+        Index("ix_payments_user_created", "user_id", "created_at", "id"),
+    )
+
 
 
 class Subscription(Base):
@@ -1,7 +1,14 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from share.pagination import PageParams, Paginator
 from .models import Payment, Subscription
 
+PAYMENTS_PAGE = Paginator(
+    Payment.id,
+    sort={"created_at": Payment.created_at, "amount": Payment.amount},
+    filters={"status": Payment.status, "user_id": Payment.user_id, "product_type": Payment.product_type},
+)
+
 
 class PaymentRepository:
     def __init__(self, db: AsyncSession):
@@ -18,11 +25,11 @@ class PaymentRepository:
         self.db.add(payment)
         return payment
 
-    async def get_by_user(self, user_id: int):
-        res = await self.db.execute(
-            select(Payment).where(Payment.user_id == user_id)
-        )
-        return res.scalars().all()
+    async def get_by_user(self, user_id: int, page: PageParams):
+        return await PAYMENTS_PAGE.page(self.db, select(Payment), page, user_id=user_id)
+
+    async def get_page(self, page: PageParams, **filters):
+        return await PAYMENTS_PAGE.page(self.db, select(Payment), page, **filters)
 
     async def get_by_id(self, payment_id: int):
         res = await self.db.execute(
@@ -6,17 +6,19 @@ from app.modules.auth.dependencies import get_current_user
 from .schemas import PaymentCreate, PaymentResponse, SubscriptionResponse
 from .repository import PaymentRepository, SubscriptionRepository
 from app.modules.users.models import User
+from share.pagination import Page, PageParams, page_params
 
 router = APIRouter(prefix="/payments", tags=["Payments"])
 
 
-@router.get("/check/me", response_model=list[PaymentResponse])
+@router.get("/check/me", response_model=Page[PaymentResponse])
 async def my_payments(
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     repo = PaymentRepository(db)
-    return await repo.get_by_user(user.id) # pyright: ignore[reportArgumentType]
+    return await repo.get_by_user(user.id, page) # pyright: ignore[reportArgumentType]
 
 
 @router.get("/subscription/me", response_model=SubscriptionResponse | None)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -16,3 +16,7 @@ class AudioWritingAttempt(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
     user = relationship("User", back_populates="audio_writing_attempts")
+
+    __table_args__ = (
+        Index("ix_audio_writing_attempts_user_created", "user_id", "created_at", "id"),
+    )
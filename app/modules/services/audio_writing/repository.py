@@ -1,9 +1,18 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from share.pagination import PageParams, Paginator
+
 from .models import AudioWritingAttempt
 
 
+ATTEMPTS_PAGE = Paginator(
+    AudioWritingAttempt.id,
+    sort={"created_at": AudioWritingAttempt.created_at},
+    default="-created_at",
+)
+
+
 class AudioWritingRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -19,13 +28,9 @@ class AudioWritingRepository:
         )
         return result.scalar_one_or_none()
 
-    async def get_user_attempts(self, user_id: int):
-        result = await self.db.execute(
-            select(AudioWritingAttempt)
-            .where(AudioWritingAttempt.user_id == user_id)
-            .order_by(AudioWritingAttempt.created_at.desc())
-        )
-        return result.scalars().all()
+    async def get_user_attempts(self, user_id: int, page: PageParams):
+        stmt = select(AudioWritingAttempt).where(AudioWritingAttempt.user_id == user_id)
+        return await ATTEMPTS_PAGE.page(self.db, stmt, page)
 
     async def delete(self, attempt: AudioWritingAttempt):
         await self.db.delete(attempt)
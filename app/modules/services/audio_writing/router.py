@@ -4,6 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.modules.auth.dependencies import get_current_user
 from app.modules.users.models import User
+from app.modules.stats.events import track_activity
+from share.pagination import Page, PageParams, page_params
 
 from .schemas import (
     AudioWritingCreate,
@@ -16,13 +18,14 @@ from .service import AudioWritingService
 router = APIRouter(prefix="/services/audio-writing", tags=["Audio Writing"])
 
 
-@router.get("/me", response_model=list[AudioWritingResponse])
+@router.get("/me", response_model=Page[AudioWritingResponse])
 async def my_attempts(
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     service = AudioWritingService(AudioWritingRepository(db))
-    return await service.list_user_attempts(user.id) # type: ignore
+    return await service.list_user_attempts(user.id, page) # type: ignore
 
 
 @router.get("/select/{attempt_id}", response_model=AudioWritingResponse)
@@ -45,6 +48,7 @@ async def create_attempt(
 
     await db.commit()
     await db.refresh(attempt)
+    track_activity(user.id, "audio_writing", score=attempt.accuracy) # type: ignore
     return attempt
 
 @router.put("/update/{attempt_id}", response_model=AudioWritingResponse)
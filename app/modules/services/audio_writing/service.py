@@ -1,5 +1,7 @@
 from fastapi import HTTPException
 
+from share.pagination import PageParams
+
 from .models import AudioWritingAttempt
 from .schemas import AudioWritingCreate, AudioWritingUpdate
 from .repository import AudioWritingRepository
@@ -31,8 +33,8 @@ class AudioWritingService:
             raise HTTPException(404, "Attempt not found")
         return attempt
 
-    async def list_user_attempts(self, user_id: int):
-        return await self.repo.get_user_attempts(user_id)
+    async def list_user_attempts(self, user_id: int, page: PageParams):
+        return await self.repo.get_user_attempts(user_id, page)
 
     async def update(self, attempt_id: int, user_id: int, data: AudioWritingUpdate):
         attempt = await self.get(attempt_id, user_id)
@@ -1,6 +1,6 @@
 import enum
 from sqlalchemy import (
-    JSON, Column, DateTime, Float, Integer, String, Text, Enum, ForeignKey, Boolean, func
+    JSON, Column, DateTime, Float, Integer, String, Text, Enum, ForeignKey, Boolean, Index, func
 )
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -142,4 +142,8 @@ class ListeningResult(Base):
     user_answers = Column(JSON, nullable=False, default={})
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    exam = relationship("ListeningExam", back_populates="results")
\ No newline at end of file
+    exam = relationship("ListeningExam", back_populates="results")
+
+    __table_args__ = (
+        Index("ix_listening_results_user_created", "user_id", "created_at", "id"),
+    )
\ No newline at end of file
@@ -1,11 +1,17 @@
 from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+from sqlalchemy import select
 
 from app.core.database import get_db
 from app.modules.auth.dependencies import get_current_user
 from app.modules.auth.permissions import require_admin
 from app.modules.users.models import User
+from share.pagination import Page, PageParams, page_params
+from app.modules.education.words.profiler import profile_passages
+from app.modules.education.words.schemas import LexicalProfileReport
+
+from .models import ListeningExam, ListeningPart
 
 # Servis va Sxemalar
 from .services import ListeningService
@@ -104,14 +110,15 @@ async def submit_listening_answers(
     )
 
 
-@router.get("/my-results/all", response_model=List[ListeningResultResponse])
+@router.get("/my-results/all", response_model=Page[ListeningResultResponse])
 async def get_my_listening_results(
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
     """Foydalanuvchining shaxsiy natijalari tarixi"""
     service = ListeningService(db)
-    return await service.get_user_results(user.id)
+    return await service.get_user_results(user.id, page)
 
 
 @router.get("/my-results/{result_id}", response_model=ListeningResultDetailResponse)
@@ -130,4 +137,26 @@ async def get_listening_result_detail(
     if not result:
         raise HTTPException(status_code=404, detail="Natija topilmadi yoki ruxsat yo'q")
         
-    return result
\ No newline at end of file
+    return result
+
+
+@router.get(
+    "/profile/{exam_id}",
+    response_model=LexicalProfileReport,
+    dependencies=[Depends(require_admin)],
+)
+async def get_listening_lexical_profile(
+    exam_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """Matnlar leksik tahlili: darajalar bo'yicha qamrov, ro'yxatdan tashqari so'zlar"""
+    test = (await db.execute(select(ListeningExam.cefr_level).where(ListeningExam.id == exam_id))).first()
+    if test is None:
+        raise HTTPException(status_code=404, detail="Test topilmadi")
+
+    parts = await db.execute(
+        select(ListeningPart.id, ListeningPart.passage)
+        .where(ListeningPart.exam_id == exam_id)
+        .order_by(ListeningPart.id)
+    )
+    return await profile_passages(db, parts.all(), test.cefr_level) # type: ignore
@@ -7,6 +7,9 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 
+from app.modules.stats.events import track_activity
+from share.pagination import PageParams, Paginator
+
 # Mock Models (Integratsiya uchun)
 from app.modules.services.exams.mock.models import (
     MockExamAttempt,
@@ -27,6 +30,13 @@ from .schemas import ListeningExamCreate, ListeningExamUpdate, ListeningSubmissi
 
 logger = logging.getLogger(__name__)
 
+RESULTS_PAGE = Paginator(
+    ListeningResult.id,
+    sort={"created_at": ListeningResult.created_at, "percentage": ListeningResult.percentage},
+    default="-created_at",
+)
+
+
 class ListeningService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -236,17 +246,14 @@ class ListeningService:
 
         await self.db.commit()
         await self.db.refresh(new_result)
+        # sarflangan vaqt saqlanmaydi (duration_minutes - bu vaqt chegarasi)
+        track_activity(user_id, "listening", score=new_result.percentage) # type: ignore
         
         return {"summary": new_result, "review": review_items}
 
-    async def get_user_results(self, user_id: int):
-        stmt = (
-            select(ListeningResult)
-            .where(ListeningResult.user_id == user_id)
-            .order_by(ListeningResult.created_at.desc())
-        )
-        result = await self.db.execute(stmt)
-        return result.scalars().all()
+    async def get_user_results(self, user_id: int, page: PageParams) -> dict:
+        stmt = select(ListeningResult).where(ListeningResult.user_id == user_id)
+        return await RESULTS_PAGE.page(self.db, stmt, page)
     
     async def get_result_with_review(self, result_id: int, user_id: int):
         stmt = select(ListeningResult).where(
@@ -1,7 +1,7 @@
 import enum
 from sqlalchemy import (
     Column, Integer, String, Text, Float,
-    Boolean, DateTime, ForeignKey, Enum, JSON
+    Boolean, DateTime, ForeignKey, Enum, JSON, Index
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -95,6 +95,10 @@ class MockExamResult(Base):
 
     attempt = relationship("MockExamAttempt", back_populates="result")
 
+    __table_args__ = (
+        Index("ix_mock_exam_results_user_created", "user_id", "created_at", "id"),
+    )
+
 # --- PURCHASE ---
 class MockPurchase(Base):
     __tablename__ = "mock_purchases"
@@ -4,6 +4,7 @@ from typing import List
 
 from app.core.database import get_db
 from app.modules.auth.dependencies import get_current_user
+from share.pagination import Page, PageParams, page_params
 from . import schemas, services, models
 
 router = APIRouter(
@@ -131,13 +132,14 @@ async def buy_mock_exam(
     await services.buy_exam_request(db, user.id, exam_id)
     return {"message": "To'lov so'rovi yuborildi. Admin tasdiqlashini kuting."}
 
-@router.get("/results/history", response_model=List[schemas.MockExamResultResponse])
+@router.get("/results/history", response_model=Page[schemas.MockExamResultResponse])
 async def get_my_results_history(
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     user = Depends(get_current_user)
 ):
     """Foydalanuvchining barcha topshirgan imtihonlari tarixi."""
-    return await services.get_user_results_history(db, user.id)
+    return await services.get_user_results_history(db, user.id, page)
 
 @router.get("/attempts/{attempt_id}/result", response_model=schemas.MockExamResultResponse)
 async def get_specific_result(
@@ -7,6 +7,8 @@ from typing import List, Optional, Dict
 
 from app.modules.services.exams.listening.models import ListeningExam
 from app.modules.services.exams.reading.models import ReadingTest
+from app.modules.stats.events import track_activity
+from share.pagination import PageParams, Paginator
 from .models import (
     MockExam, MockExamAttempt, MockPurchase, MockSkillAttempt,
     MockExamResult, SkillType
@@ -223,6 +225,11 @@ async def submit_skill(db: AsyncSession, attempt_id: int, skill: SkillType, data
         await db.rollback()
         print(f"Database Error: {e}") # Debug uchun
         raise HTTPException(status_code=500, detail="Ma'lumotni saqlashda xatolik yuz berdi")
+
+    # 75 ballik shkala -> foiz. Writing/Speaking tekshirilmaguncha ball yo'q:
+    # mijoz yuborgan raw_score ham, 0 ham o'rtachani buzadi
+    if skill_attempt.is_checked:
+        track_activity(skill_attempt.user_id, f"mock_{skill.value.lower()}", score=skill_attempt.scaled_score / 75 * 100) # type: ignore
     
     return skill_attempt
 
@@ -285,10 +292,16 @@ async def finish_exam_service(db: AsyncSession, attempt_id: int) -> MockExamResu
         await db.rollback()
         raise HTTPException(500, f"Natijani saqlashda xatolik: {str(e)}")
 
-async def get_user_results_history(db: AsyncSession, user_id: int) -> List[MockExamResult]:
-    stmt = select(MockExamResult).where(MockExamResult.user_id == user_id).order_by(MockExamResult.created_at.desc())
-    res = await db.execute(stmt)
-    return res.scalars().all()
+RESULTS_PAGE = Paginator(
+    MockExamResult.id,
+    sort={"created_at": MockExamResult.created_at, "overall_score": MockExamResult.overall_score},
+    default="-created_at",
+)
+
+
+async def get_user_results_history(db: AsyncSession, user_id: int, page: PageParams) -> dict:
+    stmt = select(MockExamResult).where(MockExamResult.user_id == user_id)
+    return await RESULTS_PAGE.page(db, stmt, page)
 
 async def get_mock_result_service(db: AsyncSession, attempt_id: int) -> MockExamResult:
     stmt = select(MockExamResult).where(MockExamResult.attempt_id == attempt_id)
@@ -1,7 +1,7 @@
 import enum
 from sqlalchemy import (
     Column, Integer, String, Text, Float,
-    Boolean, DateTime, ForeignKey, Enum, JSON
+    Boolean, DateTime, ForeignKey, Enum, JSON, Index
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -115,4 +115,8 @@ class ReadingResult(Base):
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    test = relationship("ReadingTest", back_populates="results")
\ No newline at end of file
+    test = relationship("ReadingTest", back_populates="results")
+
+    __table_args__ = (
+        Index("ix_reading_results_user_created", "user_id", "created_at", "id"),
+    )
\ No newline at end of file
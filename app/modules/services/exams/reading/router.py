@@ -1,11 +1,17 @@
 from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
+from sqlalchemy import select
 
 from app.core.database import get_db
 from app.modules.auth.dependencies import get_current_user
 from app.modules.auth.permissions import require_admin
 from app.modules.users.models import User
+from share.pagination import Page, PageParams, page_params
+from app.modules.education.words.profiler import profile_passages
+from app.modules.education.words.schemas import LexicalProfileReport
+
+from .models import ReadingTest, ReadingPart
 
 # Service & Schemas
 from .services import ReadingService
@@ -136,15 +142,16 @@ async def submit_reading_answers(
 
 @router.get(
     "/my-results/all",
-    response_model=List[ReadingResultResponse],
+    response_model=Page[ReadingResultResponse],
 )
 async def get_my_reading_results(
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """Foydalanuvchining shaxsiy Reading natijalari tarixi"""
     service = ReadingService(db)
-    return await service.get_user_results(user.id)
+    return await service.get_user_results(user.id, page)
 
 
 @router.get(
@@ -166,4 +173,26 @@ async def get_reading_result_detail(
     if not result:
         raise HTTPException(status_code=404, detail="Natija topilmadi yoki ruxsat yo'q")
         
-    return result
\ No newline at end of file
+    return result
+
+
+@router.get(
+    "/profile/{test_id}",
+    response_model=LexicalProfileReport,
+    dependencies=[Depends(require_admin)],
+)
+async def get_reading_lexical_profile(
+    test_id: str,
+    db: AsyncSession = Depends(get_db),
+):
+    """Matnlar leksik tahlili: darajalar bo'yicha qamrov, ro'yxatdan tashqari so'zlar"""
+    test = (await db.execute(select(ReadingTest.cefr_level).where(ReadingTest.id == test_id))).first()
+    if test is None:
+        raise HTTPException(status_code=404, detail="Test topilmadi")
+
+    parts = await db.execute(
+        select(ReadingPart.id, ReadingPart.passage)
+        .where(ReadingPart.test_id == test_id)
+        .order_by(ReadingPart.id)
+    )
+    return await profile_passages(db, parts.all(), test.cefr_level) # type: ignore
@@ -7,6 +7,9 @@ from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.modules.stats.events import track_activity
+from share.pagination import PageParams, Paginator
+
 # Mock Models (Integratsiya uchun)
 from app.modules.services.exams.mock.models import (
     MockExamAttempt,
@@ -34,6 +37,13 @@ from .schemas import (
 
 logger = logging.getLogger(__name__)
 
+RESULTS_PAGE = Paginator(
+    ReadingResult.id,
+    sort={"created_at": ReadingResult.created_at, "percentage": ReadingResult.percentage},
+    default="-created_at",
+)
+
+
 class ReadingService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -223,6 +233,8 @@ class ReadingService:
             await self._update_mock_reading(data.exam_attempt_id, std_score, cefr)
 
         await self.db.commit()
+        # sarflangan vaqt saqlanmaydi (duration_minutes - bu vaqt chegarasi)
+        track_activity(user_id, "reading", score=percentage)
         
         # FIX: Pydantic V2 (model_validate)
         return ReadingResultDetailResponse(
@@ -230,10 +242,9 @@ class ReadingService:
             review=review_items,
         )
 
-    async def get_user_results(self, user_id: int) -> List[ReadingResult]:
-        stmt = select(ReadingResult).where(ReadingResult.user_id == user_id).order_by(ReadingResult.created_at.desc())
-        res = await self.db.execute(stmt)
-        return res.scalars().all()
+    async def get_user_results(self, user_id: int, page: PageParams) -> dict:
+        stmt = select(ReadingResult).where(ReadingResult.user_id == user_id)
+        return await RESULTS_PAGE.page(self.db, stmt, page)
 
     async def get_result_with_review(self, result_id: int, user_id: int) -> Optional[ReadingResultDetailResponse]:
         stmt = select(ReadingResult).where(ReadingResult.id == result_id, ReadingResult.user_id == user_id)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -24,3 +24,7 @@ class VideoShadowingAttempt(Base):
         "User",
         back_populates="video_shadowing_attempts"
     )
+
+    __table_args__ = (
+        Index("ix_video_shadowing_attempts_user_created", "user_id", "created_at", "id"),
+    )
@@ -1,9 +1,18 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from share.pagination import PageParams, Paginator
+
 from .models import VideoShadowingAttempt
 
 
+ATTEMPTS_PAGE = Paginator(
+    VideoShadowingAttempt.id,
+    sort={"created_at": VideoShadowingAttempt.created_at},
+    default="-created_at",
+)
+
+
 class VideoShadowingRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -20,13 +29,9 @@ class VideoShadowingRepository:
         )
         return result.scalar_one_or_none()
 
-    async def get_user_attempts(self, user_id: int):
-        result = await self.db.execute(
-            select(VideoShadowingAttempt)
-            .where(VideoShadowingAttempt.user_id == user_id)
-            .order_by(VideoShadowingAttempt.created_at.desc())
-        )
-        return result.scalars().all()
+    async def get_user_attempts(self, user_id: int, page: PageParams):
+        stmt = select(VideoShadowingAttempt).where(VideoShadowingAttempt.user_id == user_id)
+        return await ATTEMPTS_PAGE.page(self.db, stmt, page)
 
     async def delete(self, attempt: VideoShadowingAttempt):
         await self.db.delete(attempt)
@@ -4,6 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.modules.auth.dependencies import get_current_user
 from app.modules.users.models import User
+from app.modules.stats.events import track_activity
+from share.pagination import Page, PageParams, page_params
 
 from .schemas import (
     VideoShadowingCreate,
@@ -18,13 +20,14 @@ router = APIRouter(
     tags=["Video Shadowing"]
 )
 
-@router.get("/me", response_model=list[VideoShadowingResponse])
+@router.get("/me", response_model=Page[VideoShadowingResponse])
 async def my_attempts(
+    page: PageParams = Depends(page_params),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     service = VideoShadowingService(VideoShadowingRepository(db))
-    return await service.list_user_attempts(user.id) # type: ignore
+    return await service.list_user_attempts(user.id, page) # type: ignore
 
 
 @router.get("/select/{attempt_id}", response_model=VideoShadowingResponse)
@@ -47,6 +50,7 @@ async def create_attempt(
 
     await db.commit()
     await db.refresh(attempt)
+    track_activity(user.id, "video_shadowing", score=attempt.overall_score) # type: ignore
     return attempt
 
 
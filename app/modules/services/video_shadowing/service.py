@@ -1,5 +1,7 @@
 from fastapi import HTTPException
 
+from share.pagination import PageParams
+
 from .models import VideoShadowingAttempt
 from .schemas import VideoShadowingCreate, VideoShadowingUpdate
 from .repository import VideoShadowingRepository
@@ -36,8 +38,8 @@ class VideoShadowingService:
             raise HTTPException(404, "Attempt not found")
         return attempt
 
-    async def list_user_attempts(self, user_id: int):
-        return await self.repo.get_user_attempts(user_id)
+    async def list_user_attempts(self, user_id: int, page: PageParams):
+        return await self.repo.get_user_attempts(user_id, page)
 
     async def update(self, attempt_id: int, user_id: int, data: VideoShadowingUpdate):
         attempt = await self.get(attempt_id, user_id)
@@ -0,0 +1,166 @@
+"""
+Cohort analytics over exam results (listening, reading, mock).
+
+Only two columns are read row by row, score and julianday(created_at); they
+are fetched in chunks straight into NumPy arrays, and the statistics
+(quantiles, histogram, weekly means and their moving average) are computed
+on those arrays. CEFR counts come from a GROUP BY. Results are cached per
+parameter set for CACHE_TTL seconds.
+"""
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import MISSING, TTLCache
+from app.modules.services.exams.listening.models import ListeningResult
+from app.modules.services.exams.mock.models import MockExamAttempt, MockExamResult
+from app.modules.services.exams.reading.models import ReadingResult
+
+MAX_SCORE = 75.0  # all three store the DTM 75-point standard score
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+CHUNK = 10_000
+CACHE_TTL = 5 * 60
+
+# julian day of Monday 1970-01-05, so week numbers start on Mondays
+_MONDAY_JD = 2440591.5
+_MONDAY = date(1970, 1, 5)
+
+_cache = TTLCache(maxsize=256, ttl=CACHE_TTL)
+
+
+def _source(source: str):
+    """(model, score column, exam column, joins) for one result table."""
+    if source == "listening":
+        return ListeningResult, ListeningResult.standard_score, ListeningResult.exam_id, ()
+    if source == "reading":
+        return ReadingResult, ReadingResult.standard_score, ReadingResult.test_id, ()
+    return (
+        MockExamResult,
+        MockExamResult.overall_score,
+        MockExamAttempt.mock_exam_id,
+        ((MockExamAttempt, MockExamAttempt.id == MockExamResult.attempt_id),),
+    )
+
+
+def _filtered(stmt, source: str, exam_id: Optional[str], date_from: Optional[date], date_to: Optional[date]):
+    model, _, exam_col, joins = _source(source)
+    for target, on in joins:
+        stmt = stmt.join(target, on)
+    stmt = stmt.where(model.created_at.is_not(None))
+    if exam_id is not None:
+        stmt = stmt.where(exam_col == exam_id)
+    if date_from is not None:
+        stmt = stmt.where(model.created_at >= datetime.combine(date_from, datetime.min.time()))
+    if date_to is not None:
+        stmt = stmt.where(model.created_at < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+    return stmt
+
+
+def _fetch_arrays(conn, stmt) -> tuple[np.ndarray, np.ndarray]:
+    # plain DBAPI rows, CHUNK at a time from a server-side cursor (without
+    # stream_results the driver buffers the whole result before the first
+    # fetchmany); no Row objects or type processors per value
+    cursor = conn.execute(stmt.execution_options(stream_results=True)).cursor
+    scores, days = [], []
+    while chunk := cursor.fetchmany(CHUNK):
+        s, d = zip(*chunk)
+        scores.append(np.array(s, dtype=np.float64))   # NULL -> nan
+        days.append(np.array(d, dtype=np.float64))
+    if not scores:
+        return np.empty(0), np.empty(0)
+    return np.concatenate(scores), np.concatenate(days)
+
+
+def _round(value) -> Optional[float]:
+    return None if value is None or np.isnan(value) else round(float(value), 2)
+
+
+def _histogram(scores: np.ndarray, bins: int) -> list[dict]:
+    counts, edges = np.histogram(scores, bins=bins, range=(0.0, MAX_SCORE))
+    return [
+        {"start": round(float(lo), 2), "end": round(float(hi), 2), "count": int(n)}
+        for lo, hi, n in zip(edges[:-1], edges[1:], counts)
+    ]
+
+
+def _weekly(scores: np.ndarray, days: np.ndarray, window: int) -> list[dict]:
+    """Per-week count and mean over every week in range, plus a count-weighted moving average."""
+    if not days.size:
+        return []
+    weeks = np.floor((days - _MONDAY_JD) / 7).astype(np.int64)
+    first = int(weeks.min())
+    index = weeks - first
+    size = int(index.max()) + 1
+
+    scored = ~np.isnan(scores)
+    counts = np.bincount(index, minlength=size)
+    n_scored = np.bincount(index[scored], minlength=size).astype(np.float64)
+    sums = np.bincount(index[scored], weights=scores[scored], minlength=size)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / n_scored
+        kernel = np.ones(window)
+        rolling = np.convolve(sums, kernel)[:size] / np.convolve(n_scored, kernel)[:size]
+
+    return [
+        {
+            "week_start": _MONDAY + timedelta(weeks=first + i),
+            "count": int(counts[i]),
+            "mean": _round(means[i]),
+            "moving_average": _round(rolling[i]),
+        }
+        for i in range(size)
+    ]
+
+
+async def exam_analytics(
+    db: AsyncSession,
+    source: str,
+    exam_id: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    bins: int = 15,
+    window: int = 4,
+) -> dict:
+    key = (source, exam_id, date_from, date_to, bins, window)
+    cached = _cache.get(key)
+    if cached is not MISSING:
+        return cached
+
+    model, score, _, _ = _source(source)
+    conn = await db.connection()
+    scores, days = await conn.run_sync(
+        _fetch_arrays,
+        _filtered(select(score, func.julianday(model.created_at)), source, exam_id, date_from, date_to),
+    )
+    valid = scores[~np.isnan(scores)]
+
+    levels = await db.execute(
+        _filtered(select(model.cefr_level, func.count()), source, exam_id, date_from, date_to)
+        .group_by(model.cefr_level)
+    )
+    cefr = {level or "unrated": count for level, count in levels}
+
+    report = {
+        "source": source,
+        "exam_id": exam_id,
+        "date_from": date_from,
+        "date_to": date_to,
+        "count": int(scores.size),
+        "mean": _round(valid.mean()) if valid.size else None,
+        "std": _round(valid.std()) if valid.size else None,
+        "min": _round(valid.min()) if valid.size else None,
+        "max": _round(valid.max()) if valid.size else None,
+        "quantiles": (
+            {f"p{round(q * 100)}": _round(v) for q, v in zip(QUANTILES, np.quantile(valid, QUANTILES))}
+            if valid.size else {}
+        ),
+        "histogram": _histogram(valid, bins),
+        "cefr_levels": cefr,
+        "weekly": _weekly(scores, days, window),
+    }
+    _cache.set(key, report)
+    return report
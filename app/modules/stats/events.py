@@ -0,0 +1,112 @@
+"""
+Activity events -> practice_attempts.
+
+Modules call `track_activity(...)` after their own commit; it only appends to
+a bounded in-memory queue. `ActivityWriter` drains the queue in the
+background and writes each batch with one multi-row insert plus the
+practice_days / practice_summaries rollups (see StatsRepository.add_attempts).
+The queue is flushed on shutdown; events that arrive while it is full are
+dropped and counted.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+
+from app.core.database import AsyncSessionLocal
+from app.modules.stats.repository import StatsRepository
+
+logger = logging.getLogger(__name__)
+
+MAX_PENDING = 10_000
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 2.0  # seconds to let a batch accumulate
+
+
+class ActivityWriter:
+
+    def __init__(self, maxsize: int = MAX_PENDING, batch_size: int = BATCH_SIZE, interval: float = FLUSH_INTERVAL):
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=maxsize)
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self._pending: list[dict] = []
+        self._task: Optional[asyncio.Task] = None
+        self._writing: Optional[asyncio.Future] = None
+
+    def submit(self, event: dict) -> bool:
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            if self.dropped % 1000 == 1:
+                logger.warning("Activity queue full, %s events dropped so far", self.dropped)
+            return False
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._writing is not None:
+            # a shielded write may still be running; let it finish
+            await self._writing
+        await self.flush()
+
+    async def flush(self):
+        """Writes everything queued so far, BATCH_SIZE events per transaction."""
+        while self._pending or not self.queue.empty():
+            await self._write(self._take())
+
+    def _take(self) -> list[dict]:
+        batch, self._pending = self._pending, []
+        while len(batch) < self.batch_size and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        return batch
+
+    async def _run(self):
+        while True:
+            self._pending.append(await self.queue.get())
+            if self.queue.qsize() < self.batch_size:
+                await asyncio.sleep(self.interval)
+            # stop() cancels this loop; the shield keeps a batch from being cut mid-write
+            self._writing = asyncio.ensure_future(self._write(self._take()))
+            await asyncio.shield(self._writing)
+            self._writing = None
+
+    async def _write(self, batch: list[dict]):
+        async with AsyncSessionLocal() as db: # type: ignore
+            try:
+                await StatsRepository(db).add_attempts(batch)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                logger.exception("Dropped a batch of %s activity events", len(batch))
+
+
+activity_writer = ActivityWriter()
+
+
+def track_activity(
+    user_id: int,
+    source: str,
+    seconds: int = 0,
+    score: float = 0.0,
+    at: Optional[datetime] = None,
+) -> bool:
+    """Queues one practice event; `score` is on a 0-100 scale. Never blocks."""
+    return activity_writer.submit({
+        "user_id": user_id,
+        "source": source,
+        "duration_seconds": max(int(seconds or 0), 0),
+        "overall_score": round(float(score or 0.0), 2),
+        "created_at": at or datetime.utcnow(),
+    })
@@ -0,0 +1,232 @@
+"""
+Leaderboards served from a snapshot table.
+
+`refresh_leaderboards` ranks everyone from the practice rollups
+(practice_days for the current week, practice_summaries for all time) and
+rewrites leaderboard_entries in one transaction. Pages are index range reads
+on (board, position) and "my rank" is a point read on (board, user_id), so
+neither depends on how many attempts are stored. `LeaderboardRefresher`
+reruns it every REFRESH_INTERVAL seconds; every worker starts one, but only
+the worker holding the "leaderboards" job lease actually refreshes.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select, func, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.core.leases import acquire_lease
+from app.modules.education.course.models import UserCourse
+from app.modules.users.models import User
+from app.modules.stats.models import LeaderboardEntry, PracticeDay, PracticeSummary
+
+logger = logging.getLogger(__name__)
+
+PERIODS = ("week", "all")
+METRICS = ("minutes", "score")
+# an average over one or two attempts is not a ranking
+MIN_SCORED_ATTEMPTS = 3
+REFRESH_INTERVAL = 10 * 60
+LEASE_NAME = "leaderboards"
+_CHUNK = 5000
+
+
+def board_key(period: str, metric: str, course_id: Optional[int] = None) -> str:
+    scope = "global" if course_id is None else f"course:{course_id}"
+    return f"{period}:{metric}:{scope}"
+
+
+def week_start(now: Optional[datetime] = None):
+    today = (now or datetime.utcnow()).date()
+    return today - timedelta(days=today.weekday())
+
+
+def _metric_values(totals: dict[int, tuple[int, float, int]], metric: str) -> dict[int, float]:
+    if metric == "minutes":
+        return {uid: seconds // 60 for uid, (seconds, _, _) in totals.items() if seconds >= 60}
+    return {
+        uid: round(score_sum / attempts, 2)
+        for uid, (_, score_sum, attempts) in totals.items()
+        if attempts >= MIN_SCORED_ATTEMPTS
+    }
+
+
+def _ranked(board: str, values: dict[int, float], computed_at: datetime) -> list[dict]:
+    """Highest value first, ties share a rank (1, 2, 2, 4) and keep user_id order."""
+    rows, rank, prev = [], 0, None
+    for position, (uid, value) in enumerate(sorted(values.items(), key=lambda kv: (-kv[1], kv[0])), start=1):
+        if value != prev:
+            rank, prev = position, value
+        rows.append({
+            "board": board,
+            "position": position,
+            "rank": rank,
+            "user_id": uid,
+            "value": value,
+            "computed_at": computed_at,
+        })
+    return rows
+
+
+async def _period_totals(db: AsyncSession, period: str) -> dict[int, tuple[int, float, int]]:
+    if period == "week":
+        res = await db.execute(
+            select(
+                PracticeDay.user_id,
+                func.sum(PracticeDay.seconds),
+                func.sum(PracticeDay.score_sum),
+                func.sum(PracticeDay.attempts),
+            )
+            .where(PracticeDay.day >= week_start())
+            .group_by(PracticeDay.user_id)
+        )
+    else:
+        res = await db.execute(select(
+            PracticeSummary.user_id,
+            PracticeSummary.total_seconds,
+            PracticeSummary.score_sum,
+            PracticeSummary.attempts,
+        ))
+    return {uid: (seconds or 0, score_sum or 0.0, attempts or 0) for uid, seconds, score_sum, attempts in res}
+
+
+async def refresh_leaderboards(db: AsyncSession) -> int:
+    """Rebuilds every board (global and per course); returns rows written."""
+    now = datetime.utcnow()
+
+    members: dict[int, set[int]] = {}
+    for course_id, user_id in await db.execute(select(UserCourse.course_id, UserCourse.user_id)):
+        members.setdefault(course_id, set()).add(user_id)
+
+    rows: list[dict] = []
+    for period in PERIODS:
+        totals = await _period_totals(db, period)
+        for metric in METRICS:
+            values = _metric_values(totals, metric)
+            rows += _ranked(board_key(period, metric), values, now)
+            for course_id, user_ids in members.items():
+                course_values = {uid: values[uid] for uid in user_ids if uid in values}
+                rows += _ranked(board_key(period, metric, course_id), course_values, now)
+
+    await db.execute(delete(LeaderboardEntry))
+    for i in range(0, len(rows), _CHUNK):
+        await db.execute(insert(LeaderboardEntry), rows[i:i + _CHUNK])
+    await db.commit()
+    return len(rows)
+
+
+# =========================
+# READ
+# =========================
+async def get_page(db: AsyncSession, board: str, limit: int = 20, after_position: Optional[int] = None) -> dict:
+    stmt = (
+        select(
+            LeaderboardEntry.position,
+            LeaderboardEntry.rank,
+            LeaderboardEntry.user_id,
+            LeaderboardEntry.value,
+            LeaderboardEntry.computed_at,
+            User.full_name,
+            User.username,
+        )
+        .join(User, User.id == LeaderboardEntry.user_id)
+        .where(LeaderboardEntry.board == board)
+    )
+    if after_position is not None:
+        stmt = stmt.where(LeaderboardEntry.position > after_position)
+
+    rows = (await db.execute(stmt.order_by(LeaderboardEntry.position).limit(limit + 1))).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "total": await _board_size(db, board),
+        "computed_at": rows[0].computed_at if rows else None,
+        "items": [
+            {
+                "rank": r.rank,
+                "user_id": r.user_id,
+                "full_name": r.full_name,
+                "username": r.username,
+                "value": r.value,
+            }
+            for r in rows
+        ],
+        "next_after_position": rows[-1].position if has_more else None,
+    }
+
+
+async def _board_size(db: AsyncSession, board: str) -> int:
+    # positions are dense, so the last one is the size (an index seek, not a count)
+    return await db.scalar(
+        select(func.max(LeaderboardEntry.position)).where(LeaderboardEntry.board == board)
+    ) or 0
+
+
+async def get_my_rank(db: AsyncSession, board: str, user_id: int) -> dict:
+    entry = (await db.execute(
+        select(LeaderboardEntry.rank, LeaderboardEntry.value, LeaderboardEntry.computed_at)
+        .where(LeaderboardEntry.board == board, LeaderboardEntry.user_id == user_id)
+    )).first()
+    return {
+        "rank": entry.rank if entry else None,
+        "value": entry.value if entry else None,
+        "total": await _board_size(db, board),
+        "computed_at": entry.computed_at if entry else None,
+    }
+
+
+# =========================
+# SCHEDULE
+# =========================
+class LeaderboardRefresher:
+
+    def __init__(self, interval: float = REFRESH_INTERVAL):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            async with AsyncSessionLocal() as db: # type: ignore
+                try:
+                    # the holder renews each round; the others take over only
+                    # once it has missed a whole round
+                    if await acquire_lease(db, LEASE_NAME, ttl=2 * self.interval):
+                        await refresh_leaderboards(db)
+                except Exception:
+                    await db.rollback()
+                    logger.exception("Leaderboard refresh failed")
+            await asyncio.sleep(self.interval)
+
+
+leaderboard_refresher = LeaderboardRefresher()
+
+
+if __name__ == "__main__":
+    # python -m app.modules.stats.leaderboard
+    import app.main  # noqa: F401  (registers every model with the mapper)
+    from app.core.database import engine, init_db
+
+    async def main():
+        await init_db()
+        async with AsyncSessionLocal() as db: # type: ignore
+            total = await refresh_leaderboards(db)
+        await engine.dispose()
+        print(f"✅ Leaderboards rebuilt: {total} rows")
+
+    asyncio.run(main())
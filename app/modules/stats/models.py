@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Float, String, Date, DateTime, ForeignKey, UniqueConstraint
 from datetime import datetime
 from app.core.database import Base
 
@@ -8,8 +8,65 @@ class PracticeAttempt(Base):
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    # which module produced it: listening, reading, mock, task, word_review, ...
+    source = Column(String(30), nullable=True)
 
     duration_seconds = Column(Integer, default=0)
     overall_score = Column(Float, default=0.0)
 
     created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class PracticeDay(Base):
+    """practice_attempts rolled up per (user, UTC day); upserted with every attempt."""
+    __tablename__ = "practice_days"
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "day", name="uq_practice_day"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
+
+    seconds = Column(Integer, default=0, nullable=False)
+    score_sum = Column(Float, default=0.0, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+
+
+class PracticeSummary(Base):
+    """All-time totals and streaks per user, kept in step with practice_days."""
+    __tablename__ = "practice_summaries"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    total_seconds = Column(Integer, default=0, nullable=False)
+    score_sum = Column(Float, default=0.0, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+
+    current_streak = Column(Integer, default=0, nullable=False)
+    longest_streak = Column(Integer, default=0, nullable=False)
+    last_day = Column(Date, nullable=True)
+
+
+class LeaderboardEntry(Base):
+    """
+    Precomputed rankings (see stats/leaderboard.py). `board` is
+    "<period>:<metric>:<scope>", e.g. "week:minutes:global" or
+    "all:score:course:3"; `position` is the 1-based row order used for
+    paging, `rank` the competition rank (ties share it).
+    """
+    __tablename__ = "leaderboard_entries"
+
+    __table_args__ = (
+        UniqueConstraint("board", "position", name="uq_leaderboard_position"),
+        UniqueConstraint("board", "user_id", name="uq_leaderboard_user"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    board = Column(String(40), nullable=False)
+    position = Column(Integer, nullable=False)
+    rank = Column(Integer, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    value = Column(Float, nullable=False)
+    computed_at = Column(DateTime, nullable=False)
@@ -1,7 +1,20 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, text
-from datetime import datetime, timedelta
-from app.modules.stats.models import PracticeAttempt
+from sqlalchemy import select, func, case, delete, insert, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import date, datetime, timedelta
+from typing import Optional
+from app.modules.stats.models import PracticeAttempt, PracticeDay, PracticeSummary
+
+
+def streaks(days: list[date]) -> tuple[int, int]:
+    """(streak ending on the last day, longest streak) for ascending distinct days."""
+    current = longest = 0
+    prev = None
+    for d in days:
+        current = current + 1 if prev is not None and d == prev + timedelta(days=1) else 1
+        longest = max(longest, current)
+        prev = d
+    return current, longest
 
 
 class StatsRepository:
@@ -9,42 +22,183 @@ class StatsRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_total_seconds(self, user_id: int) -> int:
-        result = await self.db.execute(
-            select(func.coalesce(func.sum(PracticeAttempt.duration_seconds), 0))
-            .where(PracticeAttempt.user_id == user_id)
+    # =========================
+    # WRITE
+    # =========================
+    async def record_attempt(self, user_id: int, duration_seconds: int, overall_score: float, at: Optional[datetime] = None, source: Optional[str] = None) -> PracticeAttempt:
+        """Stores the attempt and upserts its day and the user's summary. Caller commits."""
+        attempt = PracticeAttempt(
+            user_id=user_id,
+            source=source,
+            duration_seconds=duration_seconds,
+            overall_score=overall_score,
+            created_at=at or datetime.utcnow(),
         )
-        return result.scalar_one()
+        self.db.add(attempt)
+        await self.db.flush()
+        await self._roll_up([{
+            "user_id": user_id,
+            "duration_seconds": duration_seconds,
+            "overall_score": overall_score,
+            "created_at": attempt.created_at,
+        }])
+        return attempt
 
-    async def get_average_score(self, user_id: int) -> float:
-        result = await self.db.execute(
-            select(func.avg(PracticeAttempt.overall_score))
-            .where(PracticeAttempt.user_id == user_id)
+    async def add_attempts(self, rows: list[dict]):
+        """One multi-row insert of attempts plus their rollups. Caller commits."""
+        if not rows:
+            return
+        await self.db.execute(insert(PracticeAttempt).values(rows))
+        await self._roll_up(rows)
+
+    async def _roll_up(self, rows: list[dict]):
+        per_day: dict[tuple[int, date], dict] = {}
+        for row in rows:
+            key = (row["user_id"], row["created_at"].date())
+            agg = per_day.setdefault(key, {"user_id": key[0], "day": key[1], "seconds": 0, "score_sum": 0.0, "attempts": 0})
+            agg["seconds"] += row["duration_seconds"]
+            agg["score_sum"] += row["overall_score"]
+            agg["attempts"] += 1
+
+        stmt = sqlite_insert(PracticeDay).values(list(per_day.values()))
+        await self.db.execute(stmt.on_conflict_do_update(
+            index_elements=["user_id", "day"],
+            set_={
+                "seconds": PracticeDay.seconds + stmt.excluded.seconds,
+                "score_sum": PracticeDay.score_sum + stmt.excluded.score_sum,
+                "attempts": PracticeDay.attempts + stmt.excluded.attempts,
+            },
+        ))
+
+        backdated = set()
+        for (user_id, day), agg in sorted(per_day.items()):
+            if await self._advance_summary(user_id, day, agg["seconds"], agg["score_sum"], agg["attempts"]):
+                backdated.add(user_id)
+        for user_id in backdated:
+            # an older day may have bridged a gap, recount from the rollup
+            await self.rebuild_streaks(user_id)
+
+    async def _advance_summary(self, user_id: int, day: date, seconds: int, score_sum: float, attempts: int) -> bool:
+        """Upserts the summary for one (user, day); True when the day is older than last_day."""
+        # the streak only moves forward here: same day keeps it, the next day
+        # extends it, a gap restarts it. SET sees the row as it was before.
+        last = PracticeSummary.last_day
+        current = case(
+            (last.is_(None), 1),
+            (last >= day, PracticeSummary.current_streak),
+            (func.date(last, "+1 day") == day.isoformat(), PracticeSummary.current_streak + 1),
+            else_=1,
+        )
+        stmt = sqlite_insert(PracticeSummary).values(
+            user_id=user_id,
+            total_seconds=seconds,
+            score_sum=score_sum,
+            attempts=attempts,
+            current_streak=1,
+            longest_streak=1,
+            last_day=day,
         )
-        return round(result.scalar() or 0.0, 1)
+        new_last_day = await self.db.scalar(stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={
+                "total_seconds": PracticeSummary.total_seconds + seconds,
+                "score_sum": PracticeSummary.score_sum + score_sum,
+                "attempts": PracticeSummary.attempts + attempts,
+                "current_streak": current,
+                "longest_streak": func.max(PracticeSummary.longest_streak, current),
+                "last_day": case((or_(last.is_(None), last < day), day), else_=last),
+            },
+        ).returning(PracticeSummary.last_day))
+        return new_last_day is not None and new_last_day > day
 
-    async def get_practice_days(self, user_id: int):
-        result = await self.db.execute(
-            select(func.date(PracticeAttempt.created_at))
-            .where(PracticeAttempt.user_id == user_id)
-            .distinct()
-            .order_by(func.date(PracticeAttempt.created_at).desc())
+    async def rebuild_streaks(self, user_id: int):
+        days = list((await self.db.execute(
+            select(PracticeDay.day).where(PracticeDay.user_id == user_id).order_by(PracticeDay.day)
+        )).scalars())
+        current, longest = streaks(days)
+        summary = await self.db.get(PracticeSummary, user_id)
+        if summary is not None:
+            summary.current_streak = current # type: ignore
+            summary.longest_streak = longest # type: ignore
+            summary.last_day = days[-1] if days else None # type: ignore
+            await self.db.flush()
+
+    async def rebuild_rollup(self, user_id: Optional[int] = None) -> int:
+        """Recomputes practice_days and practice_summaries from practice_attempts; returns users written."""
+        day = func.date(PracticeAttempt.created_at)
+        stmt = (
+            select(
+                PracticeAttempt.user_id,
+                day,
+                func.coalesce(func.sum(PracticeAttempt.duration_seconds), 0),
+                func.coalesce(func.sum(PracticeAttempt.overall_score), 0.0),
+                func.count(PracticeAttempt.id),
+            )
+            .where(PracticeAttempt.created_at.is_not(None))
+            .group_by(PracticeAttempt.user_id, day)
+            .order_by(PracticeAttempt.user_id, day)
         )
-        return [row[0] for row in result.all()]
+        if user_id is not None:
+            stmt = stmt.where(PracticeAttempt.user_id == user_id)
+
+        days, summaries = [], {}
+        for uid, d, seconds, score_sum, attempts in await self.db.execute(stmt):
+            d = date.fromisoformat(d)
+            days.append({"user_id": uid, "day": d, "seconds": seconds, "score_sum": score_sum, "attempts": attempts})
+            s = summaries.setdefault(uid, {"user_id": uid, "total_seconds": 0, "score_sum": 0.0, "attempts": 0, "days": []})
+            s["total_seconds"] += seconds
+            s["score_sum"] += score_sum
+            s["attempts"] += attempts
+            s["days"].append(d)
+
+        for s in summaries.values():
+            s["current_streak"], s["longest_streak"] = streaks(s["days"])
+            s["last_day"] = s.pop("days")[-1]
+
+        for model in (PracticeDay, PracticeSummary):
+            wipe = delete(model)
+            if user_id is not None:
+                wipe = wipe.where(model.user_id == user_id)
+            await self.db.execute(wipe)
+        if days:
+            await self.db.execute(insert(PracticeDay), days)
+            await self.db.execute(insert(PracticeSummary), list(summaries.values()))
+        await self.db.commit()
+        return len(summaries)
+
+    # =========================
+    # READ
+    # =========================
+    async def get_summary(self, user_id: int) -> Optional[PracticeSummary]:
+        return await self.db.get(PracticeSummary, user_id)
 
     async def get_weekly_activity(self, user_id: int):
-        since = datetime.utcnow() - timedelta(days=6)
+        since = datetime.utcnow().date() - timedelta(days=6)
 
         result = await self.db.execute(
-            select(
-                func.date(PracticeAttempt.created_at),
-                func.sum(PracticeAttempt.duration_seconds)
-            )
+            select(PracticeDay.day, PracticeDay.seconds)
             .where(
-                PracticeAttempt.user_id == user_id,
-                PracticeAttempt.created_at >= since
+                PracticeDay.user_id == user_id,
+                PracticeDay.day >= since
             )
-            .group_by(func.date(PracticeAttempt.created_at))
-            .order_by(func.date(PracticeAttempt.created_at))
+            .order_by(PracticeDay.day)
         )
         return result.all()
+
+
+if __name__ == "__main__":
+    # python -m app.modules.stats.repository [user_id]
+    import asyncio
+    import sys
+
+    import app.main  # noqa: F401  (registers every model with the mapper)
+    from app.core.database import AsyncSessionLocal, engine, init_db
+
+    async def main():
+        await init_db()
+        async with AsyncSessionLocal() as db: # type: ignore
+            total = await StatsRepository(db).rebuild_rollup(int(sys.argv[1]) if len(sys.argv) > 1 else None)
+        await engine.dispose()
+        print(f"✅ Rebuilt practice rollup for {total} users")
+
+    asyncio.run(main())
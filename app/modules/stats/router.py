@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -6,7 +8,8 @@ from app.modules.auth.dependencies import get_current_user
 from app.modules.users.models import User
 from app.modules.stats.repository import StatsRepository
 from app.modules.stats.service import StatsService
-from app.modules.stats.schemas import DashboardOverview
+from app.modules.stats.leaderboard import board_key, get_my_rank, get_page
+from app.modules.stats.schemas import DashboardOverview, LeaderboardPage, LeaderboardRank, PracticeCreate, PracticeOut
 
 router = APIRouter(prefix="/stats", tags=["Stats"])
 
@@ -19,3 +22,40 @@ async def student_dashboard_stats(
     repo = StatsRepository(db)
     service = StatsService(repo)
     return await service.get_dashboard_overview(user.id) # type: ignore
+
+
+@router.post("/practice", response_model=PracticeOut)
+async def record_practice(
+    data: PracticeCreate,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    repo = StatsRepository(db)
+    attempt = await repo.record_attempt(user.id, data.duration_seconds, data.overall_score) # type: ignore
+    await db.commit()
+    return attempt
+
+
+@router.get("/leaderboard", response_model=LeaderboardPage)
+async def leaderboard(
+    period: Literal["week", "all"] = "week",
+    metric: Literal["minutes", "score"] = "minutes",
+    course_id: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=100),
+    after_position: Optional[int] = Query(None, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    page = await get_page(db, board_key(period, metric, course_id), limit, after_position)
+    return {"period": period, "metric": metric, "course_id": course_id, **page}
+
+
+@router.get("/leaderboard/me", response_model=LeaderboardRank)
+async def my_leaderboard_rank(
+    period: Literal["week", "all"] = "week",
+    metric: Literal["minutes", "score"] = "minutes",
+    course_id: Optional[int] = None,
+    user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    rank = await get_my_rank(db, board_key(period, metric, course_id), user.id) # type: ignore
+    return {"period": period, "metric": metric, "course_id": course_id, **rank}
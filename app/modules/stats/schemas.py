@@ -1,6 +1,6 @@
-from pydantic import BaseModel
-from typing import List
-from datetime import date
+from pydantic import BaseModel, Field
+from typing import Dict, List, Literal, Optional
+from datetime import date, datetime
 
 
 class WeeklyActivityItem(BaseModel):
@@ -10,7 +10,80 @@ class WeeklyActivityItem(BaseModel):
 
 class DashboardOverview(BaseModel):
     streak_days: int
+    longest_streak_days: int = 0
     total_minutes: int
     average_score: float
     weekly_minutes: int
     weekly_activity: List[WeeklyActivityItem]
+
+
+class PracticeCreate(BaseModel):
+    duration_seconds: int = Field(0, ge=0)
+    overall_score: float = 0.0
+
+
+class PracticeOut(BaseModel):
+    id: int
+    duration_seconds: int
+    overall_score: float
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class LeaderboardItem(BaseModel):
+    rank: int
+    user_id: int
+    full_name: Optional[str] = None
+    username: Optional[str] = None
+    value: float
+
+
+class LeaderboardPage(BaseModel):
+    period: Literal["week", "all"]
+    metric: Literal["minutes", "score"]
+    course_id: Optional[int] = None
+    total: int
+    computed_at: Optional[datetime] = None
+    items: List[LeaderboardItem]
+    next_after_position: Optional[int] = None
+
+
+class LeaderboardRank(BaseModel):
+    period: Literal["week", "all"]
+    metric: Literal["minutes", "score"]
+    course_id: Optional[int] = None
+    rank: Optional[int] = None
+    value: Optional[float] = None
+    total: int
+    computed_at: Optional[datetime] = None
+
+
+class HistogramBin(BaseModel):
+    start: float
+    end: float
+    count: int
+
+
+class WeeklyTrendItem(BaseModel):
+    week_start: date
+    count: int
+    mean: Optional[float] = None
+    moving_average: Optional[float] = None
+
+
+class ExamAnalytics(BaseModel):
+    source: Literal["listening", "reading", "mock"]
+    exam_id: Optional[str] = None
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    count: int
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    quantiles: Dict[str, Optional[float]]
+    histogram: List[HistogramBin]
+    cefr_levels: Dict[str, int]
+    weekly: List[WeeklyTrendItem]
@@ -1,4 +1,6 @@
-from datetime import date, timedelta
+from datetime import datetime, timedelta
+from typing import Optional
+from app.modules.stats.models import PracticeSummary
 from app.modules.stats.repository import StatsRepository
 from app.modules.stats.schemas import WeeklyActivityItem, DashboardOverview
 
@@ -8,31 +10,20 @@ class StatsService:
     def __init__(self, repo: StatsRepository):
         self.repo = repo
 
-    async def calculate_streak(self, user_id: int) -> int:
-        days = await self.repo.get_practice_days(user_id)
-        if not days:
+    @staticmethod
+    def current_streak(summary: Optional[PracticeSummary]) -> int:
+        # the stored streak ends on last_day; it is still alive only if that
+        # was today or yesterday
+        if summary is None or summary.last_day is None:
             return 0
+        today = datetime.utcnow().date()
+        return summary.current_streak if summary.last_day >= today - timedelta(days=1) else 0 # type: ignore
 
-        streak = 0
-        current_day = date.today()
-
-        for d in days:
-            if d == current_day:
-                streak += 1
-                current_day -= timedelta(days=1)
-            elif d == current_day - timedelta(days=1):
-                streak += 1
-                current_day = d - timedelta(days=1)
-            else:
-                break
-
-        return streak
+    async def calculate_streak(self, user_id: int) -> int:
+        return self.current_streak(await self.repo.get_summary(user_id))
 
     async def get_dashboard_overview(self, user_id: int) -> DashboardOverview:
-        total_seconds = await self.repo.get_total_seconds(user_id)
-        avg_score = await self.repo.get_average_score(user_id)
-        streak = await self.calculate_streak(user_id)
-
+        summary = await self.repo.get_summary(user_id)
         weekly_raw = await self.repo.get_weekly_activity(user_id)
 
         weekly_activity = [
@@ -46,9 +37,10 @@ class StatsService:
         weekly_minutes = sum(item.minutes for item in weekly_activity)
 
         return DashboardOverview(
-            streak_days=streak,
-            total_minutes=total_seconds // 60,
-            average_score=avg_score,
+            streak_days=self.current_streak(summary),
+            longest_streak_days=summary.longest_streak if summary else 0, # type: ignore
+            total_minutes=summary.total_seconds // 60 if summary else 0, # type: ignore
+            average_score=round(summary.score_sum / summary.attempts, 1) if summary and summary.attempts else 0.0, # type: ignore
             weekly_minutes=weekly_minutes,
             weekly_activity=weekly_activity
         )
@@ -9,6 +9,7 @@ from sqlalchemy import (
     Text,
     DateTime,
     BigInteger,
+    Index,
 )
 from sqlalchemy.orm import relationship
 
@@ -52,6 +53,10 @@ class User(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    __table_args__ = (
+        Index("ix_users_created_at", "created_at", "id"),
+    )
+
     # =========================
     # RELATIONSHIPS
     # =========================
@@ -1,19 +1,149 @@
 import sqlite3
 
-# DIQQAT: Bazangiz fayl nomini aniq yozing! 
+# DIQQAT: Bazangiz fayl nomini aniq yozing!
 # Odatda config.py yoki .env da yozilgan bo'ladi (masalan: "test.db", "app.db")
 DB_NAME = "enwis.db"  # <-- SHUNI O'ZGARTIRING
 
+# Mavjud jadvallarga qo'shiladigan ustun/indekslar.
+# Yangi jadvallarni `init_db` (create_all) o'zi yaratadi.
+MIGRATIONS = [
+    "ALTER TABLE reading_results ADD COLUMN standard_score FLOAT",
+    "CREATE INDEX IF NOT EXISTS ix_words_updated_at ON words (updated_at, id)",
+    # takroriy (user_id, word_id) qatorlar bo'lsa avval ularni o'chirish kerak
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_user_word ON user_words (user_id, word_id)",
+    "ALTER TABLE daily_vocab ADD COLUMN word_norm VARCHAR(100)",
+    "ALTER TABLE daily_vocab ADD COLUMN uz_norm VARCHAR(255)",
+    "CREATE INDEX IF NOT EXISTS ix_daily_vocab_word_norm ON daily_vocab (word_norm)",
+    "CREATE INDEX IF NOT EXISTS ix_daily_vocab_uz_norm ON daily_vocab (uz_norm)",
+    "ALTER TABLE tasks ADD COLUMN allow_multiple_attempts BOOLEAN DEFAULT 0",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_lesson_id ON tasks (lesson_id)",
+    "CREATE INDEX IF NOT EXISTS ix_task_items_task_id ON task_items (task_id)",
+    "CREATE INDEX IF NOT EXISTS ix_user_tasks_task_user ON user_tasks (task_id, user_id)",
+    "ALTER TABLE tasks ADD COLUMN version INTEGER NOT NULL DEFAULT 1",
+    # keyset pagination: (filter, sort key, id) so every page is an index range read
+    "CREATE INDEX IF NOT EXISTS ix_users_created_at ON users (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_payments_user_created ON payments (user_id, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_user_words_user_next_review ON user_words (user_id, next_review_at)",
+    "CREATE INDEX IF NOT EXISTS ix_daily_vocab_created_at ON daily_vocab (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_listening_results_user_created ON listening_results (user_id, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_reading_results_user_created ON reading_results (user_id, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_mock_exam_results_user_created ON mock_exam_results (user_id, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_video_shadowing_attempts_user_created ON video_shadowing_attempts (user_id, created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_audio_writing_attempts_user_created ON audio_writing_attempts (user_id, created_at, id)",
+    "ALTER TABLE practice_attempts ADD COLUMN source VARCHAR(30)",
+]
+
+
+def backfill_daily_vocab(cursor):
+    """Qidiruv kalitlari bo'sh qolgan eski daily_vocab qatorlarini to'ldirish."""
+    from app.modules.education.daily_vocab.normalize import normalize_en, normalize_uz
+
+    rows = cursor.execute(
+        "SELECT id, word, uz_translation FROM daily_vocab WHERE word_norm IS NULL OR uz_norm IS NULL"
+    ).fetchall()
+    cursor.executemany(
+        "UPDATE daily_vocab SET word_norm = ?, uz_norm = ? WHERE id = ?",
+        [(normalize_en(word), normalize_uz(uz)[:255], id_) for id_, word, uz in rows],
+    )
+    return len(rows)
+
+
+def spread_lesson_order(cursor):
+    """
+    Eski 1, 2, 3 ... tartib raqamlarini 1024 oraliqli kalitlarga o'tkazish,
+    shunda darsni ko'chirish faqat bitta qatorni yangilaydi (lesson/service.py).
+    """
+    from app.modules.education.lesson.service import GAP
+
+    courses = [row[0] for row in cursor.execute(
+        'SELECT course_id FROM lessons GROUP BY course_id HAVING MIN("order") < ? OR COUNT("order") < COUNT(*)',
+        (GAP,),
+    )]
+    for course_id in courses:
+        ids = [row[0] for row in cursor.execute(
+            'SELECT id FROM lessons WHERE course_id = ? ORDER BY "order", id', (course_id,)
+        ).fetchall()]
+        # avval eng kichik kalitdan ham pastga, keyin yangi qiymatlarga:
+        # uq_course_lesson_order buzilmasin (manfiy kalitlar ham bo'lishi mumkin)
+        lowest = cursor.execute('SELECT MIN("order") FROM lessons WHERE course_id = ?', (course_id,)).fetchone()[0]
+        shift = min(lowest or 0, 0) - 1
+        cursor.execute('UPDATE lessons SET "order" = ? - id WHERE course_id = ?', (shift, course_id))
+        cursor.executemany(
+            'UPDATE lessons SET "order" = ? WHERE id = ?',
+            [((i + 1) * GAP, id_) for i, id_ in enumerate(ids)],
+        )
+    return len(courses)
+
+
+def rebuild_user_tasks(cursor):
+    """
+    uq_user_task (user_id, task_id) -> uq_user_task_attempt (+ attempt_number).
+    SQLite constraintni o'chira olmaydi, shuning uchun jadval qayta quriladi.
+    """
+    row = cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'user_tasks'").fetchone()
+    if row is None or "uq_user_task_attempt" in row[0]:
+        return False
+
+    cursor.executescript("""
+        BEGIN;
+        CREATE TABLE user_tasks_new (
+            id INTEGER NOT NULL,
+            user_id INTEGER NOT NULL,
+            task_id INTEGER NOT NULL,
+            score FLOAT,
+            is_completed BOOLEAN,
+            attempt_number INTEGER,
+            submitted_at DATETIME,
+            feedback TEXT,
+            PRIMARY KEY (id),
+            CONSTRAINT uq_user_task_attempt UNIQUE (user_id, task_id, attempt_number),
+            FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE,
+            FOREIGN KEY(task_id) REFERENCES tasks (id) ON DELETE CASCADE
+        );
+        INSERT INTO user_tasks_new
+            SELECT id, user_id, task_id, score, is_completed, COALESCE(attempt_number, 1), submitted_at, feedback
+            FROM user_tasks;
+        DROP TABLE user_tasks;
+        ALTER TABLE user_tasks_new RENAME TO user_tasks;
+        -- DROP TABLE indekslarni ham o'chiradi, gradebook uchun qayta yaratamiz
+        CREATE INDEX IF NOT EXISTS ix_user_tasks_task_user ON user_tasks (task_id, user_id);
+        COMMIT;
+    """)
+    return True
+
+
+conn = sqlite3.connect(DB_NAME)
 try:
-    conn = sqlite3.connect(DB_NAME)
     cursor = conn.cursor()
-    
-    # Yangi ustun qo'shish buyrug'i
-    cursor.execute("ALTER TABLE reading_results ADD COLUMN standard_score FLOAT")
-    
-    conn.commit()
-    print("✅ Muvaffaqiyatli! 'standard_score' ustuni qo'shildi.")
-except sqlite3.OperationalError as e:
-    print(f"⚠️ Xatolik yoki ustun allaqachon mavjud: {e}")
+
+    for sql in MIGRATIONS:
+        try:
+            cursor.execute(sql)
+            conn.commit()
+            print(f"✅ Muvaffaqiyatli: {sql}")
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ Xatolik yoki allaqachon mavjud: {e}")
+
+    try:
+        count = backfill_daily_vocab(cursor)
+        conn.commit()
+        print(f"✅ daily_vocab qidiruv kalitlari to'ldirildi: {count}")
+    except sqlite3.OperationalError as e:
+        print(f"⚠️ daily_vocab backfill: {e}")
+
+    try:
+        count = spread_lesson_order(cursor)
+        conn.commit()
+        print(f"✅ lessons.order oraliqli kalitlarga o'tkazildi: {count} kurs")
+    except sqlite3.OperationalError as e:
+        conn.rollback()
+        print(f"⚠️ lessons order: {e}")
+
+    try:
+        if rebuild_user_tasks(cursor):
+            print("✅ user_tasks: bir nechta urinish (attempt_number) yoqildi")
+    except sqlite3.OperationalError as e:
+        conn.rollback()
+        print(f"⚠️ user_tasks rebuild: {e}")
 finally:
-    conn.close() # type: ignore
\ No newline at end of file
+    conn.close()
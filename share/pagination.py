@@ -0,0 +1,173 @@
+"""
+Cursor (keyset) pagination shared by the list endpoints.
+
+A `Paginator` is declared once per endpoint with the columns it may be
+sorted and filtered by; anything outside those whitelists is a 400. Pages
+are fetched with `WHERE (sort_key, id) after cursor ORDER BY sort_key, id
+LIMIT n + 1`, so every page costs the same index range read no matter how
+deep it is. Cursors are opaque (url-safe base64 JSON of the sort name and
+the last row's key) and only valid for the sort they were issued with.
+
+The key is kept exactly as the database stores it (read and bound without
+type processing): SQLite compares DATETIME columns as text, and a value
+written by `server_default=func.now()` ('YYYY-MM-DD HH:MM:SS') never equals
+the same instant re-encoded by SQLAlchemy ('...SS.000000').
+
+    USERS = Paginator(User.id, sort={"created_at": User.created_at}, filters={"role": User.role})
+
+    @router.get("/users", response_model=Page[UserResponse])
+    async def list_users(role: str | None = None, page: PageParams = Depends(page_params), db=...):
+        return await USERS.page(db, select(User), page, role=role)
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Generic, List, Optional, TypeVar
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import and_, or_, type_coerce
+from sqlalchemy.types import NullType
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+
+@dataclass
+class PageParams:
+    limit: int = DEFAULT_LIMIT
+    cursor: Optional[str] = None
+    sort: Optional[str] = None
+
+
+def page_params(
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = None,
+    sort: Optional[str] = Query(None, description="field or -field (descending)"),
+) -> PageParams:
+    return PageParams(limit=limit, cursor=cursor, sort=sort)
+
+
+# =========================
+# CURSORS
+# =========================
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _raw(column):
+    """`column` with no Python-side type processing (the stored value as-is)."""
+    return type_coerce(column, NullType())
+
+
+def encode_cursor(sort: str, key: Any, id_: Any) -> str:
+    raw = json.dumps([sort, key, id_], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[Any, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, key, id_ = json.loads(raw)
+        if not isinstance(key, _SCALARS) or not isinstance(id_, _SCALARS):
+            raise ValueError
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if cursor_sort != sort:
+        raise HTTPException(status_code=400, detail="Cursor does not match the requested sort")
+    return key, id_
+
+
+# =========================
+# PAGINATOR
+# =========================
+class Paginator:
+
+    def __init__(
+        self,
+        tiebreak,
+        sort: Optional[dict[str, Any]] = None,
+        default: str = "-id",
+        filters: Optional[dict[str, Any]] = None,
+    ):
+        self.tiebreak = tiebreak
+        self.sort_fields = {"id": tiebreak, **(sort or {})}
+        self.default = default
+        self.filters = filters or {}
+
+    def _sort(self, sort: Optional[str]) -> tuple[str, Any, bool]:
+        sort = sort or self.default
+        name, desc = (sort[1:], True) if sort.startswith("-") else (sort, False)
+        column = self.sort_fields.get(name)
+        if column is None:
+            allowed = ", ".join(sorted(self.sort_fields))
+            raise HTTPException(status_code=400, detail=f"Unsupported sort '{name}', use one of: {allowed}")
+        return sort, column, desc
+
+    def _after(self, column, desc: bool, key: Any, id_: Any):
+        """Rows strictly after (key, id_) in `ORDER BY column, id` (SQLite: NULLs sort lowest)."""
+        id_after = self.tiebreak < id_ if desc else self.tiebreak > id_
+        if column is self.tiebreak:
+            return id_after
+        column = _raw(column)
+        if key is None:
+            # inside the NULL block: NULLs come last when descending, first when ascending
+            return and_(column.is_(None), id_after) if desc else or_(column.is_not(None), and_(column.is_(None), id_after))
+        beyond = column < key if desc else column > key
+        tail = [column.is_(None)] if desc else []
+        return or_(beyond, and_(column == key, id_after), *tail)
+
+    def filter(self, stmt, **values):
+        """Equality filters from the whitelist; None means not filtered."""
+        for name, value in values.items():
+            if value is None:
+                continue
+            column = self.filters.get(name)
+            if column is None:
+                raise HTTPException(status_code=400, detail=f"Unsupported filter '{name}'")
+            stmt = stmt.where(column == value)
+        return stmt
+
+    async def page(self, db: AsyncSession, stmt, params: PageParams, scalars: bool = True, **filters) -> dict:
+        """
+        Runs `stmt` (filtered, ordered and limited here) and returns a
+        Page-shaped dict: items are entities, or column rows as dicts when
+        `scalars` is False.
+        """
+        sort, column, desc = self._sort(params.sort)
+        stmt = self.filter(stmt, **filters)
+
+        if params.cursor:
+            key, id_ = decode_cursor(params.cursor, sort)
+            stmt = stmt.where(self._after(column, desc, key, id_))
+
+        order = [column.desc() if desc else column.asc()]
+        if column is not self.tiebreak:
+            order.append(self.tiebreak.desc() if desc else self.tiebreak.asc())
+
+        limit = min(params.limit, MAX_LIMIT)
+        # the raw sort key rides along as the last column, for the cursor
+        res = await db.execute(stmt.add_columns(_raw(column).label("_cursor_key")).order_by(*order).limit(limit + 1))
+        rows = res.all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if scalars:
+            items = [row[0] for row in rows]
+        else:
+            items = [{k: v for k, v in row._mapping.items() if k != "_cursor_key"} for row in rows]
+        next_cursor = None
+        if has_more:
+            last = items[-1]
+            last_id = getattr(last, self.tiebreak.key) if scalars else last[self.tiebreak.key]
+            next_cursor = encode_cursor(sort, rows[-1][-1], last_id)
+        return {"items": items, "next_cursor": next_cursor, "has_more": has_more}
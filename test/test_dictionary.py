@@ -0,0 +1,177 @@
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.main  # noqa: F401  (registers every model with the mapper)
+from app.core.http import close_http_client
+from app.modules.education.words import dictionary
+from app.modules.education.words.models import DictionaryCacheEntry
+
+ENTRIES = [{
+    "word": "hello",
+    "phonetic": "/həˈloʊ/",
+    "meanings": [{"partOfSpeech": "noun", "definitions": [{"definition": "A greeting."}]}],
+}]
+
+
+class StubDictionary(BaseHTTPRequestHandler):
+    """
+    Stand-in for dictionaryapi.dev, keyed by the looked-up word:
+    hello -> found (slowly, so concurrent lookups overlap), nowhere -> 404,
+    flaky -> 503 once, slow -> stalls once, broken -> always 500.
+    """
+    calls: Counter = Counter()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        word = self.path.rsplit("/", 1)[-1]
+        with self.lock:
+            self.calls[word] += 1
+            n = self.calls[word]
+
+        if word == "nowhere":
+            return self._send(404, {"title": "No Definitions Found"})
+        if word == "broken" or (word == "flaky" and n == 1):
+            return self._send(503, {"title": "Unavailable"})
+        if word == "slow" and n == 1:
+            time.sleep(1.0)
+        if word == "hello":
+            time.sleep(0.2)
+        self._send(200, ENTRIES)
+
+    def _send(self, status: int, body):
+        raw = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubDictionary)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/api/v2/entries/en"
+    server.shutdown()
+
+
+@pytest.fixture
+async def session_factory(tmp_path, stub_url, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/dictionary.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(DictionaryCacheEntry.__table__.create)
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    StubDictionary.calls.clear()
+    dictionary._memory.clear()
+    monkeypatch.setattr(dictionary, "AsyncSessionLocal", factory)
+    monkeypatch.setattr(dictionary, "offline_dictionary", {})
+    monkeypatch.setattr(dictionary, "DICT_URL", stub_url)
+    monkeypatch.setattr(dictionary, "UPSTREAM_TIMEOUT", httpx.Timeout(0.5))
+    monkeypatch.setattr(dictionary, "RETRY_BACKOFF", 0.01)
+
+    yield factory
+
+    await close_http_client()
+    await engine.dispose()
+
+
+async def _stored(factory, word: str):
+    async with factory() as db:
+        return await db.get(DictionaryCacheEntry, word)
+
+
+@pytest.mark.anyio
+async def test_second_lookup_is_a_cache_hit(session_factory):
+    assert await dictionary.lookup_entries("Hello") == ENTRIES
+    assert await dictionary.lookup_entries(" hello ") == ENTRIES
+    assert StubDictionary.calls["hello"] == 1
+
+    # a fresh process (empty memory tier) is served from the table
+    dictionary._memory.clear()
+    assert await dictionary.lookup_entries("hello") == ENTRIES
+    assert StubDictionary.calls["hello"] == 1
+
+
+@pytest.mark.anyio
+async def test_concurrent_misses_share_one_upstream_call(session_factory):
+    results = await asyncio.gather(*(dictionary.lookup_entries("hello") for _ in range(5)))
+
+    assert results == [ENTRIES] * 5
+    assert StubDictionary.calls["hello"] == 1
+    assert dictionary._inflight == {}
+
+
+@pytest.mark.anyio
+async def test_found_entry_is_persisted(session_factory):
+    await dictionary.lookup_entries("hello")
+
+    entry = await _stored(session_factory, "hello")
+    assert entry.found is True
+    assert entry.payload == ENTRIES
+    assert entry.expires_at - entry.fetched_at == dictionary.FOUND_TTL
+
+
+@pytest.mark.anyio
+async def test_not_found_is_cached_negatively(session_factory):
+    assert await dictionary.lookup_entries("nowhere") is None
+    dictionary._memory.clear()
+    assert await dictionary.lookup_entries("nowhere") is None
+    assert StubDictionary.calls["nowhere"] == 1
+
+    entry = await _stored(session_factory, "nowhere")
+    assert entry.found is False
+    assert entry.payload is None
+    assert entry.expires_at - entry.fetched_at == dictionary.NOT_FOUND_TTL
+
+
+@pytest.mark.anyio
+async def test_expired_entry_is_fetched_again(session_factory):
+    await dictionary.lookup_entries("hello")
+    async with session_factory() as db:
+        entry = await db.get(DictionaryCacheEntry, "hello")
+        entry.expires_at = datetime.utcnow() - timedelta(seconds=1)
+        await db.commit()
+    dictionary._memory.clear()
+
+    assert await dictionary.lookup_entries("hello") == ENTRIES
+    assert StubDictionary.calls["hello"] == 2
+
+
+@pytest.mark.anyio
+async def test_server_error_is_retried(session_factory):
+    assert await dictionary.lookup_entries("flaky") == ENTRIES
+    assert StubDictionary.calls["flaky"] == 2
+
+
+@pytest.mark.anyio
+async def test_timeout_is_retried(session_factory):
+    assert await dictionary.lookup_entries("slow") == ENTRIES
+    assert StubDictionary.calls["slow"] == 2
+
+
+@pytest.mark.anyio
+async def test_upstream_failure_is_raised_and_not_cached(session_factory):
+    with pytest.raises(httpx.HTTPStatusError):
+        await dictionary.lookup_entries("broken")
+    assert StubDictionary.calls["broken"] == dictionary.UPSTREAM_ATTEMPTS
+    assert await _stored(session_factory, "broken") is None
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await dictionary.lookup_entries("broken")
+    assert StubDictionary.calls["broken"] == 2 * dictionary.UPSTREAM_ATTEMPTS
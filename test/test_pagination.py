@@ -0,0 +1,61 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+from share.pagination import PageParams, Paginator
+
+Base = declarative_base()
+
+
+class Row(Base):
+    __tablename__ = "rows"
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+
+ROWS_PAGE = Paginator(Row.id, sort={"created_at": Row.created_at})
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        # the format server_default=func.now() writes, with ties
+        for _ in range(3):
+            await conn.execute(text("INSERT INTO rows (created_at) VALUES ('2024-05-01 10:00:00')"))
+        await conn.execute(text("INSERT INTO rows (created_at) VALUES ('2024-05-01 09:00:00')"))
+        await conn.execute(text("INSERT INTO rows (created_at) VALUES (NULL)"))
+        # and the format SQLAlchemy writes for Python datetimes
+        await conn.execute(insert(Row), [{"created_at": datetime(2024, 5, 1, 10, 0, 0, 500)}] * 2)
+        await conn.execute(text("INSERT INTO rows (created_at) VALUES ('2024-05-01 10:00:00')"))
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+async def _walk(db, sort, limit=2):
+    ids, cursor = [], None
+    for _ in range(50):
+        page = await ROWS_PAGE.page(db, select(Row), PageParams(limit=limit, cursor=cursor, sort=sort))
+        ids += [row.id for row in page["items"]]
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            return ids
+    pytest.fail(f"paging with sort={sort} did not terminate: {ids}")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("sort", ["created_at", "-created_at", "id", "-id"])
+async def test_pages_cover_tied_timestamps_once(db, sort):
+    column = Row.created_at if sort.lstrip("-") == "created_at" else Row.id
+    desc = sort.startswith("-")
+    order = [column.desc(), Row.id.desc()] if desc else [column.asc(), Row.id.asc()]
+    expected = list((await db.execute(select(Row.id).order_by(*order))).scalars())
+
+    for limit in (1, 2, 3):
+        assert await _walk(db, sort, limit) == expected